@@ -9,6 +9,7 @@ from typing import Tuple
 DEFAULT_SCREEN_WIDTH = 1366
 DEFAULT_SCREEN_HEIGHT = 768
 FPS = 60
+MAX_FRAME_DT = 0.1  # Overworld dt cap; movement sub-steps, so long frames are safe
 
 # Tile Settings
 TILE_SIZE = 34
@@ -21,6 +22,8 @@ GAME_HEIGHT = 270
 
 # Animation Constants
 ANIMATION_SPEED = 0.15
+WALK_FRAME_DURATION = 1.0 / (ANIMATION_SPEED * FPS)  # Seconds per walk frame
+PLAYER_MIRROR_WEST = False  # Mirror east instead of using the authored west sprites
 PARTICLE_SPAWN_INTERVAL = 0.1
 PARTICLE_MAX_COUNT = 75
 
@@ -119,6 +122,7 @@ class Audio:
 BATTLE_TRANSITION_SPEED = 1.5
 BATTLE_TEXT_SPEED = 50  # Characters per second
 BATTLE_MOVE_ANIMATION_DURATION = 1.0
+BATTLE_AI_DIFFICULTY = 'normal'  # 'easy', 'normal' or 'hard' (see core.battle_ai)
 
 # Veteran System Constants
 MAX_BATTLE_LOG_SIZE = 200
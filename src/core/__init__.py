@@ -1,29 +1,36 @@
 """
 Core game systems for Pokemon Faiths
 Contains essential game components and utilities
+
+Submodules are imported lazily on first attribute access, so importing one
+core module (e.g. core.logger) does not pull in pygame-heavy systems.
 """
 
-from .asset_manager import get_asset_manager
-from .save_manager import get_save_manager
-from .logger import get_logger, init_logger
-from .entities import Player, Camera, GameObject
-from .game_debugger import GameDebugger
-from .audio_manager import get_audio_manager
-from .pause_menu import PauseMenu
-from .color_filters import ColorFilter, get_color_filter, apply_filter
+import importlib
+
+_LAZY_EXPORTS = {
+    'get_asset_manager': 'asset_manager',
+    'get_save_manager': 'save_manager',
+    'get_logger': 'logger',
+    'init_logger': 'logger',
+    'Player': 'entities',
+    'Camera': 'entities',
+    'GameObject': 'entities',
+    'GameDebugger': 'game_debugger',
+    'get_audio_manager': 'audio_manager',
+    'PauseMenu': 'pause_menu',
+    'ColorFilter': 'color_filters',
+    'get_color_filter': 'color_filters',
+    'apply_filter': 'color_filters'
+}
+
+__all__ = list(_LAZY_EXPORTS)
+
 
-__all__ = [
-    'get_asset_manager',
-    'get_save_manager', 
-    'get_logger',
-    'init_logger',
-    'Player',
-    'Camera',
-    'GameObject',
-    'GameDebugger',
-    'get_audio_manager',
-    'PauseMenu',
-    'ColorFilter',
-    'get_color_filter',
-    'apply_filter'
-]
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f'.{module_name}', __name__), name)
+    globals()[name] = value
+    return value
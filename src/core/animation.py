@@ -0,0 +1,157 @@
+"""
+Animation Clips for Pokemon Faiths
+Shared, immutable frame sequences played back against a common clock
+"""
+
+import bisect
+from typing import Dict, List, Optional, Sequence, Tuple
+import pygame
+from .asset_manager import get_asset_manager
+from .logger import get_logger
+
+logger = get_logger('Animation')
+
+MIRROR_X = ('flip', (True, False))
+
+
+class AnimationClip:
+    """
+    A sequence of frames with per-frame durations (seconds)
+
+    Clips hold no playback state, so any number of sprites can share one.
+    Frames come from AssetManager, so a mirrored clip reuses the cached
+    source images and only adds the flipped copies.
+    """
+
+    __slots__ = ('name', 'frame_paths', 'size', 'frames', 'durations', 'loop',
+                 'mirrored_x', '_ends', 'total_duration')
+
+    def __init__(self, name: str, frame_paths: Sequence[str], size: Optional[tuple],
+                 frame_durations: Sequence[float], loop: bool = True, mirrored_x: bool = False):
+        if len(frame_paths) != len(frame_durations):
+            raise ValueError(f"Clip {name}: {len(frame_paths)} frames but {len(frame_durations)} durations")
+        if not frame_paths:
+            raise ValueError(f"Clip {name} has no frames")
+
+        self.name = name
+        self.frame_paths = tuple(frame_paths)
+        self.size = size
+        self.durations = tuple(frame_durations)
+        self.loop = loop
+        self.mirrored_x = mirrored_x
+
+        asset_manager = get_asset_manager()
+        transforms = [MIRROR_X] if mirrored_x else None
+        self.frames: List[pygame.Surface] = [
+            asset_manager.load_image(path, size, transforms) for path in self.frame_paths
+        ]
+
+        # Cumulative end times for O(log n) frame lookup
+        self._ends = []
+        elapsed = 0.0
+        for duration in self.durations:
+            elapsed += duration
+            self._ends.append(elapsed)
+        self.total_duration = elapsed
+
+    def frame_index_at(self, elapsed: float) -> int:
+        """Frame index shown after `elapsed` seconds of playback"""
+        if self.total_duration <= 0:
+            return 0
+        if self.loop:
+            elapsed %= self.total_duration
+        elif elapsed >= self.total_duration:
+            return len(self.frames) - 1
+        return min(bisect.bisect_right(self._ends, elapsed), len(self.frames) - 1)
+
+    def frame_at(self, elapsed: float) -> pygame.Surface:
+        """Frame surface shown after `elapsed` seconds of playback"""
+        return self.frames[self.frame_index_at(elapsed)]
+
+    def mirrored(self, name: Optional[str] = None) -> 'AnimationClip':
+        """Horizontally mirrored copy of this clip (shared through the clip cache)"""
+        return load_clip(name or f"{self.name}_mirrored", self.frame_paths, self.size,
+                         self.durations, self.loop, not self.mirrored_x)
+
+
+class AnimationClock:
+    """Playback clock shared by every animated sprite"""
+
+    def __init__(self):
+        self.time = 0.0
+
+    def tick(self, dt: float):
+        """Advance the clock (call once per frame from the scene)"""
+        self.time += dt
+
+
+class AnimationPlayer:
+    """Per-sprite playback cursor: which clip, and when it started on the shared clock"""
+
+    __slots__ = ('clock', 'clip', 'start_time')
+
+    def __init__(self, clip: AnimationClip, clock: Optional[AnimationClock] = None):
+        self.clock = clock or get_animation_clock()
+        self.clip = clip
+        self.start_time = self.clock.time
+
+    def play(self, clip: AnimationClip, keep_time: bool = False):
+        """
+        Switch to a clip, restarting from frame 0 when it changes
+
+        keep_time continues from the current playback position instead,
+        e.g. when a walking sprite turns to face another direction.
+        """
+        if clip is not self.clip:
+            self.clip = clip
+            if not keep_time:
+                self.start_time = self.clock.time
+
+    @property
+    def elapsed(self) -> float:
+        return self.clock.time - self.start_time
+
+    @property
+    def frame_index(self) -> int:
+        return self.clip.frame_index_at(self.elapsed)
+
+    @property
+    def image(self) -> pygame.Surface:
+        return self.clip.frame_at(self.elapsed)
+
+
+# Clips are immutable, so identical definitions are shared process-wide
+_clip_cache: Dict[Tuple, AnimationClip] = {}
+_animation_clock = None
+
+
+def load_clip(name: str, frame_paths: Sequence[str], size: Optional[tuple],
+              frame_durations, loop: bool = True, mirrored_x: bool = False) -> AnimationClip:
+    """
+    Get a shared clip, creating it on first use
+
+    Args:
+        frame_durations: Seconds per frame, either one float for every frame or a sequence
+    """
+    if isinstance(frame_durations, (int, float)):
+        frame_durations = (float(frame_durations),) * len(frame_paths)
+    key = (tuple(frame_paths), tuple(size) if size else None, tuple(frame_durations), loop, mirrored_x)
+    clip = _clip_cache.get(key)
+    if clip is None:
+        clip = AnimationClip(name, frame_paths, size, frame_durations, loop, mirrored_x)
+        _clip_cache[key] = clip
+        logger.debug(f"Created animation clip: {name} ({len(frame_paths)} frames)")
+    return clip
+
+
+def get_animation_clock() -> AnimationClock:
+    """Get the global animation clock, creating it if needed"""
+    global _animation_clock
+    if _animation_clock is None:
+        _animation_clock = AnimationClock()
+    return _animation_clock
+
+
+def clear_clip_cache():
+    """Drop shared clips (e.g. after AssetManager.clear_images)"""
+    _clip_cache.clear()
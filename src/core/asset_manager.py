@@ -4,20 +4,120 @@ Handles loading and caching of images and sounds to improve performance
 """
 
 import pygame
+import json
 import os
 import sys
-from typing import Dict, Optional
+import time
+from datetime import datetime
+from typing import Dict, Optional, Sequence, Tuple
 from .logger import get_logger
+from .asset_pack import AssetPack, AssetPackError, ASSET_PACK_FILE
 
 logger = get_logger('AssetManager')
 
+# Transform operations understood by AssetManager.load_image
+# Each step is a tuple of (op_name, argument):
+#   ('scale', (w, h))          - exact size; a None side keeps the aspect ratio
+#   ('fit_width', w)           - scale to width, preserve aspect ratio
+#   ('fit_height', h)          - scale to height, preserve aspect ratio
+#   ('darken', factor)         - 0.0 (black) to 1.0 (original brightness)
+#   ('tint', (r, g, b))        - multiply RGB channels by a color
+#   ('flip', (flip_x, flip_y)) - mirror horizontally and/or vertically
+#   ('palette', ((src_rgb, dst_rgb), ...)) - replace exact colors
+TRANSFORM_OPS = ('scale', 'fit_width', 'fit_height', 'darken', 'tint', 'flip', 'palette')
+
+
+def normalize_transforms(scale_size: Optional[tuple] = None,
+                         transforms: Optional[Sequence] = None) -> Tuple[tuple, ...]:
+    """
+    Build a hashable transform chain from load_image arguments
+    
+    scale_size is shorthand for a leading ('scale', scale_size) step.
+    """
+    chain = []
+    if scale_size:
+        chain.append(('scale', tuple(scale_size)))
+    for step in transforms or ():
+        op, arg = step[0], step[1]
+        if op not in TRANSFORM_OPS:
+            raise ValueError(f"Unknown image transform: {op}")
+        if op == 'palette':
+            arg = tuple((tuple(src), tuple(dst)) for src, dst in arg)
+        elif isinstance(arg, list):
+            arg = tuple(arg)
+        chain.append((op, arg))
+    return tuple(chain)
+
+
+def _aspect_size(surface: pygame.Surface, width: Optional[int], height: Optional[int]) -> tuple:
+    """Resolve a target size where one side may be None (keep aspect ratio)"""
+    orig_w, orig_h = surface.get_size()
+    if width and not height:
+        return (width, max(1, int(width * orig_h / orig_w)))
+    if height and not width:
+        return (max(1, int(height * orig_w / orig_h)), height)
+    return (width or orig_w, height or orig_h)
+
+
+def _sound_bytes(sound: pygame.mixer.Sound) -> int:
+    """Approximate decoded size of a sound from the mixer format"""
+    mixer_format = pygame.mixer.get_init()
+    if not mixer_format:
+        return 0
+    frequency, size, channels = mixer_format
+    return int(sound.get_length() * frequency * channels * abs(size) // 8)
+
+
+def apply_transform(surface: pygame.Surface, step: tuple) -> pygame.Surface:
+    """
+    Apply a single transform step, always returning a new surface
+    
+    Args:
+        surface: Source surface (never modified)
+        step: (op_name, argument) tuple, see TRANSFORM_OPS
+    """
+    op, arg = step
+    if op == 'scale':
+        return pygame.transform.scale(surface, _aspect_size(surface, arg[0], arg[1]))
+    if op == 'fit_width':
+        return pygame.transform.scale(surface, _aspect_size(surface, arg, None))
+    if op == 'fit_height':
+        return pygame.transform.scale(surface, _aspect_size(surface, None, arg))
+    if op == 'darken':
+        # Multiplying RGB is the same as blending black at (1 - factor) alpha,
+        # but leaves per-pixel alpha untouched
+        value = max(0, min(255, int(255 * arg)))
+        result = surface.copy()
+        result.fill((value, value, value), special_flags=pygame.BLEND_RGB_MULT)
+        return result
+    if op == 'tint':
+        result = surface.copy()
+        result.fill(arg[:3], special_flags=pygame.BLEND_RGB_MULT)
+        return result
+    if op == 'flip':
+        return pygame.transform.flip(surface, bool(arg[0]), bool(arg[1]))
+    if op == 'palette':
+        result = surface.copy()
+        pixels = pygame.PixelArray(result)
+        for src, dst in arg:
+            pixels.replace(src, dst)
+        pixels.close()
+        return result
+    raise ValueError(f"Unknown image transform: {op}")
+
+
 class AssetManager:
     """Centralized asset loading and caching system"""
     
     def __init__(self):
-        self.images: Dict[str, pygame.Surface] = {}
+        self.images: Dict[tuple, pygame.Surface] = {}  # (path, transform chain) -> surface
         self.sounds: Dict[str, pygame.mixer.Sound] = {}
         self.base_path = self._get_base_path()
+        self.pack = self._open_pack()
+        
+        # Per-asset load metrics, keyed by relative path
+        self.metrics: Dict[str, dict] = {}
+        self.current_scene = 'startup'
         
     def _get_base_path(self) -> str:
         """Get the correct base path for assets"""
@@ -32,55 +132,154 @@ class AssetManager:
             project_root = os.path.dirname(src_dir)  # project root
             return project_root
     
-    def load_image(self, relative_path: str, scale_size: Optional[tuple] = None) -> pygame.Surface:
+    def _open_pack(self) -> Optional[AssetPack]:
+        """Open the asset pack if one was built, otherwise use loose files"""
+        pack_path = os.path.join(self.base_path, ASSET_PACK_FILE)
+        if not os.path.exists(pack_path):
+            return None
+        try:
+            pack = AssetPack(pack_path)
+            logger.info(f"Using asset pack: {pack_path} ({len(pack)} files)")
+            return pack
+        except (OSError, AssetPackError) as e:
+            logger.warning(f"Ignoring asset pack {pack_path}: {e}")
+            return None
+    
+    def set_scene(self, scene_name: str):
+        """Attribute subsequent asset requests to a scene (for metrics)"""
+        self.current_scene = scene_name
+    
+    def _get_metrics(self, relative_path: str, kind: str) -> dict:
+        """Get or create the metrics record for an asset"""
+        record = self.metrics.get(relative_path)
+        if record is None:
+            record = {
+                'type': kind,
+                'decode_ms': 0.0,
+                'transform_ms': 0.0,
+                'bytes': 0,
+                'hits': 0,
+                'misses': 0,
+                'scenes': []
+            }
+            self.metrics[relative_path] = record
+        if self.current_scene not in record['scenes']:
+            record['scenes'].append(self.current_scene)
+        return record
+    
+    def load_image(self, relative_path: str, scale_size: Optional[tuple] = None,
+                   transforms: Optional[Sequence] = None) -> pygame.Surface:
         """
-        Load and cache an image with optional scaling
+        Load and cache an image with optional scaling and transforms
+        
+        Derived surfaces are memoized by the full transform chain, so every
+        scene asking for the same (path, chain) shares one surface. Treat
+        returned surfaces as read-only.
         
         Args:
             relative_path: Path relative to project root - should always start with 'assets/'
-            scale_size: Optional (width, height) tuple for scaling
+            scale_size: Optional (width, height) tuple for scaling, either side may be None
+            transforms: Optional sequence of transform steps applied after scaling,
+                        e.g. [('darken', 0.7)] or [('fit_width', 50), ('flip', (True, False))]
         """
         # Normalize path - ensure it starts with 'assets/'
         if not relative_path.startswith('assets/'):
             relative_path = f'assets/{relative_path}'
         
-        # Create cache key including scale size
-        cache_key = f"{relative_path}_{scale_size}" if scale_size else relative_path
+        chain = normalize_transforms(scale_size, transforms)
+        cache_key = (relative_path, chain)
+        
+        record = self._get_metrics(relative_path, 'image')
         
         # Return cached version if available
         if cache_key in self.images:
+            record['hits'] += 1
             return self.images[cache_key]
+        record['misses'] += 1
+        
+        # Find the longest already-computed prefix of the chain and continue from it
+        prefix_len = len(chain) - 1
+        while prefix_len >= 0 and (relative_path, chain[:prefix_len]) not in self.images:
+            prefix_len -= 1
+        
+        if prefix_len < 0:
+            start = time.perf_counter()
+            surface = self._load_base_image(relative_path)
+            record['decode_ms'] += (time.perf_counter() - start) * 1000
+            if surface is None:
+                # Placeholders are never transformed
+                surface = self._create_placeholder()
+                self.images[cache_key] = surface
+                return surface
+            # The full-size decode is only kept when asked for directly
+            prefix_len = 0
+        else:
+            surface = self.images[(relative_path, chain[:prefix_len])]
+        
+        # Apply remaining steps, caching each intermediate result
+        start = time.perf_counter()
+        for i in range(prefix_len, len(chain)):
+            surface = apply_transform(surface, chain[i])
+            self.images[(relative_path, chain[:i + 1])] = surface
+            record['bytes'] += surface.get_width() * surface.get_height() * surface.get_bytesize()
+        record['transform_ms'] += (time.perf_counter() - start) * 1000
+        if not chain:
+            record['bytes'] += surface.get_width() * surface.get_height() * surface.get_bytesize()
+        self.images[cache_key] = surface
+        
+        logger.debug(f"Loaded and cached image: {relative_path} {list(chain) if chain else ''}")
+        return surface
+    
+    def _load_base_image(self, relative_path: str) -> Optional[pygame.Surface]:
+        """Decode an untransformed image from the pack or disk, None if unavailable"""
+        if self.pack and relative_path in self.pack:
+            try:
+                with self.pack.open_stream(relative_path) as stream:
+                    return pygame.image.load(stream, relative_path).convert_alpha()
+            except pygame.error as e:
+                logger.error(f"Error loading packed image {relative_path}: {e}")
+                return None
         
-        # Load the image
         full_path = os.path.join(self.base_path, relative_path)
         
         try:
             if not os.path.exists(full_path):
                 logger.warning(f"Asset not found: {full_path}")
-                # Return a placeholder surface
-                surface = pygame.Surface((32, 32))
-                surface.fill((255, 0, 255))  # Magenta placeholder
-                self.images[cache_key] = surface
-                return surface
-            
-            surface = pygame.image.load(full_path).convert_alpha()
-            
-            # Apply scaling if requested
-            if scale_size:
-                surface = pygame.transform.scale(surface, scale_size)
-            
-            # Cache and return
-            self.images[cache_key] = surface
-            logger.debug(f"Loaded and cached image: {relative_path}")
-            return surface
-            
+                return None
+            return pygame.image.load(full_path).convert_alpha()
         except pygame.error as e:
             logger.error(f"Error loading image {full_path}: {e}")
-            # Return placeholder
-            surface = pygame.Surface((32, 32))
-            surface.fill((255, 0, 255))
-            self.images[cache_key] = surface
-            return surface
+            return None
+    
+    def _create_placeholder(self) -> pygame.Surface:
+        """Create a magenta placeholder surface for missing images"""
+        surface = pygame.Surface((32, 32))
+        surface.fill((255, 0, 255))  # Magenta placeholder
+        return surface
+    
+    def has_asset(self, relative_path: str) -> bool:
+        """Whether a file exists in the asset pack or on disk"""
+        if self.pack and relative_path in self.pack:
+            return True
+        return os.path.exists(os.path.join(self.base_path, relative_path))
+    
+    def load_bytes(self, relative_path: str) -> Optional[bytes]:
+        """
+        Read a raw data file (not cached), preferring the asset pack
+        
+        Returns:
+            File contents, or None if the file is missing
+        """
+        if self.pack and relative_path in self.pack:
+            return self.pack.get_view(relative_path).tobytes()
+        
+        full_path = os.path.join(self.base_path, relative_path)
+        try:
+            with open(full_path, 'rb') as f:
+                return f.read()
+        except OSError:
+            logger.warning(f"Data file not found: {full_path}")
+            return None
     
     def load_sound(self, relative_path: str) -> Optional[pygame.mixer.Sound]:
         """
@@ -92,9 +291,28 @@ class AssetManager:
         Returns:
             pygame.mixer.Sound or None if loading failed
         """
+        record = self._get_metrics(relative_path, 'sound')
+        
         # Return cached version if available
         if relative_path in self.sounds:
+            record['hits'] += 1
             return self.sounds[relative_path]
+        record['misses'] += 1
+        start = time.perf_counter()
+        
+        # Prefer the asset pack when it has the file
+        if self.pack and relative_path in self.pack:
+            try:
+                with self.pack.open_stream(relative_path) as stream:
+                    sound = pygame.mixer.Sound(file=stream)
+                record['decode_ms'] += (time.perf_counter() - start) * 1000
+                record['bytes'] += _sound_bytes(sound)
+                self.sounds[relative_path] = sound
+                logger.debug(f"Loaded and cached packed sound: {relative_path}")
+                return sound
+            except pygame.error as e:
+                logger.error(f"Error loading packed sound {relative_path}: {e}")
+                return None
         
         # Load the sound
         full_path = os.path.join(self.base_path, relative_path)
@@ -105,6 +323,8 @@ class AssetManager:
                 return None
             
             sound = pygame.mixer.Sound(full_path)
+            record['decode_ms'] += (time.perf_counter() - start) * 1000
+            record['bytes'] += _sound_bytes(sound)
             self.sounds[relative_path] = sound
             logger.debug(f"Loaded and cached sound: {relative_path}")
             return sound
@@ -118,7 +338,7 @@ class AssetManager:
         Preload a list of assets for better performance
         
         Args:
-            asset_list: List of tuples (type, path, optional_scale)
+            asset_list: List of tuples (type, path, optional_scale, optional_transforms)
                        e.g., [('image', 'wood tiles/bed.png', (50, 30)), ('sound', 'audio/sfx/click.wav')]
         """
         logger.info(f"Preloading {len(asset_list)} assets...")
@@ -128,20 +348,62 @@ class AssetManager:
             
             if asset_type == 'image':
                 scale = asset_info[2] if len(asset_info) > 2 else None
-                self.load_image(path, scale)
+                transforms = asset_info[3] if len(asset_info) > 3 else None
+                self.load_image(path, scale, transforms)
             elif asset_type == 'sound':
                 self.load_sound(path)
         
         logger.info(f"Preloading complete: {len(asset_list)} assets loaded")
     
     def get_cache_info(self) -> dict:
-        """Get information about cached assets"""
+        """Get information about cached assets and per-asset load metrics"""
+        hits = sum(record['hits'] for record in self.metrics.values())
+        misses = sum(record['misses'] for record in self.metrics.values())
+        requests = hits + misses
         return {
             'images_cached': len(self.images),
             'sounds_cached': len(self.sounds),
-            'total_assets': len(self.images) + len(self.sounds)
+            'total_assets': len(self.images) + len(self.sounds),
+            'cache_hits': hits,
+            'cache_misses': misses,
+            'hit_rate': hits / requests if requests else 0.0,
+            'decode_ms': sum(record['decode_ms'] for record in self.metrics.values()),
+            'transform_ms': sum(record['transform_ms'] for record in self.metrics.values()),
+            'bytes': sum(record['bytes'] for record in self.metrics.values()),
+            'assets': self.metrics
         }
     
+    def dump_metrics(self, output_path: Optional[str] = None) -> Optional[str]:
+        """
+        Write get_cache_info() to a JSON file, slowest assets first
+        
+        Args:
+            output_path: Defaults to logs/asset_metrics_<timestamp>.json
+            
+        Returns:
+            Path written, or None on failure
+        """
+        if output_path is None:
+            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+            output_path = os.path.join('logs', f'asset_metrics_{timestamp}.json')
+        
+        info = self.get_cache_info()
+        info['assets'] = dict(sorted(
+            self.metrics.items(),
+            key=lambda item: item[1]['decode_ms'] + item[1]['transform_ms'],
+            reverse=True
+        ))
+        
+        try:
+            os.makedirs(os.path.dirname(output_path) or '.', exist_ok=True)
+            with open(output_path, 'w') as f:
+                json.dump(info, f, indent=2)
+            logger.info(f"Asset metrics written to {output_path}")
+            return output_path
+        except OSError as e:
+            logger.error(f"Failed to write asset metrics: {e}")
+            return None
+    
     def clear_cache(self):
         """Clear all cached assets to free memory"""
         self.images.clear()
@@ -0,0 +1,188 @@
+"""
+Asset Pack for Pokemon Faiths
+Single-file, memory-mapped asset archive used instead of loose files
+
+Pack layout (little-endian):
+    header:  magic b'PFPK' | version u16 | entry_count u32
+    index:   entry_count x (path_len u16 | path utf-8 | offset u64 | size u64)
+    data:    raw file bytes at the recorded offsets
+
+Build a pack from the project root with:
+    python src/core/asset_pack.py [output_path]
+"""
+
+import io
+import mmap
+import os
+import struct
+from typing import Dict, Optional, Tuple
+
+PACK_MAGIC = b'PFPK'
+PACK_VERSION = 1
+ASSET_PACK_FILE = 'assets.pak'
+
+_HEADER = struct.Struct('<4sHI')
+_PATH_LEN = struct.Struct('<H')
+_ENTRY = struct.Struct('<QQ')
+
+
+class AssetPackError(Exception):
+    """Raised when a pack file is missing or malformed"""
+
+
+class PackReader(io.RawIOBase):
+    """
+    Read-only stream over a memoryview slice of the pack
+
+    Only readinto() is implemented, so decoders copy straight from the
+    mapped file into their own buffers without an intermediate bytes object.
+    """
+
+    def __init__(self, view: memoryview):
+        super().__init__()
+        self._view = view
+        self._pos = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._pos
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            pos = offset
+        elif whence == io.SEEK_CUR:
+            pos = self._pos + offset
+        else:
+            pos = len(self._view) + offset
+        self._pos = max(0, min(pos, len(self._view)))
+        return self._pos
+
+    def readinto(self, buffer) -> int:
+        count = min(len(buffer), len(self._view) - self._pos)
+        if count <= 0:
+            return 0
+        buffer[:count] = self._view[self._pos:self._pos + count]
+        self._pos += count
+        return count
+
+    def close(self):
+        self._view.release()
+        self._view = memoryview(b'')
+        super().close()
+
+
+class AssetPack:
+    """Memory-mapped view over a packed asset file"""
+
+    def __init__(self, pack_path: str):
+        self.pack_path = pack_path
+        self._file = open(pack_path, 'rb')
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError as e:
+            # mmap refuses empty files
+            self._file.close()
+            raise AssetPackError(f"Empty asset pack: {pack_path}") from e
+        self._view = memoryview(self._mmap)
+        self.index: Dict[str, Tuple[int, int]] = self._read_index()
+
+    def _read_index(self) -> Dict[str, Tuple[int, int]]:
+        """Parse the pack header and index into path -> (offset, size)"""
+        if len(self._view) < _HEADER.size:
+            raise AssetPackError(f"Truncated asset pack: {self.pack_path}")
+
+        magic, version, count = _HEADER.unpack_from(self._view, 0)
+        if magic != PACK_MAGIC or version != PACK_VERSION:
+            raise AssetPackError(f"Unsupported asset pack: {self.pack_path}")
+
+        index = {}
+        pos = _HEADER.size
+        for _ in range(count):
+            (path_len,) = _PATH_LEN.unpack_from(self._view, pos)
+            pos += _PATH_LEN.size
+            path = bytes(self._view[pos:pos + path_len]).decode('utf-8')
+            pos += path_len
+            offset, size = _ENTRY.unpack_from(self._view, pos)
+            pos += _ENTRY.size
+            index[path] = (offset, size)
+        return index
+
+    def __contains__(self, relative_path: str) -> bool:
+        return relative_path in self.index
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def get_view(self, relative_path: str) -> Optional[memoryview]:
+        """Zero-copy view of a packed file, None if not packed"""
+        entry = self.index.get(relative_path)
+        if entry is None:
+            return None
+        offset, size = entry
+        return self._view[offset:offset + size]
+
+    def open_stream(self, relative_path: str) -> Optional[PackReader]:
+        """File-like reader for a packed file, None if not packed"""
+        view = self.get_view(relative_path)
+        return PackReader(view) if view is not None else None
+
+    def close(self):
+        """Release the mapping (views handed out must be released first)"""
+        self.index = {}
+        self._view.release()
+        self._mmap.close()
+        self._file.close()
+
+
+def build_asset_pack(project_root: str, output_path: str, source_dir: str = 'assets') -> int:
+    """
+    Pack every file under project_root/source_dir into a single pack file
+
+    Paths are stored relative to project_root with forward slashes,
+    matching the keys AssetManager uses (e.g. 'assets/images/rug_tile.png').
+
+    Returns:
+        Number of packed files
+    """
+    files = []
+    for dirpath, _, filenames in os.walk(os.path.join(project_root, source_dir)):
+        for filename in sorted(filenames):
+            full_path = os.path.join(dirpath, filename)
+            relative_path = os.path.relpath(full_path, project_root).replace(os.sep, '/')
+            files.append((relative_path, full_path))
+    files.sort()
+
+    encoded = [(rel.encode('utf-8'), full) for rel, full in files]
+    index_size = sum(_PATH_LEN.size + len(rel) + _ENTRY.size for rel, _ in encoded)
+    data_offset = _HEADER.size + index_size
+
+    sizes = [os.path.getsize(full) for _, full in encoded]
+    offsets = []
+    for size in sizes:
+        offsets.append(data_offset)
+        data_offset += size
+
+    with open(output_path, 'wb') as out:
+        out.write(_HEADER.pack(PACK_MAGIC, PACK_VERSION, len(encoded)))
+        for (rel, _), offset, size in zip(encoded, offsets, sizes):
+            out.write(_PATH_LEN.pack(len(rel)))
+            out.write(rel)
+            out.write(_ENTRY.pack(offset, size))
+        for _, full in encoded:
+            with open(full, 'rb') as f:
+                out.write(f.read())
+
+    return len(encoded)
+
+
+if __name__ == '__main__':
+    import sys
+    root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    output = sys.argv[1] if len(sys.argv) > 1 else os.path.join(root, ASSET_PACK_FILE)
+    count = build_asset_pack(root, output)
+    print(f"Packed {count} assets into {output}")
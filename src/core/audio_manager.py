@@ -7,6 +7,7 @@ import pygame
 import os
 from typing import Dict, Optional
 from .logger import get_logger
+from .asset_manager import get_asset_manager
 
 logger = get_logger('AudioManager')
 
@@ -27,14 +28,13 @@ class AudioManager:
             logger.error(f"Failed to initialize audio: {e}")
     
     def load_sound(self, file_path: str) -> Optional[pygame.mixer.Sound]:
-        """Load a sound effect"""
-        try:
-            if file_path not in self.sounds:
-                self.sounds[file_path] = pygame.mixer.Sound(file_path)
-            return self.sounds[file_path]
-        except pygame.error as e:
-            logger.error(f"Failed to load sound {file_path}: {e}")
-            return None
+        """Load a sound effect (through AssetManager so the asset pack is used)"""
+        if file_path not in self.sounds:
+            sound = get_asset_manager().load_sound(file_path)
+            if sound is None:
+                return None
+            self.sounds[file_path] = sound
+        return self.sounds[file_path]
     
     def play_sfx(self, sound_name: str):
         """Play a sound effect"""
@@ -0,0 +1,204 @@
+"""
+Battle AI for Pokemon Faiths
+Expectiminimax move search over hit chance and damage variance
+
+The search works on a snapshot of the battle (HP and each move's
+outcomes), never on the live Pokemon, so it can run on a worker thread
+while the scene animates. Iterative deepening keeps the best move of the
+deepest completed search, and stops once the time budget is spent.
+
+Difficulty is search depth (plies) and time budget:
+    easy    1 ply, 5 ms     greedy: best expected damage this turn
+    normal  2 plies, 20 ms  accounts for the opponent's reply
+    hard    4 plies, 50 ms
+"""
+
+import threading
+import time
+from typing import Callable, List, Optional, Tuple
+from .battle_engine import ACTION_MOVE, ENEMY, PLAYER, Action, BattleEngine
+from .moves import DAMAGE_SCALE, DAMAGE_VARIANCE_MAX, DAMAGE_VARIANCE_MIN, get_move_database
+
+AI_DIFFICULTIES = {
+    'easy': (1, 5),
+    'normal': (2, 20),
+    'hard': (4, 50),
+}
+
+# Damage variance is uniform; three equally likely samples stand in for it
+VARIANCE_SAMPLES = (DAMAGE_VARIANCE_MIN, (DAMAGE_VARIANCE_MIN + DAMAGE_VARIANCE_MAX) / 2, DAMAGE_VARIANCE_MAX)
+
+WIN_SCORE = 1000.0
+
+Outcomes = Tuple[Tuple[float, float], ...]  # (probability, damage) per chance outcome
+
+
+class SearchTimeout(Exception):
+    """Raised inside the search when the time budget runs out"""
+
+
+class BattleSnapshot:
+    """The state the search needs, copied from the engine on the calling thread"""
+
+    __slots__ = ('hp', 'opponent_hp', 'moves', 'opponent_moves')
+
+    def __init__(self, engine: BattleEngine, side: str):
+        opponent = PLAYER if side == ENEMY else ENEMY
+        self.hp = engine.pokemon[side].current_hp_percent
+        self.opponent_hp = engine.pokemon[opponent].current_hp_percent
+        self.moves = move_outcomes(engine, side)
+        self.opponent_moves = move_outcomes(engine, opponent)
+
+
+def move_outcomes(engine: BattleEngine, side: str) -> List[Outcomes]:
+    """Chance outcomes of each of a side's moves (same formula as Move.execute, read from the move table)"""
+    attacker = engine.pokemon[side]
+    defender = engine.pokemon[PLAYER if side == ENEMY else ENEMY]
+    chart = engine.type_chart
+    defender_types = chart.get_species_types(defender.species)
+    ratio = attacker.base_attack / defender.base_defense
+    table = get_move_database().table
+
+    outcomes = []
+    for move in engine.moves[side]:
+        # Status moves have power 0 in the table
+        effectiveness = chart.effectiveness(table.type_id[move.id], defender_types)
+        full = table.power[move.id] * ratio * DAMAGE_SCALE * effectiveness
+        accuracy = min(1.0, table.accuracy[move.id])
+        hit = tuple((accuracy / len(VARIANCE_SAMPLES), full * variance) for variance in VARIANCE_SAMPLES)
+        outcomes.append(hit if accuracy >= 1.0 else ((1.0 - accuracy, 0.0),) + hit)
+    return outcomes
+
+
+class BattleAI:
+    """
+    Picks moves by expectiminimax with iterative deepening
+
+    Usable directly as a BattleEngine policy (ai.choose); for the battle
+    scene, wrap it in MoveSearch to think on a worker thread.
+    """
+
+    def __init__(self, max_depth: int = 2, time_budget_ms: float = 20):
+        self.max_depth = max(1, max_depth)
+        self.time_budget_ms = time_budget_ms
+
+    @classmethod
+    def from_difficulty(cls, difficulty: str) -> 'BattleAI':
+        if difficulty not in AI_DIFFICULTIES:
+            raise ValueError(f"Unknown AI difficulty: {difficulty}")
+        return cls(*AI_DIFFICULTIES[difficulty])
+
+    def choose(self, engine: BattleEngine, side: str) -> Action:
+        """Policy interface: search synchronously within the time budget"""
+        return ACTION_MOVE, self.search(BattleSnapshot(engine, side))[0]
+
+    def search(self, snapshot: BattleSnapshot,
+               on_depth: Optional[Callable[[int, int], None]] = None) -> Tuple[int, int]:
+        """
+        Best move index for the snapshot's side
+
+        Args:
+            on_depth: Called with (move index, depth) after each completed depth
+        Returns:
+            (move index, deepest completed depth)
+        """
+        deadline = time.perf_counter() + self.time_budget_ms / 1000.0
+        best, reached = 0, 0
+        for depth in range(1, self.max_depth + 1):
+            try:
+                # Depth 1 always completes so there is a move to return
+                best = self._root(snapshot, depth, deadline if depth > 1 else None)
+            except SearchTimeout:
+                break
+            reached = depth
+            if on_depth:
+                on_depth(best, depth)
+        return best, reached
+
+    def _root(self, snapshot: BattleSnapshot, depth: int, deadline: Optional[float]) -> int:
+        best_index, best_value = 0, None
+        for index, outcomes in enumerate(snapshot.moves):
+            value = 0.0
+            for probability, damage in outcomes:
+                value += probability * self._node(snapshot, snapshot.hp, snapshot.opponent_hp - damage,
+                                                  False, depth - 1, deadline)
+            if best_value is None or value > best_value:
+                best_index, best_value = index, value
+        return best_index
+
+    def _node(self, snapshot: BattleSnapshot, hp: float, opponent_hp: float, our_turn: bool,
+              depth: int, deadline: Optional[float]) -> float:
+        """Expected score (our HP lead, or +/-WIN_SCORE for a KO) with `depth` plies left"""
+        if opponent_hp <= 0:
+            return WIN_SCORE + depth  # Sooner is better
+        if hp <= 0:
+            return -WIN_SCORE - depth
+        if depth == 0:
+            return hp - opponent_hp
+        if deadline is not None and time.perf_counter() > deadline:
+            raise SearchTimeout()
+
+        best = None
+        for outcomes in (snapshot.moves if our_turn else snapshot.opponent_moves):
+            value = 0.0
+            for probability, damage in outcomes:
+                if our_turn:
+                    value += probability * self._node(snapshot, hp, opponent_hp - damage, False, depth - 1, deadline)
+                else:
+                    value += probability * self._node(snapshot, hp - damage, opponent_hp, True, depth - 1, deadline)
+            if best is None or (value > best if our_turn else value < best):
+                best = value
+        return best if best is not None else hp - opponent_hp
+
+
+class MoveSearch:
+    """
+    Runs a BattleAI search on a worker thread
+
+    start() snapshots the battle on the calling thread and returns at once;
+    result() returns the best move found so far, waiting at most for the
+    rest of the time budget. The search is pure Python and short, and the
+    scene's loop sleeps in clock.tick(), so frames keep their pace.
+    """
+
+    def __init__(self, ai: BattleAI):
+        self.ai = ai
+        self._thread: Optional[threading.Thread] = None
+        self._best = 0
+        self._depth = 0
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def start(self, engine: BattleEngine, side: str):
+        snapshot = BattleSnapshot(engine, side)
+        with self._lock:
+            self._generation += 1
+            self._best, self._depth = 0, 0
+        self._thread = threading.Thread(target=self._run, args=(snapshot, self._generation),
+                                        name='BattleAI', daemon=True)
+        self._thread.start()
+
+    def _run(self, snapshot: BattleSnapshot, generation: int):
+        def record(index: int, depth: int):
+            with self._lock:
+                # A superseded search must not overwrite the new one's result
+                if generation == self._generation:
+                    self._best, self._depth = index, depth
+        self.ai.search(snapshot, record)
+
+    @property
+    def done(self) -> bool:
+        return self._thread is None or not self._thread.is_alive()
+
+    def result(self) -> Action:
+        """Best move so far (the search stops on its own at the time budget)"""
+        if self._thread is not None:
+            self._thread.join(self.ai.time_budget_ms / 1000.0 + 0.05)
+        with self._lock:
+            return ACTION_MOVE, self._best
+
+    @property
+    def depth(self) -> int:
+        """Deepest completed search for the current result"""
+        with self._lock:
+            return self._depth
@@ -0,0 +1,164 @@
+"""
+Battle Engine for Pokemon Faiths
+Headless turn resolution shared by the battle scene, simulations and tests
+
+The engine owns the rules only: who acts, in what order, and when the
+battle is over. It never touches pygame, so thousands of battles can run
+per second. BattleScene is a view that feeds it the player's choices and
+narrates the results it returns.
+"""
+
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+from .pokemon import Pokemon
+from .battle_events import BattleEvent, BattleEventLog
+from .moves import Move, TypeChart, get_move_database, get_type_chart
+from .rng import STREAM_BATTLE, get_rng, get_stream
+
+PLAYER = 'player'
+ENEMY = 'enemy'
+
+# Actions
+ACTION_MOVE = 'move'
+ACTION_RETREAT = 'retreat'
+
+# Outcomes (as stored in battle logs)
+OUTCOME_WIN = 'win'
+OUTCOME_RETREAT = 'retreat'
+OUTCOME_FAINT = 'faint'
+OUTCOME_KILLED = 'killed'
+
+Action = Tuple[str, int]
+Policy = Callable[['BattleEngine', str], Action]
+
+
+def random_policy(engine: 'BattleEngine', side: str) -> Action:
+    """Pick a random known move"""
+    return ACTION_MOVE, int(engine.rng.random() * len(engine.moves[side]))
+
+
+class BattleEngine:
+    """
+    One battle between two Pokemon
+
+    Step API:
+        choose_action(side, action)   queue ('move', index) or ('retreat', 0)
+        resolve_turn()                run the queued actions, returns the turn's log entries
+        outcome / is_over             query the result
+    """
+
+    def __init__(self, player_pokemon: Pokemon, enemy_pokemon: Pokemon,
+                 player_moves: Sequence[Move], enemy_moves: Sequence[Move],
+                 type_chart: Optional[TypeChart] = None, rng=None,
+                 enemy_policy: Policy = random_policy):
+        self.pokemon = {PLAYER: player_pokemon, ENEMY: enemy_pokemon}
+        self.moves = {PLAYER: list(player_moves), ENEMY: list(enemy_moves)}
+        self.type_chart = type_chart or get_type_chart()
+        self.rng = rng if rng is not None else get_stream(STREAM_BATTLE)
+        self.enemy_policy = enemy_policy
+
+        self.turn = 0
+        self.outcome: Optional[str] = None
+        self.log = BattleEventLog()  # One compact record per executed move
+        self._pending: Dict[str, Action] = {}
+
+    @property
+    def player_pokemon(self) -> Pokemon:
+        return self.pokemon[PLAYER]
+
+    @property
+    def enemy_pokemon(self) -> Pokemon:
+        return self.pokemon[ENEMY]
+
+    @property
+    def is_over(self) -> bool:
+        return self.outcome is not None
+
+    def choose_action(self, side: str, action: Action):
+        """Queue a side's action for the next resolve_turn()"""
+        kind, index = action
+        if kind not in (ACTION_MOVE, ACTION_RETREAT):
+            raise ValueError(f"Unknown battle action: {kind}")
+        if kind == ACTION_MOVE and not 0 <= index < len(self.moves[side]):
+            raise ValueError(f"{side} has no move at index {index}")
+        self._pending[side] = action
+
+    def resolve_turn(self) -> List[BattleEvent]:
+        """
+        Resolve one turn: the player acts first, then the enemy if it can still fight
+
+        The enemy's action comes from enemy_policy unless one was queued.
+        Returns:
+            Events for the moves executed this turn (narrate with log.narrate)
+        """
+        if self.is_over:
+            return []
+        player_action = self._pending.pop(PLAYER, None)
+        if player_action is None:
+            raise ValueError("No player action chosen for this turn")
+        enemy_action = self._pending.pop(ENEMY, None)
+
+        self.turn += 1
+        if player_action[0] == ACTION_RETREAT:
+            self.outcome = OUTCOME_RETREAT
+            return []
+
+        entries = [self._use_move(PLAYER, player_action[1])]
+        if self.enemy_pokemon.is_conscious and self.player_pokemon.is_conscious:
+            if enemy_action is None:
+                enemy_action = self.enemy_policy(self, ENEMY)
+            if enemy_action[0] == ACTION_MOVE:
+                entries.append(self._use_move(ENEMY, enemy_action[1]))
+        self._update_outcome()
+        return entries
+
+    def retreat(self):
+        """Player leaves the battle immediately"""
+        self.choose_action(PLAYER, (ACTION_RETREAT, 0))
+        self.resolve_turn()
+
+    def _use_move(self, side: str, index: int) -> BattleEvent:
+        move = self.moves[side][index]
+        target = ENEMY if side == PLAYER else PLAYER
+        result = move.execute(self.pokemon[side], self.pokemon[target], self.type_chart, self.rng)
+        return self.log.record(side, move, result)
+
+    def _update_outcome(self):
+        player = self.player_pokemon
+        if not player.is_conscious:
+            self.outcome = OUTCOME_FAINT if player.is_alive else OUTCOME_KILLED
+        elif not self.enemy_pokemon.is_conscious:
+            self.outcome = OUTCOME_WIN
+
+    def run(self, player_policy: Policy = random_policy, max_turns: int = 100) -> Optional[str]:
+        """Play the battle out with a policy for the player, returns the outcome (None if it hit max_turns)"""
+        while not self.is_over and self.turn < max_turns:
+            self.choose_action(PLAYER, player_policy(self, PLAYER))
+            self.resolve_turn()
+        return self.outcome
+
+    def battle_log_entry(self, environment: Optional[List[str]] = None) -> Dict:
+        """
+        Summary entry for the player's Pokemon battle history
+        Format from design doc Section 7
+        """
+        summary = self.log.summary()
+        move_db = get_move_database()
+        moves_used = [{'move': move_db.get_move_by_id(move_id).name, 'effective': effective}
+                      for move_id, effective in summary['player_moves']]
+
+        return {
+            'opponent_id': self.enemy_pokemon.species,
+            'opponent_veterancy': self.enemy_pokemon.get_effective_veteran_score() / 100,
+            'moves_used': moves_used,
+            'damage_taken': {
+                'amount': summary['damage_dealt'][ENEMY],
+                'type': 'mixed',  # TODO: Track specific types
+                'location': 'body'
+            },
+            'damage_dealt': summary['damage_dealt'][PLAYER],
+            'status_events': ['injury'] * summary['injuries_caused'][ENEMY],
+            'outcome': self.outcome,
+            'player_tactics': [],  # TODO: Analyze tactics from move choices
+            'environment': environment or ['training_grounds'],  # TODO: Pass environment
+            'rng_seed': get_rng().seed  # Master seed of the session the battle was fought in
+        }
@@ -0,0 +1,120 @@
+"""
+Battle Events for Pokemon Faiths
+Compact binary log of executed moves, one fixed-width record per action
+
+Record layout (little-endian, 10 bytes):
+    actor u8 | move id u8 | flags u8 | effectiveness u8 | injury u8 | variant u8 | damage f32
+
+effectiveness is stored in quarters (0.25 -> 1, 2.0 -> 8), injury is an
+index into INJURY_TYPES, and variant is the narrative description that
+was rolled, so narration can be rendered again on demand from a record.
+Battle hits always land on the body (see Move.execute).
+"""
+
+import struct
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple, Union
+from .moves import Move, get_move_database
+from .pokemon import describe_injury
+
+SIDES = ('player', 'enemy')  # battle_engine.PLAYER / ENEMY by actor code
+INJURY_TYPES = ('', 'deep_scar', 'burn_scar', 'lost_eye', 'broken_limb', 'lost_limb', 'emotional_trauma')
+INJURY_CODES = {name: code for code, name in enumerate(INJURY_TYPES)}
+INJURY_LOCATION = 'body'
+
+FLAG_HIT = 1
+FLAG_INJURY = 2
+
+_EVENT = struct.Struct('<BBBBBBf')
+
+
+class BattleEvent(NamedTuple):
+    """One decoded record"""
+    actor: str
+    move_id: int
+    hit: bool
+    effectiveness: float
+    damage: float
+    injury: Optional[str]
+    variant: int
+
+    @property
+    def move(self) -> Move:
+        return get_move_database().get_move_by_id(self.move_id)
+
+
+class BattleEventLog:
+    """Append-only event buffer (a bytearray of fixed-width records)"""
+
+    __slots__ = ('buffer',)
+
+    def __init__(self, data: bytes = b''):
+        if len(data) % _EVENT.size:
+            raise ValueError(f"Event data is not a whole number of {_EVENT.size}-byte records")
+        self.buffer = bytearray(data)
+
+    def __len__(self) -> int:
+        return len(self.buffer) // _EVENT.size
+
+    def __bool__(self) -> bool:
+        return bool(self.buffer)
+
+    def __iter__(self) -> Iterator[BattleEvent]:
+        return (self._decode(record) for record in _EVENT.iter_unpack(self.buffer))
+
+    def __getitem__(self, index: int) -> BattleEvent:
+        count = len(self)
+        if index < 0:
+            index += count
+        if not 0 <= index < count:
+            raise IndexError("battle event index out of range")
+        return self._decode(_EVENT.unpack_from(self.buffer, index * _EVENT.size))
+
+    @staticmethod
+    def _decode(record: Tuple) -> BattleEvent:
+        actor, move_id, flags, effectiveness, injury, variant, damage = record
+        return BattleEvent(SIDES[actor], move_id, bool(flags & FLAG_HIT), effectiveness / 4,
+                           damage, INJURY_TYPES[injury] if flags & FLAG_INJURY else None, variant)
+
+    def record(self, side: str, move: Move, result: Dict) -> BattleEvent:
+        """Append a Move.execute result, returns the decoded event"""
+        if move.id is None:
+            raise ValueError(f"Move {move.name} is not in the move database")
+        injury = result.get('injury_type')
+        flags = (FLAG_HIT if result['hit'] else 0) | (FLAG_INJURY if injury else 0)
+        record = (SIDES.index(side), move.id, flags, int(round(result['effectiveness'] * 4)),
+                  INJURY_CODES.get(injury, 0), result['variant'], result['damage'])
+        self.buffer += _EVENT.pack(*record)
+        return self[-1]  # Decoded from the buffer, so damage has the stored f32 precision
+
+    def narrate(self, event: BattleEvent) -> Tuple[str, Optional[str]]:
+        """(narrative, injury description or None) for an event"""
+        narrative = event.move.render_narrative(event.hit, event.variant, event.effectiveness)
+        injury = describe_injury(event.injury, INJURY_LOCATION) if event.injury else None
+        return narrative, injury
+
+    def summary(self) -> Dict:
+        """Per-side totals and the player's moves, in one pass over the buffer"""
+        damage = [0.0, 0.0]
+        injuries = [0, 0]
+        hits = [0, 0]
+        player_moves: List[Tuple[int, bool]] = []
+        for actor, move_id, flags, effectiveness, _, _, amount in _EVENT.iter_unpack(self.buffer):
+            damage[actor] += amount
+            hits[actor] += flags & FLAG_HIT
+            injuries[actor] += (flags & FLAG_INJURY) >> 1
+            if actor == 0:
+                player_moves.append((move_id, effectiveness >= 6))  # >= 1.5x
+        return {
+            'actions': len(self),
+            'damage_dealt': {SIDES[0]: damage[0], SIDES[1]: damage[1]},
+            'hits': {SIDES[0]: hits[0], SIDES[1]: hits[1]},
+            'injuries_caused': {SIDES[0]: injuries[0], SIDES[1]: injuries[1]},
+            'player_moves': player_moves
+        }
+
+    def to_bytes(self) -> bytes:
+        return bytes(self.buffer)
+
+    @classmethod
+    def from_bytes(cls, data: Union[bytes, bytearray, memoryview]) -> 'BattleEventLog':
+        return cls(bytes(data))
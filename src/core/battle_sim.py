@@ -0,0 +1,242 @@
+"""
+Battle Simulator for Pokemon Faiths
+Monte Carlo balancing runs of the headless battle engine across all cores
+
+Every matchup is split into chunks; each chunk runs in a worker process
+with its own RNG service spawned from (seed, chunk index) (see core.rng),
+so a run, injuries included, is reproducible no matter how chunks are
+scheduled. Per-matchup results are merged into win rates, turns to KO,
+injury and death frequencies.
+
+Workers are spawned rather than forked (a forked child would inherit the
+parent's pygame/SDL state) and this module imports nothing that pulls in
+pygame, so workers stay headless.
+
+Run (from the src/ directory):
+    python -m core.battle_sim --player Charmander --zone cave --battles 100000 \\
+        --csv sim.csv --json sim.json
+"""
+
+import argparse
+import csv
+import json
+import logging
+import multiprocessing
+import os
+import time
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+from .battle_engine import OUTCOME_FAINT, OUTCOME_KILLED, OUTCOME_WIN, BattleEngine
+from .moves import get_move_database, get_type_chart
+from .pokemon import Pokemon
+from .rng import STREAM_BATTLE, RNGService, set_rng
+
+DEFAULT_CHUNK_SIZE = 2000
+DEFAULT_MAX_TURNS = 100
+
+Matchup = Tuple[str, str]  # (player species, enemy species)
+
+
+class MatchupStats:
+    """Counters for one matchup, mergeable across workers"""
+
+    __slots__ = ('player', 'enemy', 'battles', 'wins', 'faints', 'deaths', 'timeouts',
+                 'ko_turns', 'player_injured', 'enemy_injured', 'enemy_deaths')
+
+    def __init__(self, player: str, enemy: str):
+        self.player = player
+        self.enemy = enemy
+        self.battles = 0
+        self.wins = 0
+        self.faints = 0
+        self.deaths = 0
+        self.timeouts = 0
+        self.ko_turns = 0          # Sum of turns over decided battles
+        self.player_injured = 0    # Battles where the player's Pokemon took a permanent injury
+        self.enemy_injured = 0
+        self.enemy_deaths = 0
+
+    def record(self, engine: BattleEngine):
+        self.battles += 1
+        outcome = engine.outcome
+        if outcome == OUTCOME_WIN:
+            self.wins += 1
+        elif outcome == OUTCOME_FAINT:
+            self.faints += 1
+        elif outcome == OUTCOME_KILLED:
+            self.deaths += 1
+        else:
+            self.timeouts += 1
+        if outcome is not None:
+            self.ko_turns += engine.turn
+        if engine.player_pokemon.permanent_injuries:
+            self.player_injured += 1
+        if engine.enemy_pokemon.permanent_injuries:
+            self.enemy_injured += 1
+        if not engine.enemy_pokemon.is_alive:
+            self.enemy_deaths += 1
+
+    def merge(self, other: 'MatchupStats'):
+        for field in self.__slots__[2:]:
+            setattr(self, field, getattr(self, field) + getattr(other, field))
+
+    def to_row(self) -> Dict:
+        battles = max(1, self.battles)
+        decided = max(1, self.battles - self.timeouts)
+        return {
+            'player': self.player,
+            'enemy': self.enemy,
+            'battles': self.battles,
+            'win_rate': self.wins / battles,
+            'faint_rate': self.faints / battles,
+            'death_rate': self.deaths / battles,
+            'timeout_rate': self.timeouts / battles,
+            'avg_turns_to_ko': self.ko_turns / decided,
+            'player_injury_rate': self.player_injured / battles,
+            'enemy_injury_rate': self.enemy_injured / battles,
+            'enemy_death_rate': self.enemy_deaths / battles
+        }
+
+
+def _init_worker(log_level: int):
+    # Per-battle faint/injury logging would dominate the run time
+    logging.getLogger('PokemonFaiths').setLevel(log_level)
+
+
+def simulate_chunk(task: Tuple[Matchup, int, int, int, Optional[Sequence[str]], Optional[Sequence[str]], int]
+                   ) -> MatchupStats:
+    """Run one chunk of battles for a matchup (executed in a worker process)"""
+    (player_species, enemy_species), count, seed, chunk_index, player_moves, enemy_moves, max_turns = task
+    # Injury rolls use the global service, so it is swapped for the chunk's own
+    service = RNGService(seed).spawn(chunk_index)
+    previous = set_rng(service)
+    rng = service.stream(STREAM_BATTLE)
+    type_chart = get_type_chart()
+
+    stats = MatchupStats(player_species, enemy_species)
+    try:
+        for _ in range(count):
+            # Same as the battle scene: each Pokemon's learned moveset (species default unless given)
+            player = Pokemon(player_species, moves=player_moves)
+            enemy = Pokemon(enemy_species, moves=enemy_moves)
+            engine = BattleEngine(player, enemy, player.get_moves(), enemy.get_moves(), type_chart, rng)
+            engine.run(max_turns=max_turns)
+            stats.record(engine)
+    finally:
+        set_rng(previous)
+    return stats
+
+
+def _tasks(matchups: Iterable[Matchup], battles: int, seed: int, chunk_size: int,
+           player_moves, enemy_moves, max_turns: int) -> List[Tuple]:
+    tasks = []
+    chunk_index = 0
+    for matchup in matchups:
+        remaining = battles
+        while remaining > 0:
+            count = min(chunk_size, remaining)
+            tasks.append((matchup, count, seed, chunk_index, player_moves, enemy_moves, max_turns))
+            remaining -= count
+            chunk_index += 1
+    return tasks
+
+
+def run_simulation(matchups: Sequence[Matchup], battles: int, seed: int = 0,
+                   workers: Optional[int] = None, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                   player_moves: Optional[Sequence[str]] = None, enemy_moves: Optional[Sequence[str]] = None,
+                   max_turns: int = DEFAULT_MAX_TURNS) -> List[MatchupStats]:
+    """
+    Simulate `battles` battles per matchup
+
+    Args:
+        workers: Process count (default: all cores); 1 runs in-process
+        player_moves/enemy_moves: Fixed move names, or None for each species' moveset
+    """
+    tasks = _tasks(matchups, battles, seed, chunk_size, player_moves, enemy_moves, max_turns)
+    totals = {matchup: MatchupStats(*matchup) for matchup in matchups}
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        previous = logging.getLogger('PokemonFaiths').level
+        _init_worker(logging.ERROR)
+        try:
+            results = [simulate_chunk(task) for task in tasks]
+        finally:
+            logging.getLogger('PokemonFaiths').setLevel(previous)
+    else:
+        context = multiprocessing.get_context('spawn')
+        with context.Pool(workers, initializer=_init_worker, initargs=(logging.ERROR,)) as pool:
+            results = list(pool.imap_unordered(simulate_chunk, tasks))
+
+    for stats in results:
+        totals[(stats.player, stats.enemy)].merge(stats)
+    return [totals[matchup] for matchup in matchups]
+
+
+def write_csv(path: str, results: Sequence[MatchupStats]):
+    rows = [stats.to_row() for stats in results]
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=list(rows[0]))
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def write_json(path: str, results: Sequence[MatchupStats], metadata: Dict):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'run': metadata, 'matchups': [stats.to_row() for stats in results]}, f, indent=2)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Monte Carlo battle simulator for balancing")
+    parser.add_argument('--player', default='Charmander', help="Player species")
+    parser.add_argument('--enemies', default='', help="Comma-separated enemy species")
+    parser.add_argument('--zone', default='', help="Also simulate every species in an encounter zone")
+    parser.add_argument('--battles', type=int, default=10000, help="Battles per matchup")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--workers', type=int, default=0, help="Processes (default: all cores)")
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument('--max-turns', type=int, default=DEFAULT_MAX_TURNS)
+    parser.add_argument('--player-moves', default='', help="Comma-separated move names (default: species moveset)")
+    parser.add_argument('--enemy-moves', default='', help="Comma-separated move names (default: species moveset)")
+    parser.add_argument('--csv', help="Write per-matchup results to a CSV file")
+    parser.add_argument('--json', help="Write per-matchup results to a JSON file")
+    args = parser.parse_args(argv)
+
+    enemies = [name for name in args.enemies.split(',') if name]
+    if args.zone:
+        from .encounters import get_encounter_table
+        enemies.extend(name for name in get_encounter_table(args.zone).species if name not in enemies)
+    if not enemies:
+        parser.error("No enemies: pass --enemies and/or --zone")
+
+    def move_list(value):
+        names = [name.strip() for name in value.split(',') if name.strip()]
+        for name in names:
+            if get_move_database().get_move(name) is None:
+                parser.error(f"Unknown move: {name}")
+        return names or None
+
+    matchups = [(args.player, enemy) for enemy in enemies]
+    start = time.perf_counter()
+    results = run_simulation(matchups, args.battles, args.seed, args.workers or None, args.chunk_size,
+                             move_list(args.player_moves), move_list(args.enemy_moves), args.max_turns)
+    elapsed = time.perf_counter() - start
+
+    total = sum(stats.battles for stats in results)
+    print(f"{total} battles in {elapsed:.1f}s ({total / max(elapsed, 1e-9):.0f}/s)")
+    print(f"{'matchup':<28} {'win':>6} {'faint':>6} {'death':>6} {'turns':>6} {'injury':>7}")
+    for stats in results:
+        row = stats.to_row()
+        print(f"{stats.player + ' vs ' + stats.enemy:<28} {row['win_rate']:>6.1%} {row['faint_rate']:>6.1%} "
+              f"{row['death_rate']:>6.1%} {row['avg_turns_to_ko']:>6.2f} {row['player_injury_rate']:>7.1%}")
+
+    metadata = {'battles_per_matchup': args.battles, 'seed': args.seed, 'max_turns': args.max_turns,
+                'elapsed_seconds': round(elapsed, 3)}
+    if args.csv:
+        write_csv(args.csv, results)
+    if args.json:
+        write_json(args.json, results, metadata)
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
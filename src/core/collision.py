@@ -0,0 +1,207 @@
+"""
+Collision World for Pokemon Faiths
+Spatial hash over collision rects plus a swept move-and-slide resolver
+"""
+
+import math
+from typing import Dict, Hashable, Iterable, List, Sequence, Set, Tuple, Union
+import pygame
+from constants import TILE_SIZE
+
+COLLISION_CELL_SIZE = TILE_SIZE * 2
+
+
+class SpatialHash:
+    """
+    Uniform grid bucketing rects by the cells they overlap
+
+    Rects are stored by id so the same rect spanning several cells is
+    only returned once per query.
+    """
+
+    def __init__(self, cell_size: int = COLLISION_CELL_SIZE):
+        self.cell_size = cell_size
+        self.cells: Dict[Tuple[int, int], List[int]] = {}
+        self.rects: Dict[int, pygame.Rect] = {}
+        self._next_id = 0
+
+    def _cell_range(self, rect: pygame.Rect):
+        size = self.cell_size
+        return (rect.left // size, (rect.right - 1) // size,
+                rect.top // size, (rect.bottom - 1) // size)
+
+    def insert(self, rect: pygame.Rect) -> int:
+        """Add a rect, returns its id for remove()"""
+        rect_id = self._next_id
+        self._next_id += 1
+        self.rects[rect_id] = rect
+        x0, x1, y0, y1 = self._cell_range(rect)
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                self.cells.setdefault((cx, cy), []).append(rect_id)
+        return rect_id
+
+    def remove(self, rect_id: int):
+        """Remove a rect by id (no-op if already removed)"""
+        rect = self.rects.pop(rect_id, None)
+        if rect is None:
+            return
+        x0, x1, y0, y1 = self._cell_range(rect)
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = self.cells.get((cx, cy))
+                if bucket:
+                    bucket.remove(rect_id)
+                    if not bucket:
+                        del self.cells[(cx, cy)]
+
+    def query_ids(self, rect: pygame.Rect) -> Iterable[int]:
+        """Ids of rects sharing a cell with `rect` (candidates, not guaranteed overlaps)"""
+        x0, x1, y0, y1 = self._cell_range(rect)
+        cells = self.cells
+        if x0 == x1 and y0 == y1:
+            # Common case: the query fits in one cell, no dedupe needed
+            return cells.get((x0, y0), ())
+
+        seen: Set[int] = set()
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = cells.get((cx, cy))
+                if bucket:
+                    seen.update(bucket)
+        return seen
+
+    def query(self, rect: pygame.Rect) -> List[pygame.Rect]:
+        """Rects sharing a cell with `rect` (candidates, not guaranteed overlaps)"""
+        rects = self.rects
+        return [rects[i] for i in self.query_ids(rect)]
+
+    def __len__(self) -> int:
+        return len(self.rects)
+
+
+class CollisionWorld:
+    """
+    Static and dynamic collision layers for one scene
+
+    Static geometry (walls, furniture) is hashed once in _setup_map.
+    Dynamic colliders (NPCs, pushable objects) are keyed by owner and
+    re-bucketed only when they move.
+    """
+
+    def __init__(self, static_rects: Iterable[pygame.Rect] = (), cell_size: int = COLLISION_CELL_SIZE):
+        self.static = SpatialHash(cell_size)
+        self.dynamic = SpatialHash(cell_size)
+        self._dynamic_ids: Dict[Hashable, int] = {}
+        for rect in static_rects:
+            self.static.insert(rect)
+
+    def add_static(self, rect: pygame.Rect) -> int:
+        """Add fixed geometry"""
+        return self.static.insert(rect)
+
+    def remove_static(self, rect_id: int):
+        """Drop fixed geometry by the id add_static returned (e.g. an unloaded map region)"""
+        self.static.remove(rect_id)
+
+    def set_dynamic(self, owner: Hashable, rect: pygame.Rect):
+        """Add or move the collider belonging to owner"""
+        rect_id = self._dynamic_ids.get(owner)
+        if rect_id is not None:
+            if self.dynamic.rects[rect_id] == rect:
+                return
+            self.dynamic.remove(rect_id)
+        self._dynamic_ids[owner] = self.dynamic.insert(pygame.Rect(rect))
+
+    def remove_dynamic(self, owner: Hashable):
+        """Drop the collider belonging to owner"""
+        rect_id = self._dynamic_ids.pop(owner, None)
+        if rect_id is not None:
+            self.dynamic.remove(rect_id)
+
+    def query(self, rect: pygame.Rect) -> List[pygame.Rect]:
+        """Candidate rects near `rect` from both layers"""
+        candidates = self.static.query(rect)
+        if self.dynamic.rects:
+            candidates.extend(self.dynamic.query(rect))
+        return candidates
+
+    def collides(self, rect: pygame.Rect) -> bool:
+        """True if rect overlaps any collider"""
+        return rect.collidelist(self.query(rect)) != -1
+
+    @property
+    def rects(self) -> List[pygame.Rect]:
+        """Every collider, for debug overlays"""
+        return list(self.static.rects.values()) + list(self.dynamic.rects.values())
+
+    def __len__(self) -> int:
+        return len(self.static) + len(self.dynamic)
+
+
+def _candidates(colliders: Union[CollisionWorld, Sequence[pygame.Rect]], area: pygame.Rect) -> Sequence[pygame.Rect]:
+    if isinstance(colliders, CollisionWorld):
+        return colliders.query(area)
+    return colliders
+
+
+def _move_axis(rect: pygame.Rect, distance: int, axis: int, colliders) -> bool:
+    """
+    Move rect along one axis in sub-steps no longer than its own size
+
+    On contact the rect is snapped flush against the nearest blocker, so
+    fast movers neither tunnel through thin walls nor stop short of them.
+
+    Returns:
+        True if movement was blocked
+    """
+    if distance == 0:
+        return False
+
+    size = rect.width if axis == 0 else rect.height
+    steps = max(1, math.ceil(abs(distance) / max(1, size)))
+    moved = 0
+    for step in range(1, steps + 1):
+        target = distance * step // steps if distance > 0 else -((-distance) * step // steps)
+        delta = target - moved
+        moved = target
+        previous = rect.x if axis == 0 else rect.y
+        if axis == 0:
+            rect.x += delta
+        else:
+            rect.y += delta
+
+        hits = [c for c in _candidates(colliders, rect) if rect.colliderect(c)]
+        if not hits:
+            continue
+
+        # Snap flush, but never behind the last free position (e.g. if we
+        # started the step already overlapping something)
+        if axis == 0:
+            if delta > 0:
+                rect.x = max(previous, min(c.left for c in hits) - rect.width)
+            else:
+                rect.x = min(previous, max(c.right for c in hits))
+        else:
+            if delta > 0:
+                rect.y = max(previous, min(c.top for c in hits) - rect.height)
+            else:
+                rect.y = min(previous, max(c.bottom for c in hits))
+        return True
+    return False
+
+
+def move_and_slide(rect: pygame.Rect, dx: int, dy: int,
+                   colliders: Union[CollisionWorld, Sequence[pygame.Rect]]) -> Tuple[bool, bool]:
+    """
+    Move rect in place by (dx, dy), resolving x then y separately
+
+    Blocking on one axis keeps the motion on the other, so diagonal
+    movement slides along walls instead of stopping dead.
+
+    Returns:
+        (blocked_x, blocked_y)
+    """
+    blocked_x = _move_axis(rect, int(dx), 0, colliders)
+    blocked_y = _move_axis(rect, int(dy), 1, colliders)
+    return blocked_x, blocked_y
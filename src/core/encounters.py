@@ -0,0 +1,148 @@
+"""
+Wild Encounters for Pokemon Faiths
+Per-zone weighted encounter tables compiled to alias tables for O(1) draws
+
+Zones are defined in assets/data/encounters.json:
+    "<zone>": {
+        "steps":   [min, max]       grass steps between encounters
+        "species": [{"name", "weight", "levels": [min, max]}]
+        "veteran": {"chance", "level_bonus"}   optional rare high-level spawns
+    }
+"""
+
+import json
+from array import array
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+from .logger import get_logger
+from .rng import STREAM_ENCOUNTER, get_stream
+from .species import create_pokemon_dict
+
+logger = get_logger('Encounters')
+
+ENCOUNTER_FILE = 'assets/data/encounters.json'
+
+
+class EncounterError(Exception):
+    """Raised when encounter data is missing or malformed"""
+
+
+class Encounter(NamedTuple):
+    """One rolled wild encounter"""
+    species: str
+    level: int
+    veteran: bool
+
+
+class AliasTable:
+    """
+    Vose alias table: samples index i with probability weights[i] / sum(weights)
+
+    Building is O(n); each draw costs one random index and one coin flip.
+    """
+
+    __slots__ = ('probability', 'alias')
+
+    def __init__(self, weights: Sequence[float]):
+        count = len(weights)
+        total = float(sum(weights))
+        if count == 0 or total <= 0 or min(weights) < 0:
+            raise EncounterError("Alias table needs at least one positive weight and no negative weights")
+
+        scaled = [w * count / total for w in weights]
+        self.probability = array('d', [1.0]) * count
+        self.alias = array('I', range(count))
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        while small and large:
+            less = small.pop()
+            more = large.pop()
+            self.probability[less] = scaled[less]
+            self.alias[less] = more
+            scaled[more] -= 1.0 - scaled[less]
+            (small if scaled[more] < 1.0 else large).append(more)
+        # Leftovers are 1.0 up to rounding error
+
+    def __len__(self) -> int:
+        return len(self.probability)
+
+    def sample(self, rng=None) -> int:
+        rng = rng if rng is not None else get_stream(STREAM_ENCOUNTER)
+        index = int(rng.random() * len(self.probability))
+        return index if rng.random() < self.probability[index] else self.alias[index]
+
+
+class EncounterTable:
+    """A zone's compiled encounter table"""
+
+    __slots__ = ('zone', 'species', 'level_min', 'level_span', 'alias', 'steps',
+                 'veteran_chance', 'veteran_level_bonus')
+
+    def __init__(self, zone: str, species: List[Tuple[str, float, int, int]],
+                 steps: Tuple[int, int] = (5, 15), veteran_chance: float = 0.0, veteran_level_bonus: int = 0):
+        if not species:
+            raise EncounterError(f"Encounter zone '{zone}' has no species")
+        self.zone = zone
+        self.species = tuple(name for name, _, _, _ in species)
+        self.level_min = array('H', (low for _, _, low, _ in species))
+        self.level_span = array('H', (high - low + 1 for _, _, low, high in species))
+        self.alias = AliasTable([weight for _, weight, _, _ in species])
+        self.steps = steps
+        self.veteran_chance = veteran_chance
+        self.veteran_level_bonus = veteran_level_bonus
+
+    def roll(self, rng=None) -> Encounter:
+        """Draw a species and level (default: the encounter stream)"""
+        rng = rng if rng is not None else get_stream(STREAM_ENCOUNTER)
+        index = self.alias.sample(rng)
+        level = self.level_min[index] + int(rng.random() * self.level_span[index])
+        veteran = self.veteran_chance > 0 and rng.random() < self.veteran_chance
+        if veteran:
+            level += self.veteran_level_bonus
+        return Encounter(self.species[index], min(level, 100), veteran)
+
+    def roll_steps(self, rng=None) -> int:
+        """Grass steps until the next encounter"""
+        rng = rng if rng is not None else get_stream(STREAM_ENCOUNTER)
+        return rng.randint(*self.steps)
+
+
+def parse_encounter_tables(data: dict) -> Dict[str, EncounterTable]:
+    """Compile parsed encounters.json into tables by zone"""
+    tables = {}
+    for zone, spec in data.items():
+        try:
+            species = [(entry['name'], entry.get('weight', 1), entry['levels'][0], entry['levels'][1])
+                       for entry in spec['species']]
+            veteran = spec.get('veteran', {})
+            tables[zone] = EncounterTable(zone, species, tuple(spec.get('steps', (5, 15))),
+                                          veteran.get('chance', 0.0), veteran.get('level_bonus', 0))
+        except (KeyError, IndexError, TypeError) as e:
+            raise EncounterError(f"Malformed encounter zone '{zone}': {e}") from e
+    return tables
+
+
+_tables: Optional[Dict[str, EncounterTable]] = None
+
+
+def get_encounter_table(zone: str) -> EncounterTable:
+    """Compiled encounter table for a zone (encounter data is loaded once)"""
+    global _tables
+    if _tables is None:
+        from .asset_manager import get_asset_manager
+        data = get_asset_manager().load_bytes(ENCOUNTER_FILE)
+        if data is None:
+            raise EncounterError(f"Encounter data not found: {ENCOUNTER_FILE}")
+        _tables = parse_encounter_tables(json.loads(data.decode('utf-8')))
+        logger.info(f"Loaded encounter tables for {len(_tables)} zones")
+    table = _tables.get(zone)
+    if table is None:
+        raise EncounterError(f"No encounter table for zone '{zone}'")
+    return table
+
+
+def create_wild_pokemon(encounter: Encounter) -> dict:
+    """Build the battle dict for a rolled wild Pokemon"""
+    pokemon = create_pokemon_dict(encounter.species, encounter.level)
+    if encounter.veteran:
+        pokemon['veteran'] = True
+    return pokemon
@@ -6,9 +6,12 @@ Contains Player, Camera, and other reusable game objects
 import pygame
 from constants import (
     PLAYER_SPEED, PLAYER_SIZE, PLAYER_COLLISION_WIDTH, 
-    PLAYER_COLLISION_HEIGHT, PLAYER_VISUAL_SIZE
+    PLAYER_COLLISION_HEIGHT, PLAYER_VISUAL_SIZE,
+    WALK_FRAME_DURATION, PLAYER_MIRROR_WEST
 )
+from .animation import AnimationPlayer, load_clip
 from .asset_manager import get_asset_manager
+from .collision import move_and_slide
 from .logger import get_logger
 
 logger = get_logger('Entities')
@@ -20,8 +23,8 @@ class Player:
         self.animations = self._load_sprites()
         self.direction = 'south'
         self.state = 'idle'  # 'idle' or 'walk'
-        self.animation_frame = 0
-        self.image = self.animations[self.direction]['idle'][0]
+        self.animator = AnimationPlayer(self.animations[self.direction]['idle'])
+        self.image = self.animator.image
         self.sprinting = False  # Sprint toggle state
 
         # Create collision box shorter so head can overlap furniture
@@ -33,24 +36,33 @@ class Player:
                                       PLAYER_VISUAL_SIZE, PLAYER_VISUAL_SIZE)
 
     def _load_sprites(self):
-        """Loads all player sprites using the centralized AssetManager."""
+        """Loads the player's animation clips (shared with any other user of the same frames)"""
         animations = {}
-        asset_manager = get_asset_manager()
-        directions = ['south', 'north', 'east', 'west']
+        size = (PLAYER_SIZE, PLAYER_SIZE)
 
-        for direction in directions:
-            animations[direction] = {'idle': [], 'walk': []}
-            
-            # Load idle sprite using AssetManager
+        for direction in ['south', 'north', 'east']:
             idle_path = f'assets/sprites/rotations/{direction}.png'
-            sprite = asset_manager.load_image(idle_path, (PLAYER_SIZE, PLAYER_SIZE))
-            animations[direction]['idle'].append(sprite)
-
-            # Load walking animation frames
-            for i in range(6):
-                walk_path = f'assets/sprites/animations/walk/{direction}/frame_{i:03d}.png'
-                sprite = asset_manager.load_image(walk_path, (PLAYER_SIZE, PLAYER_SIZE))
-                animations[direction]['walk'].append(sprite)
+            walk_paths = [f'assets/sprites/animations/walk/{direction}/frame_{i:03d}.png' for i in range(6)]
+            animations[direction] = {
+                'idle': load_clip(f'player_idle_{direction}', [idle_path], size, 0.0, loop=False),
+                'walk': load_clip(f'player_walk_{direction}', walk_paths, size, WALK_FRAME_DURATION)
+            }
+
+        # The authored west art is not an exact mirror of east, so only mirror
+        # when asked to or when the west frames are missing
+        west_idle = 'assets/sprites/rotations/west.png'
+        west_walk = [f'assets/sprites/animations/walk/west/frame_{i:03d}.png' for i in range(6)]
+        asset_manager = get_asset_manager()
+        if PLAYER_MIRROR_WEST or not all(asset_manager.has_asset(path) for path in [west_idle] + west_walk):
+            animations['west'] = {
+                'idle': animations['east']['idle'].mirrored('player_idle_west'),
+                'walk': animations['east']['walk'].mirrored('player_walk_west')
+            }
+        else:
+            animations['west'] = {
+                'idle': load_clip('player_idle_west', [west_idle], size, 0.0, loop=False),
+                'walk': load_clip('player_walk_west', west_walk, size, WALK_FRAME_DURATION)
+            }
 
         logger.debug("Player sprites loaded successfully")
         return animations
@@ -59,11 +71,10 @@ class Player:
         """
         BRAND NEW MOVEMENT SYSTEM - Simple and clean
         Updated player position with frame-independent movement
-        """
-        # Store old position for collision rollback
-        old_x = self.rect.x
-        old_y = self.rect.y
 
+        collision_rects is the scene's CollisionWorld (only nearby cells are
+        tested) or a plain list of rects.
+        """
         # Calculate actual movement speed (pixels per frame)
         # Apply sprint multiplier if sprinting
         sprint_multiplier = 2.0 if self.sprinting else 1.0
@@ -99,32 +110,15 @@ class Player:
             self.direction = 'east'
             moved = True
 
-        # Apply movement
-        self.rect.x += int(dx)
-        self.rect.y += int(dy)
-
-        # Collision detection and rollback
-        for collision_rect in collision_rects:
-            if self.rect.colliderect(collision_rect):
-                # Collision detected - revert to old position
-                self.rect.x = old_x
-                self.rect.y = old_y
-                break
+        # Apply movement per axis, sub-stepped and stopping flush against walls
+        move_and_slide(self.rect, int(dx), int(dy), collision_rects)
 
-        # Update animation state
+        # Update animation state (clip timing comes from the shared animation clock)
+        previous_state = self.state
         self.state = 'walk' if moved else 'idle'
-        
-        # Update animation frame
-        if self.state == 'walk':
-            self.animation_frame += 0.15 * dt * 60  # Frame-independent animation
-            if self.animation_frame >= len(self.animations[self.direction]['walk']):
-                self.animation_frame = 0
-        else:
-            self.animation_frame = 0
-
-        # Update sprite
-        frame_index = int(self.animation_frame)
-        self.image = self.animations[self.direction][self.state][frame_index]
+        self.animator.play(self.animations[self.direction][self.state],
+                           keep_time=previous_state == self.state)
+        self.image = self.animator.image
         
         # Update visual rect to follow collision rect
         self.visual_rect.centerx = self.rect.centerx
@@ -0,0 +1,205 @@
+"""
+Entity Store for Pokemon Faiths
+Struct-of-arrays storage for NPCs and world objects with batched update/draw
+"""
+
+from array import array
+from typing import Dict, Hashable, Iterable, List, Sequence, Tuple
+import pygame
+
+# Entity flag bits
+ENTITY_ACTIVE = 0x01   # Slot in use
+ENTITY_VISIBLE = 0x02  # Drawn by draw()
+ENTITY_SOLID = 0x04    # Blocks movement (for systems that read it)
+
+
+class EntityHandle:
+    """
+    Lightweight reference to one entity's slot in an EntityStore
+
+    A handle goes stale when its entity is despawned; the generation check
+    stops it from reading a newer entity that reused the slot.
+    Handles expose rect and draw() so they can stand in for sprites.
+    """
+
+    __slots__ = ('store', 'index', 'generation')
+
+    def __init__(self, store: 'EntityStore', index: int, generation: int):
+        self.store = store
+        self.index = index
+        self.generation = generation
+
+    @property
+    def alive(self) -> bool:
+        store = self.store
+        return (store.generations[self.index] == self.generation
+                and bool(store.flags[self.index] & ENTITY_ACTIVE))
+
+    @property
+    def x(self) -> float:
+        return self.store.x[self.index]
+
+    @x.setter
+    def x(self, value: float):
+        self.store.x[self.index] = value
+
+    @property
+    def y(self) -> float:
+        return self.store.y[self.index]
+
+    @y.setter
+    def y(self, value: float):
+        self.store.y[self.index] = value
+
+    @property
+    def velocity(self) -> Tuple[float, float]:
+        return self.store.vx[self.index], self.store.vy[self.index]
+
+    @velocity.setter
+    def velocity(self, value: Sequence[float]):
+        self.store.vx[self.index], self.store.vy[self.index] = value
+
+    @property
+    def flags(self) -> int:
+        return self.store.flags[self.index]
+
+    @flags.setter
+    def flags(self, value: int):
+        self.store.flags[self.index] = value | ENTITY_ACTIVE
+
+    @property
+    def image(self) -> pygame.Surface:
+        return self.store.sprites[self.store.sprite_ids[self.index]]
+
+    @property
+    def rect(self) -> pygame.Rect:
+        return self.image.get_rect(topleft=(int(self.x), int(self.y)))
+
+    def draw(self, surface: pygame.Surface, camera):
+        surface.blit(self.image, (int(self.x) - camera.offset.x, int(self.y) - camera.offset.y))
+
+
+class EntityStore:
+    """
+    Positions, velocities, sprite ids and flags in parallel typed arrays
+
+    update() and draw() each walk the arrays once per frame instead of
+    calling a method on every object, which keeps hundreds of villagers
+    and ambient creatures cheap. Free slots are reused on spawn.
+    """
+
+    def __init__(self):
+        self.x = array('f')
+        self.y = array('f')
+        self.vx = array('f')
+        self.vy = array('f')
+        self.sprite_ids = array('H')
+        self.flags = array('B')
+        self.generations = array('I')
+        self.sprites: List[pygame.Surface] = []
+        self._sprite_keys: Dict[Hashable, int] = {}
+        self._free: List[int] = []
+        self.count = 0
+
+    def register_sprite(self, key: Hashable, surface: pygame.Surface) -> int:
+        """Intern a surface and return its sprite id (same key -> same id)"""
+        sprite_id = self._sprite_keys.get(key)
+        if sprite_id is None:
+            sprite_id = len(self.sprites)
+            self.sprites.append(surface)
+            self._sprite_keys[key] = sprite_id
+        return sprite_id
+
+    def spawn(self, x: float, y: float, sprite_id: int, flags: int = ENTITY_VISIBLE,
+              velocity: Tuple[float, float] = (0.0, 0.0)) -> EntityHandle:
+        """Create an entity at (x, y) (top-left) and return its handle"""
+        flags |= ENTITY_ACTIVE
+        if self._free:
+            index = self._free.pop()
+            self.x[index] = x
+            self.y[index] = y
+            self.vx[index], self.vy[index] = velocity
+            self.sprite_ids[index] = sprite_id
+            self.flags[index] = flags
+        else:
+            index = len(self.x)
+            self.x.append(x)
+            self.y.append(y)
+            self.vx.append(velocity[0])
+            self.vy.append(velocity[1])
+            self.sprite_ids.append(sprite_id)
+            self.flags.append(flags)
+            self.generations.append(0)
+        self.count += 1
+        return EntityHandle(self, index, self.generations[index])
+
+    def despawn(self, handle: EntityHandle):
+        """Free an entity's slot (stale handles are ignored)"""
+        if not handle.alive:
+            return
+        index = handle.index
+        self.flags[index] = 0
+        self.vx[index] = self.vy[index] = 0.0
+        self.generations[index] += 1
+        self._free.append(index)
+        self.count -= 1
+
+    def handles(self) -> List[EntityHandle]:
+        """Handles for every live entity"""
+        return [EntityHandle(self, i, self.generations[i])
+                for i, flags in enumerate(self.flags) if flags & ENTITY_ACTIVE]
+
+    def update(self, dt: float):
+        """Integrate velocities (pixels per second) for every moving entity"""
+        x, y, vx, vy = self.x, self.y, self.vx, self.vy
+        for i, flags in enumerate(self.flags):
+            if flags & ENTITY_ACTIVE:
+                dx = vx[i]
+                dy = vy[i]
+                if dx or dy:
+                    x[i] += dx * dt
+                    y[i] += dy * dt
+
+    def draw(self, surface: pygame.Surface, camera, others: Iterable = ()):
+        """
+        Draw visible entities on screen, depth-sorted by bottom edge
+
+        Args:
+            others: Extra drawables (e.g. the player) as (sort_y, obj) pairs;
+                    they are sorted in and drawn with obj.draw(surface, camera)
+        """
+        offset_x, offset_y = camera.offset
+        view_w, view_h = surface.get_size()
+        sprites = self.sprites
+        x, y, sprite_ids = self.x, self.y, self.sprite_ids
+
+        # (sort_y, tiebreak, image, pos) for entities, (sort_y, tiebreak, None, obj) for others
+        items = []
+        for i, flags in enumerate(self.flags):
+            if flags & ENTITY_VISIBLE and flags & ENTITY_ACTIVE:
+                image = sprites[sprite_ids[i]]
+                sx = int(x[i]) - offset_x
+                sy = int(y[i]) - offset_y
+                w, h = image.get_size()
+                if sx + w < 0 or sy + h < 0 or sx >= view_w or sy >= view_h:
+                    continue  # Off screen
+                items.append((sy + offset_y + h, i, image, (sx, sy)))
+        for n, (sort_y, obj) in enumerate(others):
+            items.append((sort_y, -1 - n, None, obj))
+        items.sort(key=lambda item: (item[0], item[1]))
+
+        # Consecutive entities go to the screen in one blits() call
+        batch = []
+        for _, _, image, target in items:
+            if image is not None:
+                batch.append((image, target))
+                continue
+            if batch:
+                surface.blits(batch, doreturn=False)
+                batch = []
+            target.draw(surface, camera)
+        if batch:
+            surface.blits(batch, doreturn=False)
+
+    def __len__(self) -> int:
+        return self.count
@@ -33,6 +33,14 @@ class GameDebugger:
             print(f"Failed to save screenshot: {e}")
             return False
         
+    def dump_asset_metrics(self):
+        """Write AssetManager load metrics (timings, hit rates, bytes) to JSON"""
+        from .asset_manager import get_asset_manager
+        output_path = get_asset_manager().dump_metrics()
+        if output_path:
+            print(f"Asset metrics saved: {output_path}")
+        return output_path
+        
     def log_game_state(self, player_rect, camera_offset, furniture_sprites, collision_rects):
         """Log current game state information"""
         print("\n=== GAME STATE DEBUG ===")
@@ -0,0 +1,89 @@
+"""
+Interaction Index for Pokemon Faiths
+Grid-bucketed lookup of the interactive object the player can examine
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+INTERACTION_CELL_SIZE = 64
+
+Point = Tuple[int, int]
+
+
+class InteractionIndex:
+    """
+    Interactive objects bucketed by every grid cell their range reaches
+
+    A query only tests the objects in the player's cell, using squared
+    distances. The answer is cached and recomputed only when the queried
+    position changes, so a standing player costs one tuple comparison.
+    Objects registered first win when several are in range.
+    """
+
+    def __init__(self, cell_size: int = INTERACTION_CELL_SIZE):
+        self.cell_size = cell_size
+        self.cells: Dict[Tuple[int, int], List[str]] = {}
+        # name -> (x, y, range squared, registration order)
+        self.objects: Dict[str, Tuple[int, int, float, int]] = {}
+        self._order = 0
+        self._last_position: Optional[Point] = None
+        self._nearby: Optional[str] = None
+
+    def add(self, name: str, center: Point, interaction_range: float):
+        """Register (or move) an object with its interaction radius"""
+        if name in self.objects:
+            self.remove(name)
+        x, y = center
+        self.objects[name] = (x, y, interaction_range * interaction_range, self._order)
+        self._order += 1
+        for cell in self._cells_in_range(x, y, interaction_range):
+            self.cells.setdefault(cell, []).append(name)
+        self.invalidate()
+
+    def remove(self, name: str):
+        """Unregister an object (no-op if unknown)"""
+        entry = self.objects.pop(name, None)
+        if entry is None:
+            return
+        x, y, range_sq, _ = entry
+        for cell in self._cells_in_range(x, y, range_sq ** 0.5):
+            bucket = self.cells.get(cell)
+            if bucket and name in bucket:
+                bucket.remove(name)
+                if not bucket:
+                    del self.cells[cell]
+        self.invalidate()
+
+    def _cells_in_range(self, x: int, y: int, radius: float):
+        size = self.cell_size
+        x0, x1 = int((x - radius) // size), int((x + radius) // size)
+        y0, y1 = int((y - radius) // size), int((y + radius) // size)
+        return [(cx, cy) for cx in range(x0, x1 + 1) for cy in range(y0, y1 + 1)]
+
+    def invalidate(self):
+        """Force the next query to re-evaluate"""
+        self._last_position = None
+
+    def nearby(self, position: Point) -> Optional[str]:
+        """Name of the object in range of position, or None"""
+        position = (position[0], position[1])
+        if position == self._last_position:
+            return self._nearby
+        self._last_position = position
+
+        px, py = position
+        bucket = self.cells.get((px // self.cell_size, py // self.cell_size))
+        best = None
+        best_order = None
+        if bucket:
+            for name in bucket:
+                x, y, range_sq, order = self.objects[name]
+                dx = px - x
+                dy = py - y
+                if dx * dx + dy * dy <= range_sq and (best_order is None or order < best_order):
+                    best, best_order = name, order
+        self._nearby = best
+        return best
+
+    def __len__(self) -> int:
+        return len(self.objects)
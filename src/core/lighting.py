@@ -0,0 +1,117 @@
+"""
+Light Map for Pokemon Faiths
+Low-resolution light accumulation multiplied onto the scene in one blit
+"""
+
+from typing import Dict, List, Tuple
+import pygame
+
+Color = Tuple[int, int, int]
+
+
+def create_light_sprite(radius: int, color: Color, intensity: float = 1.0) -> pygame.Surface:
+    """
+    Opaque radial falloff sprite for additive light accumulation
+
+    Black means "no light", so it can be added with BLEND_RGB_ADD.
+    """
+    size = max(1, radius * 2)
+    light = pygame.Surface((size, size))
+    light.fill((0, 0, 0))
+    for y in range(size):
+        for x in range(size):
+            dx = x - radius + 0.5
+            dy = y - radius + 0.5
+            distance_sq = (dx * dx + dy * dy) / (radius * radius) if radius else 1.0
+            if distance_sq < 1.0:
+                falloff = (1.0 - distance_sq) * intensity
+                light.set_at((x, y), (int(color[0] * falloff), int(color[1] * falloff), int(color[2] * falloff)))
+    return light
+
+
+class LightMap:
+    """
+    Ambient light plus any number of point lights, rendered at 1/scale resolution
+
+    Static lights (torches, glowing crystals) are baked once into a
+    world-space layer; dynamic lights (the player, moving Pokemon) are
+    added each frame. render() composes the visible part, upscales it and
+    multiplies it onto the target in a single blit, so the per-frame cost
+    is fixed by the view size rather than the number of static lights.
+    """
+
+    def __init__(self, view_size: Tuple[int, int], world_size: Tuple[int, int],
+                 ambient: Color = (60, 60, 80), scale: int = 4):
+        self.scale = scale
+        self.ambient = ambient
+        self.view_size = view_size
+        self.world_size = world_size
+        low_w = view_size[0] // scale + 2
+        low_h = view_size[1] // scale + 2
+        self.buffer = pygame.Surface((low_w, low_h))
+        self.static_lights: List[Tuple[Tuple[int, int], int, Color, float]] = []
+        self.dynamic_lights: List[Tuple[Tuple[int, int], int, Color, float]] = []
+        self._static_layer = None
+        self._sprites: Dict[Tuple, pygame.Surface] = {}
+
+    def _sprite(self, radius: int, color: Color, intensity: float) -> pygame.Surface:
+        """Low-res light sprite, generated once per (radius, color, intensity)"""
+        key = (max(1, radius // self.scale), color, intensity)
+        sprite = self._sprites.get(key)
+        if sprite is None:
+            sprite = create_light_sprite(key[0], color, intensity)
+            self._sprites[key] = sprite
+        return sprite
+
+    def add_static_light(self, world_pos: Tuple[int, int], radius: int,
+                         color: Color = (255, 200, 120), intensity: float = 1.0):
+        """Add a light that never moves (invalidates the baked layer)"""
+        self.static_lights.append((world_pos, radius, color, intensity))
+        self._static_layer = None
+
+    def clear_static_lights(self):
+        self.static_lights.clear()
+        self._static_layer = None
+
+    def add_light(self, world_pos: Tuple[int, int], radius: int,
+                  color: Color = (255, 200, 120), intensity: float = 1.0):
+        """Add a light for the next render() only"""
+        self.dynamic_lights.append((world_pos, radius, color, intensity))
+
+    def _bake_static_layer(self) -> pygame.Surface:
+        scale = self.scale
+        layer = pygame.Surface((self.world_size[0] // scale + 1, self.world_size[1] // scale + 1))
+        layer.fill(self.ambient)
+        for (x, y), radius, color, intensity in self.static_lights:
+            sprite = self._sprite(radius, color, intensity)
+            half = sprite.get_width() // 2
+            layer.blit(sprite, (x // scale - half, y // scale - half), special_flags=pygame.BLEND_RGB_ADD)
+        return layer
+
+    def render(self, surface: pygame.Surface, camera_offset):
+        """Multiply the light map onto surface (drawn at camera_offset) and clear dynamic lights"""
+        if self._static_layer is None:
+            self._static_layer = self._bake_static_layer()
+
+        scale = self.scale
+        offset_x = int(camera_offset[0])
+        offset_y = int(camera_offset[1])
+        # Sub-cell remainder, so the upscaled map stays locked to the world
+        frac_x = offset_x % scale
+        frac_y = offset_y % scale
+        cell_x = offset_x // scale
+        cell_y = offset_y // scale
+
+        buffer = self.buffer
+        buffer.fill(self.ambient)
+        buffer.blit(self._static_layer, (-cell_x, -cell_y))
+        for (x, y), radius, color, intensity in self.dynamic_lights:
+            sprite = self._sprite(radius, color, intensity)
+            half = sprite.get_width() // 2
+            buffer.blit(sprite, (x // scale - cell_x - half, y // scale - cell_y - half),
+                        special_flags=pygame.BLEND_RGB_ADD)
+        self.dynamic_lights.clear()
+
+        size = (buffer.get_width() * scale, buffer.get_height() * scale)
+        upscaled = pygame.transform.smoothscale(buffer, size)
+        surface.blit(upscaled, (-frac_x, -frac_y), special_flags=pygame.BLEND_RGB_MULT)
@@ -7,12 +7,62 @@ import logging
 import os
 from datetime import datetime
 
+class DeferredFileHandler(logging.Handler):
+    """
+    File handler that creates its log file on first use
+    
+    While holding (startup mode) records are buffered in memory, so no
+    file I/O happens before the first frame; open() writes them out.
+    """
+    
+    MAX_BUFFERED = 1000
+    
+    def __init__(self, log_file, hold=False):
+        super().__init__(logging.DEBUG)  # File gets everything
+        self.log_file = log_file
+        self.hold = hold
+        self.target = None
+        self.buffer = []
+    
+    def emit(self, record):
+        try:
+            if self.target is None:
+                if self.hold:
+                    if len(self.buffer) < self.MAX_BUFFERED:
+                        self.buffer.append(record)
+                    return
+                self.open()
+            self.target.handle(record)
+        except Exception:
+            self.handleError(record)
+    
+    def open(self):
+        """Create the log file and write any buffered records"""
+        self.hold = False
+        if self.target is not None:
+            return
+        log_dir = os.path.dirname(self.log_file)
+        if log_dir:
+            os.makedirs(log_dir, exist_ok=True)
+        self.target = logging.FileHandler(self.log_file)
+        self.target.setLevel(self.level)
+        self.target.setFormatter(self.formatter)
+        for record in self.buffer:
+            self.target.handle(record)
+        self.buffer.clear()
+    
+    def close(self):
+        if self.target is not None:
+            self.target.close()
+        super().close()
+
 class GameLogger:
     """Centralized logging system for the game"""
     
-    def __init__(self, log_to_file=True, log_level=logging.INFO):
+    def __init__(self, log_to_file=True, log_level=logging.INFO, startup=False):
         self.logger = logging.getLogger('PokemonFaiths')
         self.logger.setLevel(log_level)
+        self.file_handler = None
         
         # Prevent duplicate handlers
         if self.logger.handlers:
@@ -27,24 +77,29 @@ class GameLogger:
         console_handler.setFormatter(console_formatter)
         self.logger.addHandler(console_handler)
         
-        # File handler (optional)
+        # File handler (optional), the file itself is created on first use
         if log_to_file:
-            try:
-                os.makedirs('logs', exist_ok=True)
-                timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-                log_file = os.path.join('logs', f'game_{timestamp}.log')
-                
-                file_handler = logging.FileHandler(log_file)
-                file_handler.setLevel(logging.DEBUG)  # File gets everything
-                file_formatter = logging.Formatter(
-                    '%(asctime)s | %(levelname)-8s | %(name)-15s | %(message)s'
-                )
-                file_handler.setFormatter(file_formatter)
-                self.logger.addHandler(file_handler)
-                
-                self.logger.info(f"Logging to file: {log_file}")
-            except Exception as e:
-                self.logger.warning(f"Could not create log file: {e}")
+            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+            log_file = os.path.join('logs', f'game_{timestamp}.log')
+            
+            self.file_handler = DeferredFileHandler(log_file, hold=startup)
+            file_formatter = logging.Formatter(
+                '%(asctime)s | %(levelname)-8s | %(name)-15s | %(message)s'
+            )
+            self.file_handler.setFormatter(file_formatter)
+            self.logger.addHandler(self.file_handler)
+    
+    def end_startup(self):
+        """Leave startup mode: create the log file and flush buffered records"""
+        if self.file_handler is None or self.file_handler.target is not None:
+            return
+        try:
+            self.file_handler.open()
+            self.logger.info(f"Logging to file: {self.file_handler.log_file}")
+        except OSError as e:
+            self.logger.removeHandler(self.file_handler)
+            self.file_handler = None
+            self.logger.warning(f"Could not create log file: {e}")
     
     def get_logger(self, module_name):
         """Get a logger for a specific module"""
@@ -53,13 +108,22 @@ class GameLogger:
 # Global logger instance
 _game_logger = None
 
-def init_logger(log_to_file=True, log_level=logging.INFO):
-    """Initialize the global logger"""
+def init_logger(log_to_file=True, log_level=logging.INFO, startup=False):
+    """
+    Initialize the global logger
+    
+    startup: Buffer file logging in memory until end_startup() (first frame shown)
+    """
     global _game_logger
     if _game_logger is None:
-        _game_logger = GameLogger(log_to_file, log_level)
+        _game_logger = GameLogger(log_to_file, log_level, startup)
     return _game_logger
 
+def end_startup():
+    """Called once the first frame is on screen; starts writing the log file"""
+    if _game_logger is not None:
+        _game_logger.end_startup()
+
 def get_logger(module_name='Core'):
     """Get a logger for a specific module"""
     global _game_logger
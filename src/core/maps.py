@@ -0,0 +1,363 @@
+"""
+Map Data for Pokemon Faiths
+Compiles JSON map definitions to a compact binary form and loads them with mmap
+
+Source maps live in assets/data/maps/<name>.json:
+    width, height    map size in tiles
+    border           thickness (px) of the collision border around the map, 0 for none
+    tiles            [{"flags": ["grass", "encounter"], "regions": [[x, y, w, h]], "tiles": [[x, y]]}]
+    objects          [{"name", "sprite", "rect": [x, y, w, h], "collision": [dx, dy, w, h],
+                       "walls": {"inset", "thickness", "doorway", "open_bottom"}}]
+    collision        extra collision rects [[x, y, w, h]]
+    triggers         [{"name", "rect": [x, y, w, h]}]
+
+Compiled maps (<name>.map, little-endian):
+    header:    magic b'PFMP' | version u16 | width u16 | height u16 |
+               rect_count u32 | object_count u16 | trigger_count u16 | source_hash 8 bytes
+    tiles:     width*height flag bytes, then width*height trigger id bytes
+    rects:     rect_count x (x i32 | y i32 | w i32 | h i32)
+    objects:   object_count x (name_len u8 | name | sprite_len u8 | sprite | rect)
+    triggers:  trigger_count x (name_len u8 | name | rect), trigger ids are 1-based
+
+source_hash is a digest of the JSON source bytes. The loader compares it
+with the current source, so a stale .map is detected from content alone
+(file mtimes are arbitrary after a git checkout).
+
+Rebuild every map (from the src/ directory) with:
+    python -m core.maps
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+from typing import Dict, List, NamedTuple, Tuple
+import pygame
+from constants import TILE_SIZE
+from .tile_grid import (
+    TILE_ENCOUNTER, TILE_GRASS, TILE_ROAD, TILE_SOLID, TileGrid, compile_tile_grid
+)
+from .logger import get_logger
+
+logger = get_logger('Maps')
+
+MAP_MAGIC = b'PFMP'
+MAP_VERSION = 2
+MAP_DIR = 'assets/data/maps'
+
+TILE_FLAG_NAMES = {
+    'solid': TILE_SOLID,
+    'grass': TILE_GRASS,
+    'road': TILE_ROAD,
+    'encounter': TILE_ENCOUNTER
+}
+
+_HEADER = struct.Struct('<4sHHHIHH8s')
+_RECT = struct.Struct('<iiii')
+_LEN = struct.Struct('<B')
+
+RectTuple = Tuple[int, int, int, int]
+
+NO_SOURCE_HASH = bytes(8)  # Maps not compiled from a source file
+
+
+class MapError(Exception):
+    """Raised when a map is missing or malformed"""
+
+
+class MapObject(NamedTuple):
+    """A placed object from the map's object layer"""
+    name: str
+    sprite: str
+    rect: pygame.Rect
+
+
+class MapData:
+    """A loaded map: tile grid, collision rects, objects and trigger volumes"""
+
+    __slots__ = ('name', 'width', 'height', 'tile_grid', 'collision_rects', 'objects', 'triggers', 'source_hash')
+
+    def __init__(self, name: str, tile_grid: TileGrid, collision_rects: List[pygame.Rect],
+                 objects: Dict[str, MapObject], triggers: Dict[str, pygame.Rect],
+                 source_hash: bytes = NO_SOURCE_HASH):
+        self.name = name
+        self.width = tile_grid.width
+        self.height = tile_grid.height
+        self.tile_grid = tile_grid
+        self.collision_rects = collision_rects
+        self.objects = objects
+        self.triggers = triggers
+        self.source_hash = source_hash
+
+
+# ----------------------------------------------------------------------------
+# Compiler
+# ----------------------------------------------------------------------------
+
+def _wall_rects(rect: RectTuple, walls: dict) -> List[RectTuple]:
+    """Expand a walls spec into the thin collision rects around an object's footprint"""
+    x, y, w, h = rect
+    inset = walls.get('inset', 0)
+    thickness = walls.get('thickness', 5)
+    doorway = walls.get('doorway', 0)
+    right = x + w
+    bottom = y + h
+
+    rects = [
+        (x + inset, y + inset, thickness, h - inset * 2),                  # Left
+        (right - inset - thickness, y + inset, thickness, h - inset * 2),  # Right
+        (x + inset, y + inset, w - inset * 2, thickness)                   # Top
+    ]
+    if walls.get('open_bottom'):
+        return rects
+
+    wall_y = bottom - inset - thickness
+    if doorway:
+        # Bottom wall split around a centered doorway
+        center = x + w // 2
+        rects.append((x + inset, wall_y, (center - doorway // 2) - (x + inset), thickness))
+        rects.append((center + doorway // 2, wall_y, (right - inset) - (center + doorway // 2), thickness))
+    else:
+        rects.append((x + inset, wall_y, w - inset * 2, thickness))
+    return rects
+
+
+def _tiles_in(region) -> List[Tuple[int, int]]:
+    x, y, w, h = region
+    return [(tx, ty) for ty in range(y, y + h) for tx in range(x, x + w)]
+
+
+def source_hash(data: bytes) -> bytes:
+    """Digest of a JSON source file's bytes, as stored in compiled headers"""
+    return hashlib.blake2b(data, digest_size=8).digest()
+
+
+def compile_map_source(data: bytes) -> bytes:
+    """Compile raw JSON map bytes, recording their hash in the header"""
+    try:
+        source = json.loads(data.decode('utf-8'))
+    except (UnicodeDecodeError, ValueError) as e:
+        raise MapError(f"Malformed map source: {e}") from e
+    return compile_map(source, source_hash(data))
+
+
+def compile_map(source: dict, source_digest: bytes = NO_SOURCE_HASH) -> bytes:
+    """Compile a parsed JSON map definition to the binary map format"""
+    width = source['width']
+    height = source['height']
+
+    rects: List[RectTuple] = []
+    border = source.get('border', 0)
+    if border:
+        map_w = width * TILE_SIZE
+        map_h = height * TILE_SIZE
+        rects.extend([
+            (0, 0, map_w, border),               # Top
+            (0, map_h - border, map_w, border),  # Bottom
+            (0, 0, border, map_h),               # Left
+            (map_w - border, 0, border, map_h)   # Right
+        ])
+
+    objects = []
+    for obj in source.get('objects', []):
+        rect = tuple(obj['rect'])
+        if 'walls' in obj:
+            rects.extend(_wall_rects(rect, obj['walls']))
+        if 'collision' in obj:
+            dx, dy, w, h = obj['collision']
+            rects.append((rect[0] + dx, rect[1] + dy, w, h))
+        objects.append((obj['name'], obj.get('sprite', obj['name']), rect))
+
+    rects.extend(tuple(r) for r in source.get('collision', []))
+
+    layers: Dict[int, List[Tuple[int, int]]] = {}
+    for layer in source.get('tiles', []):
+        flags = 0
+        for flag_name in layer['flags']:
+            if flag_name not in TILE_FLAG_NAMES:
+                raise MapError(f"Unknown tile flag '{flag_name}' in map {source.get('name')}")
+            flags |= TILE_FLAG_NAMES[flag_name]
+        tiles = layers.setdefault(flags, [])
+        for region in layer.get('regions', []):
+            tiles.extend(_tiles_in(region))
+        tiles.extend(tuple(t) for t in layer.get('tiles', []))
+
+    triggers = [(t['name'], tuple(t['rect'])) for t in source.get('triggers', [])]
+    if len(triggers) > 255:
+        raise MapError(f"Map {source.get('name')} has more than 255 triggers")
+    trigger_tiles = {}
+    for trigger_id, (_, (x, y, w, h)) in enumerate(triggers, start=1):
+        x0, y0 = x // TILE_SIZE, y // TILE_SIZE
+        x1, y1 = (x + w - 1) // TILE_SIZE, (y + h - 1) // TILE_SIZE
+        trigger_tiles[trigger_id] = _tiles_in((x0, y0, x1 - x0 + 1, y1 - y0 + 1))
+
+    grid = compile_tile_grid(width, height, layers, [pygame.Rect(r) for r in rects], trigger_tiles)
+    return pack_map(grid, rects, objects, triggers, source_digest)
+
+
+def pack_map(grid: TileGrid, rects: List[RectTuple], objects: List[Tuple[str, str, RectTuple]],
+             triggers: List[Tuple[str, RectTuple]], source_digest: bytes = NO_SOURCE_HASH) -> bytes:
+    """Serialize already-compiled map parts to the binary map format"""
+    out = [_HEADER.pack(MAP_MAGIC, MAP_VERSION, grid.width, grid.height, len(rects), len(objects),
+                        len(triggers), source_digest),
+           bytes(grid.flags), bytes(grid.triggers)]
+    out.extend(_RECT.pack(*r) for r in rects)
+    for name, sprite, rect in objects:
+        out.append(_pack_str(name))
+        out.append(_pack_str(sprite))
+        out.append(_RECT.pack(*rect))
+    for name, rect in triggers:
+        out.append(_pack_str(name))
+        out.append(_RECT.pack(*rect))
+    return b''.join(out)
+
+
+def _pack_str(value: str) -> bytes:
+    encoded = value.encode('utf-8')
+    return _LEN.pack(len(encoded)) + encoded
+
+
+def compile_map_file(source_path: str, output_path: str) -> int:
+    """Compile one JSON map to a binary map file, returns bytes written"""
+    with open(source_path, 'rb') as f:
+        data = compile_map_source(f.read())
+    with open(output_path, 'wb') as f:
+        f.write(data)
+    return len(data)
+
+
+# ----------------------------------------------------------------------------
+# Runtime loader
+# ----------------------------------------------------------------------------
+
+def parse_map(name: str, buffer) -> MapData:
+    """Parse a compiled map from any buffer (bytes, mmap or memoryview)"""
+    if len(buffer) < _HEADER.size:
+        raise MapError(f"Truncated map: {name}")
+    magic, version, width, height, rect_count, object_count, trigger_count, digest = _HEADER.unpack_from(buffer, 0)
+    if magic != MAP_MAGIC or version != MAP_VERSION:
+        raise MapError(f"Unsupported map format: {name}")
+
+    pos = _HEADER.size
+    size = len(buffer)
+
+    def need(count: int):
+        # Every section is checked against the buffer before it is read
+        if pos + count > size:
+            raise MapError(f"Truncated map: {name} (needs {pos + count} bytes, has {size})")
+
+    area = width * height
+    need(area * 2 + rect_count * _RECT.size)
+    grid = TileGrid(width, height)
+    grid.flags[:] = buffer[pos:pos + area]
+    grid.triggers[:] = buffer[pos + area:pos + area * 2]
+    pos += area * 2
+
+    collision_rects = []
+    for _ in range(rect_count):
+        collision_rects.append(pygame.Rect(_RECT.unpack_from(buffer, pos)))
+        pos += _RECT.size
+
+    def read_str():
+        nonlocal pos
+        need(_LEN.size)
+        (length,) = _LEN.unpack_from(buffer, pos)
+        pos += _LEN.size
+        need(length)
+        try:
+            value = bytes(buffer[pos:pos + length]).decode('utf-8')
+        except UnicodeDecodeError as e:
+            raise MapError(f"Corrupt string in map {name}: {e}") from e
+        pos += length
+        return value
+
+    def read_rect():
+        nonlocal pos
+        need(_RECT.size)
+        rect = pygame.Rect(_RECT.unpack_from(buffer, pos))
+        pos += _RECT.size
+        return rect
+
+    objects = {}
+    for _ in range(object_count):
+        obj_name = read_str()
+        sprite = read_str()
+        objects[obj_name] = MapObject(obj_name, sprite, read_rect())
+
+    triggers = {}
+    for _ in range(trigger_count):
+        trigger_name = read_str()
+        triggers[trigger_name] = read_rect()
+
+    return MapData(name, grid, collision_rects, objects, triggers, digest)
+
+
+def _map_paths(name: str) -> Tuple[str, str]:
+    return f'{MAP_DIR}/{name}.map', f'{MAP_DIR}/{name}.json'
+
+
+def read_map_file(name: str, map_path: str):
+    """
+    Parse a compiled map at a path relative to the asset root
+
+    Reads from the asset pack when present, otherwise memory-maps the
+    loose file. Returns None if neither exists.
+    """
+    from .asset_manager import get_asset_manager
+    asset_manager = get_asset_manager()
+
+    pack = asset_manager.pack
+    if pack is not None and map_path in pack:
+        view = pack.get_view(map_path)
+        try:
+            return parse_map(name, view)
+        finally:
+            view.release()
+
+    full_path = os.path.join(asset_manager.base_path, map_path)
+    if not os.path.exists(full_path) or os.path.getsize(full_path) == 0:
+        return None
+    with open(full_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        return parse_map(name, mapped)
+
+
+def load_map(name: str) -> MapData:
+    """
+    Load a compiled map by name
+
+    Reads from the asset pack when present, otherwise memory-maps the
+    loose .map file. A missing binary, or one whose source hash does not
+    match the current JSON source, is compiled in memory instead, with a
+    warning.
+    """
+    from .asset_manager import get_asset_manager
+    map_path, source_path = _map_paths(name)
+    source = get_asset_manager().load_bytes(source_path)
+
+    map_data = read_map_file(name, map_path)
+    if map_data is not None and (source is None or map_data.source_hash == source_hash(source)):
+        return map_data
+
+    if source is None:
+        raise MapError(f"Map not found: {name}")
+    logger.warning(f"Compiled map {map_path} missing or stale, compiling {source_path}")
+    return parse_map(name, compile_map_source(source))
+
+
+def build_maps(project_root: str) -> List[str]:
+    """Compile every JSON map under MAP_DIR, returns the written paths"""
+    map_dir = os.path.join(project_root, MAP_DIR)
+    written = []
+    for filename in sorted(os.listdir(map_dir)):
+        if filename.endswith('.json'):
+            output = os.path.join(map_dir, filename[:-5] + '.map')
+            compile_map_file(os.path.join(map_dir, filename), output)
+            written.append(output)
+    return written
+
+
+if __name__ == '__main__':
+    root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    for path in build_maps(root):
+        print(f"Compiled {os.path.relpath(path, root)}")
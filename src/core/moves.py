@@ -3,12 +3,18 @@ Move System for Pokemon Faiths
 Moves affect descriptive states, not visible HP numbers
 """
 
-import random
-from typing import Dict, List
+from array import array
+from typing import Dict, Iterable, List, Optional, Tuple
 from core.logger import get_logger
+from core.rng import STREAM_BATTLE, get_stream
 
 logger = get_logger('Moves')
 
+# Damage formula (shared with the batch resolver in core.battle_batch)
+DAMAGE_SCALE = 0.4
+DAMAGE_VARIANCE_MIN = 0.85
+DAMAGE_VARIANCE_MAX = 1.0
+
 class Move:
     """
     Represents a Pokemon move
@@ -17,13 +23,16 @@ class Move:
 
     def __init__(self, name: str, move_type: str, category: str,
                  base_power: int, accuracy: float = 1.0,
-                 description: str = ""):
+                 description: str = "", pp: int = 20):
         self.name = name
+        self.id = None  # Assigned by MoveDatabase.add_move
         self.move_type = move_type  # fire, water, physical, etc.
+        self.type_id = type_id(move_type)
         self.category = category    # 'physical', 'special', 'status'
         self.base_power = base_power  # Hidden from player
         self.accuracy = accuracy
         self.description = description
+        self.pp = pp
 
         # Narrative feedback for hits
         self.hit_descriptions = [
@@ -39,22 +48,24 @@ class Move:
         ]
 
     def calculate_damage(self, attacker_stat: int, defender_stat: int,
-                        type_effectiveness: float = 1.0) -> float:
+                        type_effectiveness: float = 1.0, rng=None) -> float:
         """
         Calculate damage amount (hidden from player)
         Returns damage as percentage of HP
         """
         if self.category == 'status':
             return 0
+        if rng is None:
+            rng = get_stream(STREAM_BATTLE)
 
         # Base damage calculation
-        damage = (self.base_power * (attacker_stat / defender_stat) * 0.4)
+        damage = (self.base_power * (attacker_stat / defender_stat) * DAMAGE_SCALE)
 
         # Type effectiveness multiplier
         damage *= type_effectiveness
 
         # Random variance (0.85 to 1.0)
-        damage *= random.uniform(0.85, 1.0)
+        damage *= rng.uniform(DAMAGE_VARIANCE_MIN, DAMAGE_VARIANCE_MAX)
 
         return damage
 
@@ -63,7 +74,9 @@ class Move:
         Convert type effectiveness to narrative description
         NO NUMBERS shown to player
         """
-        if effectiveness >= 2.0:
+        if effectiveness >= 4.0:
+            return "It's overwhelmingly effective!"
+        elif effectiveness >= 2.0:
             return "It's devastatingly effective!"
         elif effectiveness >= 1.5:
             return "It's very effective!"
@@ -71,35 +84,53 @@ class Move:
             return ""
         elif effectiveness >= 0.5:
             return "It doesn't seem very effective..."
-        else:
+        elif effectiveness > 0:
             return "It barely has any effect..."
+        else:
+            return "It has no effect..."
+
+    def render_narrative(self, hit: bool, variant: int, effectiveness: float = 1.0) -> str:
+        """Narrative line for a hit/miss, variant picks among the descriptions"""
+        if not hit:
+            return self.miss_descriptions[variant]
+        narrative = self.hit_descriptions[variant]
+        effectiveness_text = self.get_effectiveness_description(effectiveness)
+        if effectiveness_text:
+            narrative += f" {effectiveness_text}"
+        return narrative
 
-    def execute(self, attacker, defender, type_chart) -> Dict:
+    def execute(self, attacker, defender, type_chart, rng=None) -> Dict:
         """
         Execute the move in battle
         Returns dict with narrative results (no numbers shown to player)
+
+        rng: Random source for hit, variance and narrative rolls (default: the battle stream)
         """
+        if rng is None:
+            rng = get_stream(STREAM_BATTLE)
         result = {
             'move_name': self.name,
             'hit': False,
             'effectiveness': 1.0,
             'damage': 0,
+            'variant': 0,  # Which narrative description was used
             'narrative': "",
             'descriptive_result': ""
         }
 
         # Check for hit
-        hit_roll = random.random()
+        hit_roll = rng.random()
         if hit_roll > self.accuracy:
-            result['narrative'] = random.choice(self.miss_descriptions)
+            result['variant'] = rng.randrange(len(self.miss_descriptions))
+            result['narrative'] = self.render_narrative(False, result['variant'])
             result['descriptive_result'] = "The attack missed!"
             return result
 
         result['hit'] = True
 
         # Calculate type effectiveness
-        effectiveness = type_chart.get_effectiveness(self.move_type,
-                                                    defender.species)
+        effectiveness = type_chart.effectiveness(self.type_id,
+                                                 type_chart.get_species_types(defender.species))
         result['effectiveness'] = effectiveness
 
         # Calculate damage (hidden from player)
@@ -113,31 +144,32 @@ class Move:
             attacker_stat = 50
             defender_stat = 50
 
-        damage = self.calculate_damage(attacker_stat, defender_stat, effectiveness)
+        damage = self.calculate_damage(attacker_stat, defender_stat, effectiveness, rng)
         result['damage'] = damage
 
         # Apply damage to defender
         damage_result = defender.take_damage(damage, self.move_type, 'body')
 
         # Build narrative description (what player sees)
-        narrative = random.choice(self.hit_descriptions)
-        effectiveness_text = self.get_effectiveness_description(effectiveness)
-
-        if effectiveness_text:
-            narrative += f" {effectiveness_text}"
-
-        result['narrative'] = narrative
+        result['variant'] = rng.randrange(len(self.hit_descriptions))
+        result['narrative'] = self.render_narrative(True, result['variant'], effectiveness)
         result['descriptive_result'] = damage_result['new_state']
 
         # Note if injury occurred
         if damage_result.get('injury'):
             injury = damage_result['injury']
             result['injury_occurred'] = True
+            result['injury_type'] = injury['type']
             result['injury_description'] = injury['description']
             logger.warning(f"Move {self.name} caused injury: {injury['type']}")
 
         return result
 
+    def save_entry(self) -> Dict:
+        """Moveset entry as stored in party dicts"""
+        return {'name': self.name, 'pp': self.pp, 'max_pp': self.pp, 'power': self.base_power,
+                'type': self.move_type.capitalize()}
+
     def __str__(self):
         return f"{self.name} ({self.move_type})"
 
@@ -150,6 +182,9 @@ class MoveDatabase:
 
     def __init__(self):
         self.moves = {}
+        self.moves_by_id: List[Move] = []
+        self.ids: Dict[str, int] = {}  # Exact and lowercase names -> id
+        self._table: Optional['MoveTable'] = None
         self._initialize_basic_moves()
 
     def _initialize_basic_moves(self):
@@ -162,7 +197,8 @@ class MoveDatabase:
             category="physical",
             base_power=40,
             accuracy=0.95,
-            description="A straightforward physical attack"
+            description="A straightforward physical attack",
+            pp=35
         ))
 
         self.add_move(Move(
@@ -171,7 +207,8 @@ class MoveDatabase:
             category="physical",
             base_power=35,
             accuracy=1.0,
-            description="Rakes claws across the opponent"
+            description="Rakes claws across the opponent",
+            pp=35
         ))
 
         self.add_move(Move(
@@ -180,7 +217,8 @@ class MoveDatabase:
             category="physical",
             base_power=60,
             accuracy=0.90,
-            description="Vicious bite that can cause flinching"
+            description="Vicious bite that can cause flinching",
+            pp=25
         ))
 
         # Special moves
@@ -190,7 +228,8 @@ class MoveDatabase:
             category="special",
             base_power=40,
             accuracy=0.95,
-            description="Small flames that can burn"
+            description="Small flames that can burn",
+            pp=25
         ))
 
         self.add_move(Move(
@@ -199,7 +238,8 @@ class MoveDatabase:
             category="special",
             base_power=40,
             accuracy=0.95,
-            description="Sprays water at the opponent"
+            description="Sprays water at the opponent",
+            pp=25
         ))
 
         # Strong moves (for veteran Pokemon)
@@ -209,7 +249,8 @@ class MoveDatabase:
             category="physical",
             base_power=85,
             accuracy=0.85,
-            description="Full-body tackle with tremendous force"
+            description="Full-body tackle with tremendous force",
+            pp=15
         ))
 
         self.add_move(Move(
@@ -218,94 +259,170 @@ class MoveDatabase:
             category="special",
             base_power=90,
             accuracy=0.90,
-            description="Intense flames that can severely burn"
+            description="Intense flames that can severely burn",
+            pp=15
+        ))
+
+        # Added after the originals so their move ids stay the same
+        self.add_move(Move(
+            name="Vine Whip",
+            move_type="grass",
+            category="physical",
+            base_power=45,
+            accuracy=1.0,
+            description="Lashes the opponent with slender vines",
+            pp=25
         ))
 
         logger.info(f"Move database initialized with {len(self.moves)} moves")
 
     def add_move(self, move: Move):
-        """Add a move to the database"""
+        """Add a move to the database, assigning its integer id"""
+        move.id = len(self.moves_by_id)
+        self.moves_by_id.append(move)
         self.moves[move.name.lower()] = move
+        self.ids[move.name] = self.ids[move.name.lower()] = move.id
+        self._table = None
+
+    def get_move_id(self, name: str) -> Optional[int]:
+        """Move id by name (exact names skip the lowercase fallback)"""
+        move_id = self.ids.get(name)
+        if move_id is None:
+            move_id = self.ids.get(name.lower())
+        return move_id
 
     def get_move(self, name: str) -> Move:
         """Get a move by name"""
-        return self.moves.get(name.lower())
+        move_id = self.get_move_id(name)
+        return None if move_id is None else self.moves_by_id[move_id]
+
+    def get_move_by_id(self, move_id: int) -> Move:
+        """Get a move by its integer id"""
+        return self.moves_by_id[move_id]
 
     def get_random_moves(self, count: int = 4) -> List[Move]:
         """Get random moves for a Pokemon"""
-        move_list = list(self.moves.values())
-        if len(move_list) <= count:
-            return move_list
-        return random.sample(move_list, count)
+        if len(self.moves_by_id) <= count:
+            return list(self.moves_by_id)
+        return get_stream(STREAM_BATTLE).sample(self.moves_by_id, count)
 
+    @property
+    def table(self) -> 'MoveTable':
+        """Compiled columns of every move, rebuilt only after add_move"""
+        if self._table is None:
+            self._table = MoveTable(self.moves_by_id)
+        return self._table
 
-class TypeChart:
+
+class MoveTable:
     """
-    Type effectiveness chart
-    Simplified for initial implementation
+    Struct-of-arrays view of the move database, indexed by move id
+
+    Hot loops (the enemy AI search, batch damage) read these columns
+    instead of Move attributes; status moves have power 0.
     """
 
-    def __init__(self):
-        # Type effectiveness multipliers
-        # Format: effectiveness[move_type][defender_type] = multiplier
-        self.effectiveness = {
-            'normal': {
-                'default': 1.0
-            },
-            'fire': {
-                'grass': 2.0,
-                'water': 0.5,
-                'fire': 0.5,
-                'default': 1.0
-            },
-            'water': {
-                'fire': 2.0,
-                'grass': 0.5,
-                'water': 0.5,
-                'default': 1.0
-            },
-            'grass': {
-                'water': 2.0,
-                'fire': 0.5,
-                'grass': 0.5,
-                'default': 1.0
-            },
-            'dark': {
-                'psychic': 2.0,
-                'dark': 0.5,
-                'default': 1.0
-            }
-        }
+    __slots__ = ('power', 'accuracy', 'type_id', 'pp')
+
+    def __init__(self, moves: List[Move]):
+        self.power = array('H', (0 if move.category == 'status' else move.base_power for move in moves))
+        self.accuracy = array('d', (move.accuracy for move in moves))
+        self.type_id = array('B', (move.type_id for move in moves))
+        self.pp = array('H', (move.pp for move in moves))
+
+    def __len__(self) -> int:
+        return len(self.power)
+
+    def columns(self, move_ids: Iterable[int]) -> Tuple[array, array]:
+        """Power and accuracy columns for a sequence of move ids (battle_batch inputs)"""
+        move_ids = list(move_ids)
+        return (array('d', (self.power[i] for i in move_ids)),
+                array('d', (self.accuracy[i] for i in move_ids)))
+
+
+# Types are interned to small integer ids once; battles only see the ids
+TYPE_NAMES = ('normal', 'fire', 'water', 'grass', 'electric', 'ice', 'fighting', 'poison', 'ground',
+              'flying', 'psychic', 'bug', 'rock', 'ghost', 'dragon', 'dark', 'steel', 'fairy')
+TYPE_IDS = {name: index for index, name in enumerate(TYPE_NAMES)}
+TYPE_NONE = len(TYPE_NAMES)  # Second type of single-typed species, always 1.0
+
+# Non-neutral matchups: attacking type -> {multiplier: defending types}
+TYPE_MATCHUPS = {
+    'normal': {0.5: ('rock', 'steel'), 0.0: ('ghost',)},
+    'fire': {2.0: ('grass', 'ice', 'bug', 'steel'), 0.5: ('fire', 'water', 'rock', 'dragon')},
+    'water': {2.0: ('fire', 'ground', 'rock'), 0.5: ('water', 'grass', 'dragon')},
+    'grass': {2.0: ('water', 'ground', 'rock'),
+              0.5: ('fire', 'grass', 'poison', 'flying', 'bug', 'dragon', 'steel')},
+    'electric': {2.0: ('water', 'flying'), 0.5: ('electric', 'grass', 'dragon'), 0.0: ('ground',)},
+    'ice': {2.0: ('grass', 'ground', 'flying', 'dragon'), 0.5: ('fire', 'water', 'ice', 'steel')},
+    'fighting': {2.0: ('normal', 'ice', 'rock', 'dark', 'steel'),
+                 0.5: ('poison', 'flying', 'psychic', 'bug', 'fairy'), 0.0: ('ghost',)},
+    'poison': {2.0: ('grass', 'fairy'), 0.5: ('poison', 'ground', 'rock', 'ghost'), 0.0: ('steel',)},
+    'ground': {2.0: ('fire', 'electric', 'poison', 'rock', 'steel'), 0.5: ('grass', 'bug'), 0.0: ('flying',)},
+    'flying': {2.0: ('grass', 'fighting', 'bug'), 0.5: ('electric', 'rock', 'steel')},
+    'psychic': {2.0: ('fighting', 'poison'), 0.5: ('psychic', 'steel'), 0.0: ('dark',)},
+    'bug': {2.0: ('grass', 'psychic', 'dark'),
+            0.5: ('fire', 'fighting', 'poison', 'flying', 'ghost', 'steel', 'fairy')},
+    'rock': {2.0: ('fire', 'ice', 'flying', 'bug'), 0.5: ('fighting', 'ground', 'steel')},
+    'ghost': {2.0: ('psychic', 'ghost'), 0.5: ('dark',), 0.0: ('normal',)},
+    'dragon': {2.0: ('dragon',), 0.5: ('steel',), 0.0: ('fairy',)},
+    'dark': {2.0: ('psychic', 'ghost'), 0.5: ('fighting', 'dark', 'fairy')},
+    'steel': {2.0: ('ice', 'rock', 'fairy'), 0.5: ('fire', 'water', 'electric', 'steel')},
+    'fairy': {2.0: ('fighting', 'dragon', 'dark'), 0.5: ('fire', 'poison', 'steel')},
+}
+
+def type_id(name: str) -> int:
+    """Interned id of a type name (case-insensitive)"""
+    try:
+        return TYPE_IDS[name.lower()]
+    except KeyError:
+        raise ValueError(f"Unknown type: {name}") from None
 
-    def get_effectiveness(self, move_type: str, defender_species: str) -> float:
-        """
-        Get type effectiveness multiplier
-        For now, simplified - just use move type vs defender type
-        """
-        # TODO: Map species to types (for now use simple mapping)
-        defender_type = self._get_species_type(defender_species)
 
-        if move_type not in self.effectiveness:
-            return 1.0
+class TypeChart:
+    """
+    Type effectiveness chart
 
-        type_matchups = self.effectiveness[move_type]
-        return type_matchups.get(defender_type, type_matchups.get('default', 1.0))
+    A dense (types x types+1) matrix indexed by interned type ids, plus a
+    species -> (type, type) index built once. Single-typed species use
+    TYPE_NONE as their second type, so every lookup multiplies two cells.
+    """
 
-    def _get_species_type(self, species: str) -> str:
-        """
-        Map species to primary type
-        Temporary simple mapping - expand later
-        """
-        species_lower = species.lower()
-
-        if 'fire' in species_lower or species_lower in ['charmander', 'vulpix']:
-            return 'fire'
-        elif 'water' in species_lower or species_lower in ['squirtle', 'psyduck']:
-            return 'water'
-        elif 'grass' in species_lower or species_lower in ['bulbasaur', 'oddish']:
-            return 'grass'
-        else:
-            return 'normal'
+    def __init__(self, species_types: Optional[Dict[str, Iterable[str]]] = None):
+        self.width = TYPE_NONE + 1
+        self.matrix = array('d', [1.0]) * (len(TYPE_NAMES) * self.width)
+        for attacker, matchups in TYPE_MATCHUPS.items():
+            row = TYPE_IDS[attacker] * self.width
+            for multiplier, defenders in matchups.items():
+                for defender in defenders:
+                    self.matrix[row + TYPE_IDS[defender]] = multiplier
+
+        if species_types is None:
+            from core.species import get_species_registry
+            species_types = {species.name: species.types for species in get_species_registry()}
+        self.species_types: Dict[str, Tuple[int, int]] = {}
+        for species, types in species_types.items():
+            self.register_species(species, types)
+
+    def register_species(self, species: str, types: Iterable[str]):
+        """Index a species' one or two types"""
+        ids = [type_id(name) for name in types][:2]
+        if not ids:
+            raise ValueError(f"Species {species} has no type")
+        self.species_types[species] = (ids[0], ids[1] if len(ids) > 1 else TYPE_NONE)
+
+    def get_species_types(self, species: str) -> Tuple[int, int]:
+        """Type ids of a species (unknown species are Normal)"""
+        return self.species_types.get(species, (TYPE_IDS['normal'], TYPE_NONE))
+
+    def effectiveness(self, move_type_id: int, defender_types: Tuple[int, int]) -> float:
+        """Multiplier of an attacking type id against a (type, type) pair"""
+        row = move_type_id * self.width
+        return self.matrix[row + defender_types[0]] * self.matrix[row + defender_types[1]]
+
+    def get_effectiveness(self, move_type: str, defender_species: str) -> float:
+        """Get type effectiveness multiplier of a move type against a species"""
+        return self.effectiveness(type_id(move_type), self.get_species_types(defender_species))
 
 
 # Global instances
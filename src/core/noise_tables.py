@@ -0,0 +1,80 @@
+"""
+Precomputed Noise Tables for Pokemon Faiths
+Replaces runtime opensimplex calls on the start screen with table lookups
+
+The table stores opensimplex.noise2(x, 0) sampled over [0, NOISE_TABLE_RANGE)
+as little-endian float32 values. It ships in assets/data/ and is rebuilt with:
+    python src/core/noise_tables.py
+"""
+
+import os
+import sys
+from array import array
+from typing import Optional
+
+NOISE_TABLE_FILE = 'assets/data/noise_table.bin'
+NOISE_TABLE_RANGE = 1024      # Noise x coordinates covered before wrapping
+NOISE_TABLE_RESOLUTION = 32   # Samples per unit of x
+
+_table: Optional[array] = None
+_table_size = NOISE_TABLE_RANGE * NOISE_TABLE_RESOLUTION
+
+
+def _load_table() -> array:
+    """Load the shipped table, or compute it with opensimplex if it is missing"""
+    from .asset_manager import get_asset_manager
+    from .logger import get_logger
+    logger = get_logger('NoiseTables')
+
+    data = get_asset_manager().load_bytes(NOISE_TABLE_FILE)
+    if data is not None and len(data) == _table_size * 4:
+        table = array('f')
+        table.frombytes(data)
+        if sys.byteorder != 'little':
+            table.byteswap()
+        return table
+
+    logger.warning(f"Noise table missing or invalid ({NOISE_TABLE_FILE}), computing with opensimplex")
+    return build_noise_table()
+
+
+def build_noise_table() -> array:
+    """Sample opensimplex.noise2(x, 0) into a float32 table (slow, build-time only)"""
+    import opensimplex
+    step = 1.0 / NOISE_TABLE_RESOLUTION
+    return array('f', (opensimplex.noise2(i * step, 0) for i in range(_table_size)))
+
+
+def noise1(x: float) -> float:
+    """
+    Smooth 1D noise in [-1, 1], matching opensimplex.noise2(x, 0)
+
+    Linearly interpolates the precomputed table; x wraps every NOISE_TABLE_RANGE.
+    """
+    global _table
+    if _table is None:
+        _table = _load_table()
+
+    position = (x % NOISE_TABLE_RANGE) * NOISE_TABLE_RESOLUTION
+    index = int(position)
+    frac = position - index
+    a = _table[index % _table_size]
+    b = _table[(index + 1) % _table_size]
+    return a + (b - a) * frac
+
+
+def write_noise_table(output_path: str) -> int:
+    """Build the table and write it as little-endian float32, returns bytes written"""
+    table = build_noise_table()
+    if sys.byteorder != 'little':
+        table.byteswap()
+    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    with open(output_path, 'wb') as f:
+        table.tofile(f)
+    return len(table) * table.itemsize
+
+
+if __name__ == '__main__':
+    root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    size = write_noise_table(os.path.join(root, NOISE_TABLE_FILE))
+    print(f"Wrote {size} bytes to {NOISE_TABLE_FILE}")
@@ -0,0 +1,205 @@
+"""
+Pathfinding for Pokemon Faiths
+A* with an LRU path cache and shared flow fields over the compiled tile grid
+"""
+
+import heapq
+from array import array
+from collections import OrderedDict
+from typing import List, Optional, Tuple
+from constants import TILE_SIZE
+from .tile_grid import TILE_SOLID, TileGrid
+
+Tile = Tuple[int, int]
+
+# 4-directional movement, matching the player
+DIRECTIONS = ((0, -1), (0, 1), (-1, 0), (1, 0))
+UNREACHABLE = 0xFFFF
+NO_STEP = -1
+
+
+def tile_center(tile: Tile) -> Tuple[int, int]:
+    """World pixel position of a tile's center"""
+    return tile[0] * TILE_SIZE + TILE_SIZE // 2, tile[1] * TILE_SIZE + TILE_SIZE // 2
+
+
+class FlowField:
+    """
+    Distance-to-goal and best-step arrays for every tile
+
+    Built once per goal with a breadth-first search, then any number of
+    agents read their next step with a single indexed lookup.
+    """
+
+    __slots__ = ('width', 'height', 'goal', 'version', 'distance', 'steps')
+
+    def __init__(self, grid: TileGrid, goal: Tile, blocked: int = TILE_SOLID):
+        self.width = grid.width
+        self.height = grid.height
+        self.goal = goal
+        self.version = grid.version
+        size = self.width * self.height
+        self.distance = array('H', [UNREACHABLE]) * size
+        self.steps = array('b', [NO_STEP]) * size
+        if grid.in_bounds(*goal):
+            self._build(grid, blocked)
+
+    def _build(self, grid: TileGrid, blocked: int):
+        width, height = self.width, self.height
+        flags = grid.flags
+        distance = self.distance
+        steps = self.steps
+
+        goal_index = self.goal[1] * width + self.goal[0]
+        distance[goal_index] = 0
+        frontier = [goal_index]
+        while frontier:
+            next_frontier = []
+            for index in frontier:
+                x, y = index % width, index // width
+                next_distance = distance[index] + 1
+                for direction, (dx, dy) in enumerate(DIRECTIONS):
+                    nx, ny = x + dx, y + dy
+                    if not (0 <= nx < width and 0 <= ny < height):
+                        continue
+                    n_index = ny * width + nx
+                    if distance[n_index] != UNREACHABLE or flags[n_index] & blocked:
+                        continue
+                    distance[n_index] = next_distance
+                    # The neighbour reaches the goal by stepping back towards this tile
+                    steps[n_index] = direction ^ 1
+                    next_frontier.append(n_index)
+            frontier = next_frontier
+
+    def next_step(self, tile: Tile) -> Optional[Tile]:
+        """Neighbouring tile to move to, None at the goal or if unreachable"""
+        x, y = tile
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            return None
+        step = self.steps[y * self.width + x]
+        if step == NO_STEP:
+            return None
+        dx, dy = DIRECTIONS[step]
+        return x + dx, y + dy
+
+    def distance_at(self, tile: Tile) -> Optional[int]:
+        """Steps to the goal, None if unreachable"""
+        x, y = tile
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            return None
+        value = self.distance[y * self.width + x]
+        return None if value == UNREACHABLE else value
+
+
+class Pathfinder:
+    """
+    Path queries over one map's TileGrid
+
+    Results are cached (A* paths in an LRU, flow fields per goal) and the
+    caches are dropped automatically when the grid's version changes.
+    """
+
+    def __init__(self, grid: TileGrid, path_cache_size: int = 256, field_cache_size: int = 8,
+                 blocked: int = TILE_SOLID):
+        self.grid = grid
+        self.blocked = blocked
+        self.path_cache_size = path_cache_size
+        self.field_cache_size = field_cache_size
+        self._paths: 'OrderedDict[Tuple[Tile, Tile], Optional[Tuple[Tile, ...]]]' = OrderedDict()
+        self._fields: 'OrderedDict[Tile, FlowField]' = OrderedDict()
+        self._version = grid.version
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    def _check_version(self):
+        if self.grid.version != self._version:
+            self._paths.clear()
+            self._fields.clear()
+            self._version = self.grid.version
+
+    def is_walkable(self, tile: Tile) -> bool:
+        x, y = tile
+        return self.grid.in_bounds(x, y) and not self.grid.flags[y * self.grid.width + x] & self.blocked
+
+    def find_path(self, start: Tile, goal: Tile) -> Optional[List[Tile]]:
+        """
+        Shortest 4-directional path from start to goal (both included)
+
+        Returns:
+            List of tiles, or None if the goal cannot be reached
+        """
+        self._check_version()
+        key = (start, goal)
+        if key in self._paths:
+            self._paths.move_to_end(key)
+            self.cache_hits += 1
+            path = self._paths[key]
+            return list(path) if path is not None else None
+
+        self.cache_misses += 1
+        path = self._astar(start, goal)
+        self._paths[key] = tuple(path) if path is not None else None
+        if len(self._paths) > self.path_cache_size:
+            self._paths.popitem(last=False)
+        return path
+
+    def _astar(self, start: Tile, goal: Tile) -> Optional[List[Tile]]:
+        if not self.is_walkable(start) or not self.is_walkable(goal):
+            return None
+        if start == goal:
+            return [start]
+
+        grid = self.grid
+        width, height = grid.width, grid.height
+        flags = grid.flags
+        blocked = self.blocked
+        gx, gy = goal
+        goal_index = gy * width + gx
+        start_index = start[1] * width + start[0]
+
+        came_from = {start_index: -1}
+        cost = {start_index: 0}
+        # (f, h, g, index); h breaks ties towards tiles closer to the goal
+        start_h = abs(start[0] - gx) + abs(start[1] - gy)
+        open_heap = [(start_h, start_h, 0, start_index)]
+        while open_heap:
+            _, _, g, index = heapq.heappop(open_heap)
+            if index == goal_index:
+                path = []
+                while index != -1:
+                    path.append((index % width, index // width))
+                    index = came_from[index]
+                path.reverse()
+                return path
+            if g > cost[index]:
+                continue  # Stale heap entry
+
+            x, y = index % width, index // width
+            for dx, dy in DIRECTIONS:
+                nx, ny = x + dx, y + dy
+                if not (0 <= nx < width and 0 <= ny < height):
+                    continue
+                n_index = ny * width + nx
+                if flags[n_index] & blocked:
+                    continue
+                n_cost = g + 1
+                if n_cost < cost.get(n_index, UNREACHABLE):
+                    cost[n_index] = n_cost
+                    came_from[n_index] = index
+                    h = abs(nx - gx) + abs(ny - gy)
+                    heapq.heappush(open_heap, (n_cost + h, h, n_cost, n_index))
+        return None
+
+    def flow_field(self, goal: Tile) -> FlowField:
+        """Shared flow field towards goal, rebuilt only when the goal or grid changes"""
+        self._check_version()
+        field = self._fields.get(goal)
+        if field is not None:
+            self._fields.move_to_end(goal)
+            return field
+
+        field = FlowField(self.grid, goal, self.blocked)
+        self._fields[goal] = field
+        if len(self._fields) > self.field_cache_size:
+            self._fields.popitem(last=False)
+        return field
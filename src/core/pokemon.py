@@ -6,11 +6,28 @@ Implements the Veteran System with battle logging and descriptive states
 import time
 import math
 from collections import deque
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Sequence
 from core.logger import get_logger
+from core.species import Species, get_species
+from core.rng import STREAM_INJURY, get_stream
+from core.moves import Move, get_move_database
 
 logger = get_logger('Pokemon')
 
+
+def describe_injury(injury_type: str, location: str) -> str:
+    """Narrative description of an injury (also used to replay battle events)"""
+    descriptions = {
+        'deep_scar': f"Deep scar across {location} — a permanent reminder of near-death",
+        'burn_scar': f"Scorched tissue on {location} — the fire's mark remains",
+        'lost_eye': f"Eye destroyed — vision gone but instincts sharpen",
+        'broken_limb': f"Fractured {location} — movement forever altered",
+        'lost_limb': f"{location} severed — they will never be the same",
+        'emotional_trauma': f"Something broke inside — the haunted look won't fade"
+    }
+    return descriptions.get(injury_type, f"Injury to {location}")
+
+
 class Pokemon:
     """
     Pokemon with Veteran System progression
@@ -26,9 +43,13 @@ class Pokemon:
     INJURY_THRESHOLD_MAJOR = 80
     INJURY_THRESHOLD_CATASTROPHIC = 95
 
-    def __init__(self, species: str, nickname: str = None, age_years: int = 0):
+    MAX_MOVES = 4
+
+    def __init__(self, species: str, nickname: str = None, age_years: int = 0,
+                 moves: Optional[Sequence[str]] = None):
         # Basic info
         self.species = species
+        self.species_data: Species = get_species(species)  # Shared record, stats are not copied
         self.nickname = nickname or species
         self.age_years = age_years  # Age when caught (wild Pokemon can be 100+ years)
         self.pokeball_age = 0  # Years since capture (max 100 unless caught old)
@@ -37,6 +58,15 @@ class Pokemon:
         self.battle_log = deque(maxlen=self.MAX_BATTLE_LOG_SIZE)
         self.total_battles = 0
 
+        # Learned moveset as move ids (the species' default moves unless given, e.g. from a save)
+        self.moves: List[int] = []
+        for move_name in (moves or ()):
+            self.learn_move(move_name)
+        if not self.moves:
+            # Nothing usable saved (renamed or misspelled moves): battles need at least one move
+            for move_name in self.species_data.moves:
+                self.learn_move(move_name)
+
         # Permanent injuries (never decay)
         self.permanent_injuries = []
 
@@ -44,11 +74,6 @@ class Pokemon:
         self.has_vos = False  # Will of the Struggler
         self.prosthetics = []
 
-        # Base stats (hidden from player, used for calculations)
-        self.base_attack = 50
-        self.base_defense = 50
-        self.base_speed = 50
-
         # Current descriptive state (what player sees)
         self.current_hp_percent = 100  # Internal tracking only
         self.state_description = "Standing strong, ready for battle"
@@ -63,6 +88,39 @@ class Pokemon:
 
         logger.debug(f"Created Pokemon: {self.nickname} ({self.species}), Age: {self.age_years}")
 
+    def learn_move(self, move_name: str) -> bool:
+        """Add a move to the moveset, False if unknown, already known or the moveset is full"""
+        move_id = get_move_database().get_move_id(move_name)
+        if move_id is None:
+            logger.warning(f"{self.nickname} cannot learn unknown move {move_name}")
+            return False
+        if move_id in self.moves or len(self.moves) >= self.MAX_MOVES:
+            return False
+        self.moves.append(move_id)
+        return True
+
+    def get_moves(self) -> List[Move]:
+        """Moveset resolved to Move objects (done once per battle)"""
+        moves_by_id = get_move_database().moves_by_id
+        return [moves_by_id[move_id] for move_id in self.moves]
+
+    def moveset_entries(self) -> List[Dict]:
+        """Moveset in the party dict format stored in saves"""
+        return [move.save_entry() for move in self.get_moves()]
+
+    # Base stats (hidden from player, used for calculations)
+    @property
+    def base_attack(self) -> int:
+        return self.species_data.attack
+
+    @property
+    def base_defense(self) -> int:
+        return self.species_data.defense
+
+    @property
+    def base_speed(self) -> int:
+        return self.species_data.speed
+
     def get_descriptive_state(self) -> str:
         """
         Return text description of Pokemon's state instead of HP bar
@@ -265,8 +323,7 @@ class Pokemon:
         # VoS holders largely bypass injury
         if self.has_vos:
             # 90% injury resistance for VoS
-            import random
-            if random.random() < 0.9:
+            if get_stream(STREAM_INJURY).random() < 0.9:
                 logger.info(f"{self.nickname} (VoS) resisted potential injury")
                 return None
 
@@ -308,15 +365,7 @@ class Pokemon:
 
     def _get_injury_description(self, injury_type: str, location: str) -> str:
         """Get narrative description of injury"""
-        descriptions = {
-            'deep_scar': f"Deep scar across {location} — a permanent reminder of near-death",
-            'burn_scar': f"Scorched tissue on {location} — the fire's mark remains",
-            'lost_eye': f"Eye destroyed — vision gone but instincts sharpen",
-            'broken_limb': f"Fractured {location} — movement forever altered",
-            'lost_limb': f"{location} severed — they will never be the same",
-            'emotional_trauma': f"Something broke inside — the haunted look won't fade"
-        }
-        return descriptions.get(injury_type, f"Injury to {location}")
+        return describe_injury(injury_type, location)
 
     def apply_injury_modifiers(self) -> Dict[str, float]:
         """
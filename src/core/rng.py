@@ -0,0 +1,110 @@
+"""
+Random Streams for Pokemon Faiths
+Named, independently seeded random streams for reproducible gameplay
+
+Each subsystem draws from its own stream, so cosmetic effects or an
+extra encounter roll never shift the numbers a battle sees:
+    battle      hit rolls, damage variance, narration, AI/random policies
+    encounter   encounter steps, species, levels
+    injury      injury resistance rolls
+    cosmetic    visual effects only
+
+Every stream's seed is derived from one master seed and its name, so a
+master seed reproduces a whole session. spawn(i) derives a child service
+per worker (seed, i), giving each parallel worker its own sequences.
+Stream state can be exported to JSON-safe data and restored for replays;
+the save file carries it (see SaveManager), so a loaded game continues
+the same sequences.
+"""
+
+import base64
+import hashlib
+import os
+import random
+import struct
+from typing import Dict, Optional
+from .logger import get_logger
+
+logger = get_logger('RNG')
+
+STREAM_BATTLE = 'battle'
+STREAM_ENCOUNTER = 'encounter'
+STREAM_INJURY = 'injury'
+STREAM_COSMETIC = 'cosmetic'
+STREAMS = (STREAM_BATTLE, STREAM_ENCOUNTER, STREAM_INJURY, STREAM_COSMETIC)
+
+
+def derive_seed(seed: int, name: str) -> int:
+    """64-bit seed for a named child of a seed (stable across runs and platforms)"""
+    digest = hashlib.blake2b(f'{seed}:{name}'.encode('utf-8'), digest_size=8).digest()
+    return int.from_bytes(digest, 'little')
+
+
+class RNGService:
+    """A set of named random.Random streams derived from one master seed"""
+
+    def __init__(self, seed: Optional[int] = None):
+        self.seed = seed if seed is not None else int.from_bytes(os.urandom(8), 'little')
+        self.streams: Dict[str, random.Random] = {}
+
+    def stream(self, name: str) -> random.Random:
+        """The named stream, created on first use"""
+        rng = self.streams.get(name)
+        if rng is None:
+            rng = self.streams[name] = random.Random(derive_seed(self.seed, name))
+        return rng
+
+    def spawn(self, index: int) -> 'RNGService':
+        """Child service for parallel worker/chunk `index`"""
+        return RNGService(derive_seed(self.seed, f'worker{index}'))
+
+    def get_state(self) -> Dict:
+        """JSON-safe snapshot of the master seed and every stream created so far"""
+        streams = {}
+        for name, rng in self.streams.items():
+            version, internal, gauss_next = rng.getstate()
+            # 625 uint32 words per stream, base64 so the save file stays small
+            packed = struct.pack(f'<{len(internal)}I', *internal)
+            streams[name] = [version, base64.b64encode(packed).decode('ascii'), gauss_next]
+        return {'seed': self.seed, 'streams': streams}
+
+    def set_state(self, state: Dict):
+        """
+        Restore a get_state() snapshot (streams not in it restart from their seed)
+
+        Streams are restored in place, so references held by callers stay valid.
+        """
+        self.seed = state['seed']
+        saved = state.get('streams', {})
+        for name, rng in self.streams.items():
+            if name not in saved:
+                rng.seed(derive_seed(self.seed, name))
+        for name, (version, internal, gauss_next) in saved.items():
+            packed = base64.b64decode(internal)
+            if len(packed) % 4:
+                raise ValueError(f"Corrupt state for stream {name}")
+            self.stream(name).setstate((version, struct.unpack(f'<{len(packed) // 4}I', packed), gauss_next))
+
+
+_rng: Optional[RNGService] = None
+
+
+def get_rng() -> RNGService:
+    """Get the global RNG service, creating it with a fresh seed if needed"""
+    global _rng
+    if _rng is None:
+        _rng = RNGService()
+        logger.info(f"RNG seed: {_rng.seed}")
+    return _rng
+
+
+def set_rng(service: RNGService) -> Optional[RNGService]:
+    """Replace the global RNG service (e.g. seeded for a replay), returns the previous one"""
+    global _rng
+    previous, _rng = _rng, service
+    return previous
+
+
+def get_stream(name: str) -> random.Random:
+    """Shortcut for get_rng().stream(name)"""
+    return get_rng().stream(name)
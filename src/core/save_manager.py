@@ -7,6 +7,7 @@ import json
 import os
 from datetime import datetime
 from .logger import get_logger
+from .rng import RNGService, get_rng, set_rng
 
 logger = get_logger('SaveManager')
 
@@ -37,6 +38,8 @@ class SaveManager:
     def create_new_save(self, player_name, player_gender='male'):
         """Create a new save file with initial data"""
         try:
+            # A new game gets its own master seed, recorded with every save
+            set_rng(RNGService())
             save_data = {
                 'version': '0.1.0',
                 'created_at': datetime.now().isoformat(),
@@ -76,6 +79,8 @@ class SaveManager:
         try:
             # Update last played timestamp
             save_data['last_played'] = datetime.now().isoformat()
+            # Random stream state, so loading continues the same sequences
+            save_data['rng'] = get_rng().get_state()
             
             with open(self.save_path, 'w') as f:
                 json.dump(save_data, f, indent=2)
@@ -97,6 +102,13 @@ class SaveManager:
             with open(self.save_path, 'r') as f:
                 save_data = json.load(f)
             
+            # Restored before the upgrade below re-saves (older saves have no RNG state)
+            if 'rng' in save_data:
+                try:
+                    get_rng().set_state(save_data['rng'])
+                except (KeyError, TypeError, ValueError) as e:
+                    logger.warning(f"Ignoring malformed RNG state in save: {e}")
+
             # Backward compatibility - add missing fields for old saves
             if 'progress' not in save_data:
                 save_data['progress'] = {}
@@ -196,6 +208,10 @@ class SaveManager:
 # Global save manager instance
 _save_manager = None
 
+def save_file_exists():
+    """Check for a save without creating the save manager (keeps it off the startup path)"""
+    return os.path.exists(os.path.join(SaveManager.SAVE_DIR, SaveManager.SAVE_FILE))
+
 def get_save_manager():
     """Get the global save manager instance"""
     global _save_manager
@@ -0,0 +1,163 @@
+"""
+Species Registry for Pokemon Faiths
+Species data loaded once into shared, slotted records indexed by integer id
+
+Species are defined in assets/data/species.json:
+    {"species": [{"name", "types": [1-2 types], "base": {"hp", "attack", "defense", "speed"},
+                  "moves": [default moveset, up to 4 move names]}]}
+A species' id is its position in that list.
+
+Pokemon instances reference their Species record instead of copying stats.
+This module never imports pygame, so headless simulation workers can load it.
+"""
+
+import json
+import os
+import sys
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+from .asset_pack import ASSET_PACK_FILE, AssetPack, AssetPackError
+from .logger import get_logger
+from .moves import get_move_database, type_id
+
+logger = get_logger('Species')
+
+SPECIES_FILE = 'assets/data/species.json'
+
+
+class SpeciesError(Exception):
+    """Raised when species data is missing or malformed"""
+
+
+class Species:
+    """Immutable per-species data shared by every Pokemon of that species"""
+
+    __slots__ = ('id', 'name', 'types', 'type_ids', 'hp', 'attack', 'defense', 'speed', 'moves')
+
+    def __init__(self, species_id: int, name: str, types: Sequence[str],
+                 hp: int, attack: int, defense: int, speed: int, moves: Sequence[str] = ('Tackle',)):
+        if not 1 <= len(types) <= 2:
+            raise SpeciesError(f"Species {name} needs one or two types")
+        self.id = species_id
+        self.name = name
+        self.types = tuple(types)
+        self.type_ids = tuple(type_id(t) for t in types)
+        self.hp = hp
+        self.attack = attack
+        self.defense = defense
+        self.speed = speed
+        self.moves = tuple(moves)
+
+    def __repr__(self):
+        return f"Species({self.id}, {self.name})"
+
+
+# Stand-in for species missing from the data file
+UNKNOWN_SPECIES = Species(-1, 'Unknown', ('Normal',), 15, 10, 8, 12)
+
+
+class SpeciesRegistry:
+    """All species, by id (list index) and by name"""
+
+    def __init__(self, species: Sequence[Species]):
+        self.by_id: Tuple[Species, ...] = tuple(species)
+        self.ids: Dict[str, int] = {record.name: record.id for record in self.by_id}
+
+    def __len__(self) -> int:
+        return len(self.by_id)
+
+    def __iter__(self) -> Iterator[Species]:
+        return iter(self.by_id)
+
+    def __getitem__(self, species_id: int) -> Species:
+        return self.by_id[species_id]
+
+    def get(self, name: str) -> Optional[Species]:
+        species_id = self.ids.get(name)
+        return None if species_id is None else self.by_id[species_id]
+
+
+def parse_species(data: dict) -> SpeciesRegistry:
+    """Build a registry from parsed species.json"""
+    records: List[Species] = []
+    try:
+        for index, entry in enumerate(data['species']):
+            base = entry['base']
+            records.append(Species(index, entry['name'], entry['types'],
+                                   base['hp'], base['attack'], base['defense'], base['speed'],
+                                   entry.get('moves', ('Tackle',))))
+    except (KeyError, TypeError, ValueError) as e:
+        raise SpeciesError(f"Malformed species data: {e}") from e
+    return SpeciesRegistry(records)
+
+
+def _read_species_file() -> Optional[bytes]:
+    # Same lookup as AssetManager.load_bytes (pack first, then loose file)
+    # without importing the asset manager, which pulls in pygame
+    if getattr(sys, 'frozen', False):
+        root = sys._MEIPASS
+    else:
+        root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    pack_path = os.path.join(root, ASSET_PACK_FILE)
+    if os.path.exists(pack_path):
+        try:
+            pack = AssetPack(pack_path)
+            try:
+                if SPECIES_FILE in pack:
+                    view = pack.get_view(SPECIES_FILE)
+                    try:
+                        return view.tobytes()
+                    finally:
+                        view.release()
+            finally:
+                pack.close()
+        except (OSError, AssetPackError) as e:
+            logger.warning(f"Ignoring asset pack {pack_path}: {e}")
+    try:
+        with open(os.path.join(root, SPECIES_FILE), 'rb') as f:
+            return f.read()
+    except OSError:
+        return None
+
+
+_registry: Optional[SpeciesRegistry] = None
+
+
+def get_species_registry() -> SpeciesRegistry:
+    """Get the global species registry, loading it on first use"""
+    global _registry
+    if _registry is None:
+        data = _read_species_file()
+        if data is None:
+            raise SpeciesError(f"Species data not found: {SPECIES_FILE}")
+        _registry = parse_species(json.loads(data.decode('utf-8')))
+        logger.info(f"Loaded {len(_registry)} species")
+    return _registry
+
+
+def get_species(name: str) -> Species:
+    """Species record by name (UNKNOWN_SPECIES if it is not in the data)"""
+    record = get_species_registry().get(name)
+    if record is None:
+        logger.warning(f"Unknown species {name}, using default stats")
+        return UNKNOWN_SPECIES
+    return record
+
+
+def create_pokemon_dict(name: str, level: int, moves: Optional[List[Dict]] = None) -> Dict:
+    """Party/battle dict for a species at a level (the format stored in saves)"""
+    species = get_species(name)
+    hp = species.hp + (level * 2)
+    return {
+        'name': name,
+        'level': level,
+        'hp': hp,
+        'max_hp': hp,
+        'attack': species.attack + level,
+        'defense': species.defense + level,
+        'speed': species.speed + level,
+        'type': list(species.types),
+        'moves': moves if moves is not None else [
+            move.save_entry() for move in map(get_move_database().get_move, species.moves) if move
+        ],
+        'status': None
+    }
@@ -0,0 +1,114 @@
+"""
+Tile Property Grid for Pokemon Faiths
+Compact per-map tile flags so tile queries are a single indexed read
+"""
+
+from typing import Dict, Iterable, Optional, Tuple
+import pygame
+from constants import TILE_SIZE
+
+# Tile flag bits
+TILE_SOLID = 0x01      # Tile overlaps collision geometry
+TILE_GRASS = 0x02      # Drawn as grass
+TILE_ROAD = 0x04       # Drawn as road
+TILE_ENCOUNTER = 0x08  # Wild encounters can trigger here
+
+Tile = Tuple[int, int]
+
+
+class TileGrid:
+    """
+    Row-major bytearrays of tile flags and trigger ids
+
+    Trigger id 0 means "no trigger". Lookups outside the map return 0.
+    version increases on every flag edit so caches built on the grid
+    (e.g. pathfinding) know when to rebuild.
+    """
+
+    __slots__ = ('width', 'height', 'flags', 'triggers', 'version')
+
+    def __init__(self, width: int, height: int):
+        self.width = width
+        self.height = height
+        self.flags = bytearray(width * height)
+        self.triggers = bytearray(width * height)
+        self.version = 0
+
+    def in_bounds(self, x: int, y: int) -> bool:
+        return 0 <= x < self.width and 0 <= y < self.height
+
+    def set_flags(self, tiles: Iterable[Tile], flags: int):
+        """OR flags into each tile"""
+        width = self.width
+        for x, y in tiles:
+            if self.in_bounds(x, y):
+                self.flags[y * width + x] |= flags
+        self.version += 1
+
+    def clear_flags(self, tiles: Iterable[Tile], flags: int):
+        """Clear flags from each tile (e.g. a door opening)"""
+        width = self.width
+        mask = ~flags & 0xFF
+        for x, y in tiles:
+            if self.in_bounds(x, y):
+                self.flags[y * width + x] &= mask
+        self.version += 1
+
+    def set_trigger(self, tiles: Iterable[Tile], trigger_id: int):
+        """Assign a trigger id (1-255) to each tile"""
+        width = self.width
+        for x, y in tiles:
+            if self.in_bounds(x, y):
+                self.triggers[y * width + x] = trigger_id
+
+    def mark_rects(self, rects: Iterable[pygame.Rect], flags: int = TILE_SOLID):
+        """OR flags into every tile a pixel rect overlaps"""
+        for rect in rects:
+            x0, x1 = rect.left // TILE_SIZE, (rect.right - 1) // TILE_SIZE
+            y0, y1 = rect.top // TILE_SIZE, (rect.bottom - 1) // TILE_SIZE
+            self.set_flags(((x, y) for y in range(y0, y1 + 1) for x in range(x0, x1 + 1)), flags)
+
+    def flags_at(self, x: int, y: int) -> int:
+        if 0 <= x < self.width and 0 <= y < self.height:
+            return self.flags[y * self.width + x]
+        return 0
+
+    def has(self, x: int, y: int, flag: int) -> bool:
+        return bool(self.flags_at(x, y) & flag)
+
+    def trigger_at(self, x: int, y: int) -> int:
+        if 0 <= x < self.width and 0 <= y < self.height:
+            return self.triggers[y * self.width + x]
+        return 0
+
+    @staticmethod
+    def tile_at(px: float, py: float) -> Tile:
+        """Tile containing a world pixel position"""
+        return int(px // TILE_SIZE), int(py // TILE_SIZE)
+
+    def flags_at_pixel(self, px: float, py: float) -> int:
+        return self.flags_at(*self.tile_at(px, py))
+
+    def count(self, flag: int) -> int:
+        """Number of tiles with a flag set"""
+        return sum(1 for value in self.flags if value & flag)
+
+
+def compile_tile_grid(width: int, height: int, layers: Dict[int, Iterable[Tile]],
+                      solid_rects: Iterable[pygame.Rect] = (),
+                      triggers: Optional[Dict[int, Iterable[Tile]]] = None) -> TileGrid:
+    """
+    Compile a map definition into a TileGrid
+
+    Args:
+        layers: Flag bits -> tiles carrying them, e.g. {TILE_GRASS | TILE_ENCOUNTER: grass_tiles}
+        solid_rects: Collision rects, marked TILE_SOLID on every tile they touch
+        triggers: Trigger id -> tiles
+    """
+    grid = TileGrid(width, height)
+    for flags, tiles in layers.items():
+        grid.set_flags(tiles, flags)
+    grid.mark_rects(solid_rects, TILE_SOLID)
+    for trigger_id, tiles in (triggers or {}).items():
+        grid.set_trigger(tiles, trigger_id)
+    return grid
@@ -0,0 +1,118 @@
+"""
+Trigger Volumes for Pokemon Faiths
+Per-scene registry of doors, warps and zones with enter/exit/stay events
+"""
+
+from typing import Callable, Dict, Optional, Set
+import pygame
+from .collision import COLLISION_CELL_SIZE, SpatialHash
+from .logger import get_logger
+
+logger = get_logger('Triggers')
+
+TriggerCallback = Callable[['Trigger'], None]
+
+
+class Trigger:
+    """A named trigger volume and its callbacks"""
+
+    __slots__ = ('name', 'rect', 'on_enter', 'on_exit', 'on_stay', 'rect_id')
+
+    def __init__(self, name: str, rect: pygame.Rect, on_enter: Optional[TriggerCallback] = None,
+                 on_exit: Optional[TriggerCallback] = None, on_stay: Optional[TriggerCallback] = None):
+        self.name = name
+        self.rect = rect
+        self.on_enter = on_enter
+        self.on_exit = on_exit
+        self.on_stay = on_stay
+        self.rect_id = -1
+
+
+class TriggerRegistry:
+    """
+    Trigger volumes stored in a spatial hash
+
+    update() tests only the triggers near the tracked rect, and only when
+    that rect has moved. on_enter/on_exit fire when occupancy changes;
+    on_stay fires every update while occupied.
+    """
+
+    def __init__(self, cell_size: int = COLLISION_CELL_SIZE):
+        self.grid = SpatialHash(cell_size)
+        self.triggers: Dict[str, Trigger] = {}
+        self._by_id: Dict[int, Trigger] = {}
+        self.occupied: Set[str] = set()
+        self._last_rect: Optional[pygame.Rect] = None
+
+    def add(self, name: str, rect: pygame.Rect, on_enter: Optional[TriggerCallback] = None,
+            on_exit: Optional[TriggerCallback] = None, on_stay: Optional[TriggerCallback] = None) -> Trigger:
+        """Register a trigger volume (replaces any trigger with the same name)"""
+        self.remove(name)
+        trigger = Trigger(name, pygame.Rect(rect), on_enter, on_exit, on_stay)
+        trigger.rect_id = self.grid.insert(trigger.rect)
+        self.triggers[name] = trigger
+        self._by_id[trigger.rect_id] = trigger
+        self._last_rect = None
+        return trigger
+
+    def remove(self, name: str):
+        """Unregister a trigger without firing on_exit"""
+        trigger = self.triggers.pop(name, None)
+        if trigger is None:
+            return
+        self.grid.remove(trigger.rect_id)
+        del self._by_id[trigger.rect_id]
+        self.occupied.discard(name)
+        self._last_rect = None
+
+    def update(self, rect: pygame.Rect):
+        """Fire callbacks for the tracked rect (usually the player's collision rect)"""
+        if rect == self._last_rect:
+            current = self.occupied
+        else:
+            self._last_rect = pygame.Rect(rect)
+            by_id = self._by_id
+            current = {by_id[i].name for i in self.grid.query_ids(rect)
+                       if rect.colliderect(by_id[i].rect)}
+
+        if current is not self.occupied:
+            exited = self.occupied - current
+            entered = current - self.occupied
+            self.occupied = current
+            for name in exited:
+                self._fire(name, 'on_exit')
+            for name in entered:
+                logger.debug(f"Entered trigger: {name}")
+                self._fire(name, 'on_enter')
+
+        for name in list(self.occupied):
+            trigger = self.triggers.get(name)
+            if trigger is not None and trigger.on_stay:
+                trigger.on_stay(trigger)
+
+    def _fire(self, name: str, event: str):
+        # Earlier callbacks may have removed the trigger
+        trigger = self.triggers.get(name)
+        callback = getattr(trigger, event) if trigger else None
+        if callback:
+            callback(trigger)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.triggers
+
+    def __len__(self) -> int:
+        return len(self.triggers)
+
+
+def save_spawn(save_manager, save_data: Optional[dict], position_key: str, x: int, y: int) -> bool:
+    """
+    Record where the player appears in the destination scene and save
+
+    Shared by every warp trigger; does nothing without save data.
+    """
+    if not save_data:
+        return False
+    save_data['progress'][position_key] = {'x': x, 'y': y}
+    saved = save_manager.save_game(save_data)
+    logger.info(f"Set {position_key} spawn to: ({x}, {y})")
+    return saved
@@ -4,8 +4,10 @@ Centralized filter and visual effect management
 """
 
 import pygame
-import random
 from typing import Tuple, Optional
+from .asset_manager import apply_transform
+from .lighting import LightMap
+from .rng import STREAM_COSMETIC, get_stream
 
 class VisualEffects:
     """Manages visual filters and effects"""
@@ -75,13 +77,14 @@ class VisualEffects:
         grain = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
         
         num_grains = int(self.width * self.height * density)
+        rng = get_stream(STREAM_COSMETIC)  # Never disturbs gameplay streams
         
         for _ in range(num_grains):
-            x = random.randint(0, self.width - 1)
-            y = random.randint(0, self.height - 1)
+            x = rng.randint(0, self.width - 1)
+            y = rng.randint(0, self.height - 1)
             
             # Random intensity variation
-            grain_intensity = random.randint(intensity // 2, intensity)
+            grain_intensity = rng.randint(intensity // 2, intensity)
             grain.set_at((x, y), (grain_intensity, grain_intensity, grain_intensity, 100))
         
         return grain
@@ -121,14 +124,9 @@ class VisualEffects:
             factor: 0.0 (black) to 1.0 (original brightness)
         
         Returns:
-            Darkened surface
+            Darkened surface (use AssetManager.load_image transforms for cached assets)
         """
-        darkened = surface.copy()
-        overlay = pygame.Surface(surface.get_size(), pygame.SRCALPHA)
-        alpha = int(255 * (1 - factor))
-        overlay.fill((0, 0, 0, alpha))
-        darkened.blit(overlay, (0, 0))
-        return darkened
+        return apply_transform(surface, ('darken', factor))
     
     def create_radial_light(self, radius: int, color: Tuple[int, int, int] = (255, 200, 100),
                            intensity: float = 1.0) -> pygame.Surface:
@@ -229,7 +227,6 @@ class CaveEffects:
         
         # Pre-create static effects at screen resolution
         self.cave_vignette = self.effects.create_vignette(intensity=0.4, color=(0, 0, 0))
-        self.player_glow = self.effects.create_radial_light(radius=30, color=(120, 90, 60), intensity=0.8)
         
         # PRE-GENERATE grain textures for smooth performance
         self.grain_density = 0.003
@@ -244,6 +241,25 @@ class CaveEffects:
             grain.set_alpha(30)
             self.grain_textures.append(grain)
         self.grain_index = 0
+        
+        # Light map (created per cave layout by setup_lighting)
+        self.light_map = None
+    
+    def setup_lighting(self, view_size: Tuple[int, int], world_size: Tuple[int, int], static_lights=()):
+        """
+        Create the cave light map
+        
+        Args:
+            static_lights: (world_pos, radius, color) tuples baked once (torches, daylight at exits)
+        """
+        self.light_map = LightMap(view_size, world_size, ambient=(150, 140, 160))
+        for world_pos, radius, color in static_lights:
+            self.light_map.add_static_light(world_pos, radius, color)
+    
+    def apply_lighting(self, surface: pygame.Surface, camera_offset, player_world_pos: Tuple[int, int]):
+        """Light the game surface: ambient, baked static lights and the player's glow in one multiply blit"""
+        self.light_map.add_light(player_world_pos, 90, (255, 200, 150))
+        self.light_map.render(surface, camera_offset)
     
     def apply_cave_atmosphere(self, surface: pygame.Surface):
         """Apply cave atmosphere with optimized animated grain"""
@@ -259,12 +275,6 @@ class CaveEffects:
         
         # Apply pre-generated grain
         surface.blit(self.grain_textures[self.grain_index], (0, 0), special_flags=pygame.BLEND_ADD)
-    
-    def draw_player_glow(self, surface: pygame.Surface, player_pos: Tuple[int, int]):
-        """Draw glow around player"""
-        glow_pos = (player_pos[0] - 30, player_pos[1] - 30)
-        self.player_glow.set_alpha(120)
-        surface.blit(self.player_glow, glow_pos)
 
 
 # Example usage for other scenes
@@ -0,0 +1,325 @@
+"""
+World Streaming for Pokemon Faiths
+Splits large maps into fixed-size regions on disk and streams them around the player
+
+A streamed world lives in assets/data/worlds/<world>/:
+    world.json       {"map", "source_hash", "width", "height", "region_size"}, sizes in tiles
+    <rx>_<ry>.map    one compiled map (see core.maps) per region
+
+source_hash is the hash of the source map's JSON when the regions were
+built. If the JSON has changed since, the streamer warns and splits the
+current map in memory instead of loading the stale region files.
+
+Each region's tile grid is local to the region; its collision rects,
+objects and triggers stay in world pixel coordinates so they can be fed
+straight into the scene's collision world and trigger registry.
+
+Split a compiled map into regions (from the src/ directory) with:
+    python -m core.world_streaming <map name> [region size]
+"""
+
+import json
+import os
+import queue
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+import pygame
+from constants import TILE_SIZE
+from .maps import (
+    MAP_DIR, MapData, MapError, compile_map_source, pack_map, parse_map, read_map_file, source_hash
+)
+from .tile_grid import TileGrid
+from .logger import get_logger
+
+logger = get_logger('WorldStreaming')
+
+WORLD_DIR = 'assets/data/worlds'
+DEFAULT_REGION_SIZE = 16                 # Tiles per region side
+DEFAULT_MEMORY_BUDGET = 4 * 1024 * 1024  # Bytes of region data kept resident
+
+RegionCoord = Tuple[int, int]
+
+
+def region_path(world: str, coord: RegionCoord) -> str:
+    return f'{WORLD_DIR}/{world}/{coord[0]}_{coord[1]}.map'
+
+
+def region_size_bytes(region: MapData) -> int:
+    """Approximate resident size of a loaded region"""
+    return (len(region.tile_grid.flags) * 2
+            + (len(region.collision_rects) + len(region.objects) + len(region.triggers)) * 64)
+
+
+# ----------------------------------------------------------------------------
+# Region builder
+# ----------------------------------------------------------------------------
+
+def _clip(rect: pygame.Rect, bounds: pygame.Rect) -> Optional[Tuple[int, int, int, int]]:
+    clipped = rect.clip(bounds)
+    if clipped.width == 0 or clipped.height == 0:
+        return None
+    return tuple(clipped)
+
+
+def split_map(map_data: MapData, region_size: int = DEFAULT_REGION_SIZE) -> Dict[RegionCoord, bytes]:
+    """
+    Split a loaded map into compiled region maps
+
+    Collision rects are clipped to each region they overlap; objects and
+    triggers belong to the region containing their center.
+    """
+    grid = map_data.tile_grid
+    regions_x = (grid.width + region_size - 1) // region_size
+    regions_y = (grid.height + region_size - 1) // region_size
+    region_px = region_size * TILE_SIZE
+
+    regions = {}
+    for ry in range(regions_y):
+        for rx in range(regions_x):
+            x0, y0 = rx * region_size, ry * region_size
+            width = min(region_size, grid.width - x0)
+            height = min(region_size, grid.height - y0)
+            bounds = pygame.Rect(rx * region_px, ry * region_px, width * TILE_SIZE, height * TILE_SIZE)
+
+            rects = []
+            for rect in map_data.collision_rects:
+                clipped = _clip(rect, bounds)
+                if clipped is not None:
+                    rects.append(clipped)
+            objects = [(obj.name, obj.sprite, tuple(obj.rect)) for obj in map_data.objects.values()
+                       if bounds.collidepoint(obj.rect.center)]
+            triggers = [(name, tuple(rect)) for name, rect in map_data.triggers.items()
+                        if bounds.collidepoint(rect.center)]
+
+            # Trigger ids are 1-based positions in each map's own trigger list
+            local_ids = {name: index for index, (name, _) in enumerate(triggers, start=1)}
+            remap = bytearray(256)
+            for index, name in enumerate(map_data.triggers, start=1):
+                remap[index] = local_ids.get(name, 0)
+
+            region_grid = TileGrid(width, height)
+            for y in range(height):
+                src = (y0 + y) * grid.width + x0
+                dst = y * width
+                region_grid.flags[dst:dst + width] = grid.flags[src:src + width]
+                region_grid.triggers[dst:dst + width] = grid.triggers[src:src + width].translate(remap)
+
+            regions[(rx, ry)] = pack_map(region_grid, rects, objects, triggers, map_data.source_hash)
+    return regions
+
+
+def build_world(project_root: str, map_name: str, region_size: int = DEFAULT_REGION_SIZE,
+                world: Optional[str] = None) -> List[str]:
+    """Split a map into a streamed world on disk, returns the written paths"""
+    world = world or map_name
+    with open(os.path.join(project_root, MAP_DIR, f'{map_name}.json'), 'rb') as f:
+        map_data = parse_map(map_name, compile_map_source(f.read()))
+
+    world_dir = os.path.join(project_root, WORLD_DIR, world)
+    os.makedirs(world_dir, exist_ok=True)
+    manifest = os.path.join(world_dir, 'world.json')
+    with open(manifest, 'w', encoding='utf-8') as f:
+        json.dump({'map': map_name, 'source_hash': map_data.source_hash.hex(), 'width': map_data.width,
+                   'height': map_data.height, 'region_size': region_size}, f, indent=2)
+
+    written = [manifest]
+    for coord, data in split_map(map_data, region_size).items():
+        path = os.path.join(project_root, region_path(world, coord))
+        with open(path, 'wb') as f:
+            f.write(data)
+        written.append(path)
+    return written
+
+
+def load_region(world: str, coord: RegionCoord) -> Optional[MapData]:
+    """Load one region from disk (or the asset pack), None if it does not exist"""
+    return read_map_file(f'{world}:{coord[0]}_{coord[1]}', region_path(world, coord))
+
+
+# ----------------------------------------------------------------------------
+# Runtime streamer
+# ----------------------------------------------------------------------------
+
+class RegionStreamer:
+    """
+    Keeps the regions around the player resident
+
+    update() requests every region within load_radius of the player from a
+    background loader thread and installs finished loads on the calling
+    thread, so on_load/on_unload callbacks can touch scene state safely.
+    Regions outside the radius stay cached until the memory budget is
+    exceeded, then the least recently used ones are evicted.
+
+    The default loader reads the world's region files, or an in-memory
+    split of the source map when those files are stale.
+    """
+
+    def __init__(self, world: str, load_radius: int = 1, memory_budget: int = DEFAULT_MEMORY_BUDGET,
+                 loader: Optional[Callable[[str, RegionCoord], Optional[MapData]]] = None,
+                 on_load: Optional[Callable[[RegionCoord, MapData], None]] = None,
+                 on_unload: Optional[Callable[[RegionCoord, MapData], None]] = None):
+        from .asset_manager import get_asset_manager
+        asset_manager = get_asset_manager()
+        manifest_path = f'{WORLD_DIR}/{world}/world.json'
+        data = asset_manager.load_bytes(manifest_path)
+        if data is None:
+            raise MapError(f"World not found: {world}")
+        manifest = json.loads(data.decode('utf-8'))
+
+        self.world = world
+        self.width = manifest['width']
+        self.height = manifest['height']
+        self.region_size = manifest['region_size']
+        self.load_radius = load_radius
+        self.memory_budget = memory_budget
+        self.loader = loader or self._region_loader(manifest.get('map', world), manifest.get('source_hash'))
+        self.regions_x = (self.width + self.region_size - 1) // self.region_size
+        self.regions_y = (self.height + self.region_size - 1) // self.region_size
+        self.on_load = on_load
+        self.on_unload = on_unload
+
+        self.regions: 'OrderedDict[RegionCoord, MapData]' = OrderedDict()
+        self.memory_used = 0
+        self._sizes: Dict[RegionCoord, int] = {}
+        self._pending: Set[RegionCoord] = set()
+        self._requests: 'queue.Queue[Optional[RegionCoord]]' = queue.Queue()
+        self._results: 'queue.Queue[Tuple[RegionCoord, Optional[MapData]]]' = queue.Queue()
+        self._thread = threading.Thread(target=self._worker, name=f'RegionLoader-{world}', daemon=True)
+        self._thread.start()
+
+    def _region_loader(self, map_name: str, built_hash: Optional[str]) -> Callable[[str, RegionCoord], Optional[MapData]]:
+        """load_region, or an in-memory split of the source map if the region files are stale"""
+        from .asset_manager import get_asset_manager
+        source = get_asset_manager().load_bytes(f'{MAP_DIR}/{map_name}.json')
+        if source is None or built_hash == source_hash(source).hex():
+            return load_region
+
+        logger.warning(f"World {self.world} is stale, splitting {map_name} in memory "
+                       f"(rebuild with python -m core.world_streaming {map_name})")
+        map_data = parse_map(map_name, compile_map_source(source))
+        self.width, self.height = map_data.width, map_data.height
+        regions = split_map(map_data, self.region_size)
+
+        def load_split(world: str, coord: RegionCoord) -> Optional[MapData]:
+            data = regions.get(coord)
+            return None if data is None else parse_map(f'{world}:{coord[0]}_{coord[1]}', data)
+        return load_split
+
+    def _worker(self):
+        while True:
+            coord = self._requests.get()
+            if coord is None:
+                break
+            region = None
+            try:
+                region = self.loader(self.world, coord)
+            except Exception as e:
+                # Any failure still posts a result, or update(block=True) would wait forever
+                logger.error(f"Failed to load region {coord} of {self.world}: {e}")
+            finally:
+                self._results.put((coord, region))
+
+    def region_of(self, world_x: float, world_y: float) -> RegionCoord:
+        """Region containing a world pixel position"""
+        region_px = self.region_size * TILE_SIZE
+        return int(world_x // region_px), int(world_y // region_px)
+
+    def wanted(self, center: RegionCoord) -> List[RegionCoord]:
+        """Regions within load_radius of center, nearest first"""
+        cx, cy = center
+        radius = self.load_radius
+        coords = [(x, y)
+                  for y in range(max(0, cy - radius), min(self.regions_y, cy + radius + 1))
+                  for x in range(max(0, cx - radius), min(self.regions_x, cx + radius + 1))]
+        coords.sort(key=lambda c: abs(c[0] - cx) + abs(c[1] - cy))
+        return coords
+
+    def update(self, world_pos: Tuple[float, float], block: bool = False):
+        """
+        Stream regions around a world position
+
+        Args:
+            block: Wait for every region within load_radius (e.g. on scene setup or after a warp)
+        """
+        center = self.region_of(*world_pos)
+        wanted = self.wanted(center)
+        for coord in wanted:
+            if coord in self.regions:
+                self.regions.move_to_end(coord)
+            elif coord not in self._pending:
+                self._pending.add(coord)
+                self._requests.put(coord)
+
+        if block:
+            # Failed loads are posted too, so this always finishes
+            while self._pending.intersection(wanted):
+                self._install(*self._results.get())
+        self._drain()
+        self._evict(set(wanted))
+
+    def _drain(self):
+        while True:
+            try:
+                result = self._results.get_nowait()
+            except queue.Empty:
+                return
+            self._install(*result)
+
+    def _install(self, coord: RegionCoord, region: Optional[MapData]):
+        self._pending.discard(coord)
+        if region is None or coord in self.regions:
+            return
+        self.regions[coord] = region
+        size = region_size_bytes(region)
+        self._sizes[coord] = size
+        self.memory_used += size
+        if self.on_load:
+            self.on_load(coord, region)
+
+    def _evict(self, keep: Set[RegionCoord]):
+        """Drop least recently used regions while over budget, never those in keep"""
+        for coord in list(self.regions):
+            if self.memory_used <= self.memory_budget:
+                return
+            if coord not in keep:
+                self.unload(coord)
+
+    def unload(self, coord: RegionCoord):
+        region = self.regions.pop(coord, None)
+        if region is None:
+            return
+        self.memory_used -= self._sizes.pop(coord)
+        if self.on_unload:
+            self.on_unload(coord, region)
+
+    def get_region(self, coord: RegionCoord) -> Optional[MapData]:
+        return self.regions.get(coord)
+
+    def flags_at(self, tile_x: int, tile_y: int) -> int:
+        """Tile flags at a world tile, 0 if its region is not loaded"""
+        region = self.regions.get((tile_x // self.region_size, tile_y // self.region_size))
+        if region is None:
+            return 0
+        return region.tile_grid.flags_at(tile_x % self.region_size, tile_y % self.region_size)
+
+    def is_loaded(self, coords: Iterable[RegionCoord]) -> bool:
+        return all(coord in self.regions for coord in coords)
+
+    def close(self):
+        """Stop the loader thread and unload everything"""
+        self._requests.put(None)
+        self._thread.join(timeout=1.0)
+        for coord in list(self.regions):
+            self.unload(coord)
+
+
+if __name__ == '__main__':
+    import sys
+    root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    if len(sys.argv) < 2:
+        print("Usage: python -m core.world_streaming <map name> [region size]")
+        sys.exit(1)
+    size = int(sys.argv[2]) if len(sys.argv) > 2 else DEFAULT_REGION_SIZE
+    for path in build_world(root, sys.argv[1], size):
+        print(f"Wrote {os.path.relpath(path, root)}")
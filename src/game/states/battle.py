@@ -7,11 +7,16 @@ import pygame
 from constants import (
     DEFAULT_SCREEN_WIDTH as SCREEN_WIDTH,
     DEFAULT_SCREEN_HEIGHT as SCREEN_HEIGHT,
-    GAME_WIDTH, GAME_HEIGHT
+    GAME_WIDTH, GAME_HEIGHT, BATTLE_AI_DIFFICULTY
 )
 from core.logger import get_logger
 from core.pokemon import Pokemon
 from core.moves import get_move_database, get_type_chart, Move
+from core.battle_engine import (
+    ACTION_MOVE, ENEMY, OUTCOME_FAINT, OUTCOME_KILLED, OUTCOME_WIN, PLAYER, BattleEngine
+)
+from core.battle_ai import BattleAI, MoveSearch
+from core.battle_events import BattleEventLog
 from core.visual_effects import GlobalEffects
 from core.frame_smoother import FrameTimeSmoother
 from typing import List, Optional
@@ -22,6 +27,9 @@ class BattleScene:
     """
     Turn-based battle scene
     Key principle: Player sees descriptive states, NOT numbers
+
+    Rules live in BattleEngine; the scene collects input and narrates
+    each resolved move for animation_duration before the next one.
     """
 
     def __init__(self, player_pokemon: Pokemon, enemy_pokemon: Pokemon,
@@ -47,8 +55,8 @@ class BattleScene:
         # Battle state
         self.battle_phase = 'move_select'  # 'move_select', 'animating', 'result', 'finished'
         self.selected_move_index = 0
-        self.battle_log_entries = []  # For creating final battle log entry
         self.battle_outcome = None  # 'win', 'retreat', 'faint', 'killed'
+        self.pending_results = []  # Resolved turn entries still to be narrated
 
         # UI state
         self.message = "What will you do?"
@@ -71,8 +79,14 @@ class BattleScene:
         self.box_color = (40, 35, 50)
         self.border_color = (200, 200, 200)
 
-        # Player's available moves (for now, get random moves)
+        # Movesets are fixed for the battle; the engine resolves moves by index
         self.player_moves = self._get_pokemon_moves(player_pokemon)
+        self.engine = BattleEngine(player_pokemon, enemy_pokemon, self.player_moves,
+                                   self._get_pokemon_moves(enemy_pokemon), self.type_chart)
+
+        # Enemy AI thinks on a worker thread while the player chooses / the turn animates
+        self.enemy_ai = MoveSearch(BattleAI.from_difficulty(BATTLE_AI_DIFFICULTY))
+        self.enemy_ai.start(self.engine, ENEMY)
         
         # Visual effects and frame smoothing
         self.global_effects = GlobalEffects(screen_width, screen_height)
@@ -81,9 +95,8 @@ class BattleScene:
         logger.info(f"Battle started: {player_pokemon.nickname} vs {enemy_pokemon.nickname}")
 
     def _get_pokemon_moves(self, pokemon: Pokemon) -> List[Move]:
-        """Get moves for a Pokemon (for now, random selection)"""
-        # TODO: Store moves on Pokemon itself
-        return self.move_db.get_random_moves(4)
+        """The Pokemon's learned moveset, resolved once for the whole battle"""
+        return pokemon.get_moves()
 
     def handle_events(self):
         """Handle battle input"""
@@ -91,7 +104,8 @@ class BattleScene:
             if event.type == pygame.QUIT:
                 logger.info("Quit event received during battle")
                 self.running = False
-                self.battle_outcome = 'retreat'
+                self.engine.retreat()
+                self.battle_outcome = self.engine.outcome
 
             elif event.type == pygame.KEYDOWN:
                 if self.battle_phase == 'move_select':
@@ -138,57 +152,48 @@ class BattleScene:
         elif action == 'Info':
             self._show_pokemon_info()
 
+    @property
+    def battle_log_entries(self) -> BattleEventLog:
+        """Every move executed so far (kept by the engine)"""
+        return self.engine.log
+
     def _execute_player_move(self):
-        """Execute the player's selected move"""
+        """Resolve a turn with the player's selected move"""
         move = self.player_moves[self.selected_move_index]
         logger.info(f"{self.player_pokemon.nickname} uses {move.name}")
 
-        # Execute player's move
-        result = move.execute(self.player_pokemon, self.enemy_pokemon, self.type_chart)
-
-        # Store result
-        self.battle_log_entries.append({
-            'actor': 'player',
-            'move': move.name,
-            'result': result
-        })
-
-        # Update message
-        self.message = result['narrative']
-        if result.get('injury_occurred'):
-            self.message += f"\n\n{result['injury_description']}"
+        self.engine.choose_action(PLAYER, (ACTION_MOVE, self.selected_move_index))
+        self.engine.choose_action(ENEMY, self.enemy_ai.result())
+        self.pending_results = self.engine.resolve_turn()
+        if not self.engine.is_over:
+            # Plan the next enemy move during this turn's animation
+            self.enemy_ai.start(self.engine, ENEMY)
 
         # Change to animation phase
-        self.battle_phase = 'animating'
-        self.animation_timer = 0
-
-    def _execute_enemy_move(self):
-        """Enemy AI chooses and executes a move"""
-        # Simple AI: random move for now
-        import random
-        enemy_moves = self._get_pokemon_moves(self.enemy_pokemon)
-        move = random.choice(enemy_moves)
+        self._show_next_result()
 
-        logger.info(f"{self.enemy_pokemon.nickname} uses {move.name}")
-
-        # Execute enemy's move
-        result = move.execute(self.enemy_pokemon, self.player_pokemon, self.type_chart)
-
-        # Store result
-        self.battle_log_entries.append({
-            'actor': 'enemy',
-            'move': move.name,
-            'result': result
-        })
+    def _show_next_result(self):
+        """Narrate the next resolved move, or move on to the result screen"""
+        if not self.pending_results:
+            self.battle_phase = 'result'
+            return
 
-        # Update message
-        enemy_message = f"Enemy {self.enemy_pokemon.nickname} used {move.name}!\n"
-        enemy_message += result['narrative']
+        event = self.pending_results.pop(0)
+        narrative, injury_description = self.engine.log.narrate(event)
+        if event.actor == ENEMY:
+            move_name = event.move.name
+            logger.info(f"{self.enemy_pokemon.nickname} uses {move_name}")
+            message = f"Enemy {self.enemy_pokemon.nickname} used {move_name}!\n"
+            message += narrative
+        else:
+            message = narrative
 
-        if result.get('injury_occurred'):
-            enemy_message += f"\n\n{result['injury_description']}"
+        if injury_description:
+            message += f"\n\n{injury_description}"
 
-        self.message = enemy_message
+        self.message = message
+        self.battle_phase = 'animating'
+        self.animation_timer = 0
 
     def _attempt_retreat(self):
         """Attempt to retreat from battle"""
@@ -199,7 +204,8 @@ class BattleScene:
             self.message = "You retreat from battle. Better to preserve life than risk it all."
 
         logger.info(f"{self.player_pokemon.nickname} retreated from battle")
-        self.battle_outcome = 'retreat'
+        self.engine.retreat()
+        self.battle_outcome = self.engine.outcome
         self.battle_phase = 'finished'
         self.running = False
 
@@ -216,13 +222,14 @@ class BattleScene:
 
     def _check_battle_end(self):
         """Check if battle should end"""
+        outcome = self.engine.outcome
+
         # Check if player Pokemon fainted/died
-        if not self.player_pokemon.is_conscious:
-            if self.player_pokemon.is_alive:
-                self.battle_outcome = 'faint'
+        if outcome in (OUTCOME_FAINT, OUTCOME_KILLED):
+            self.battle_outcome = outcome
+            if outcome == OUTCOME_FAINT:
                 self.message = f"{self.player_pokemon.nickname} fainted but still breathes..."
             else:
-                self.battle_outcome = 'killed'
                 self.message = f"{self.player_pokemon.nickname} has fallen... permanently."
             self.battle_phase = 'finished'
             self.running = False
@@ -230,8 +237,8 @@ class BattleScene:
             return
 
         # Check if enemy Pokemon fainted/died
-        if not self.enemy_pokemon.is_conscious:
-            self.battle_outcome = 'win'
+        if outcome == OUTCOME_WIN:
+            self.battle_outcome = outcome
             self.message = f"Enemy {self.enemy_pokemon.nickname} has been defeated!"
             self.battle_phase = 'finished'
             self.running = False
@@ -249,16 +256,8 @@ class BattleScene:
             self.animation_timer += dt * 1000
 
             if self.animation_timer >= self.animation_duration:
-                # Animation done, check if enemy should attack
-                last_entry = self.battle_log_entries[-1]
-
-                if last_entry['actor'] == 'player':
-                    # Enemy's turn
-                    self._execute_enemy_move()
-                    self.animation_timer = 0  # Reset for enemy animation
-                else:
-                    # Both turns done, show result
-                    self.battle_phase = 'result'
+                # Animation done, narrate the enemy's reply or show the result
+                self._show_next_result()
 
     def draw(self):
         """Render battle scene"""
@@ -433,42 +432,4 @@ class BattleScene:
         Generate battle log entry for Pokemon's battle history
         Format from design doc Section 7
         """
-        # Compile moves used
-        moves_used = []
-        for entry in self.battle_log_entries:
-            if entry['actor'] == 'player':
-                moves_used.append({
-                    'move': entry['move'],
-                    'effective': entry['result']['effectiveness'] >= 1.5
-                })
-
-        # Calculate total damage taken
-        total_damage = 0
-        status_events = []
-        for entry in self.battle_log_entries:
-            if entry['actor'] == 'enemy':
-                total_damage += entry['result']['damage']
-
-                # Check for status events
-                if entry['result'].get('injury_occurred'):
-                    status_events.append('injury')
-
-        # Create log entry
-        log_entry = {
-            'opponent_id': self.enemy_pokemon.species,
-            'opponent_veterancy': self.enemy_pokemon.get_effective_veteran_score() / 100,
-            'moves_used': moves_used,
-            'damage_taken': {
-                'amount': total_damage,
-                'type': 'mixed',  # TODO: Track specific types
-                'location': 'body'
-            },
-            'damage_dealt': sum(e['result']['damage'] for e in self.battle_log_entries
-                               if e['actor'] == 'player'),
-            'status_events': status_events,
-            'outcome': self.battle_outcome,
-            'player_tactics': [],  # TODO: Analyze tactics from move choices
-            'environment': ['training_grounds']  # TODO: Pass environment
-        }
-
-        return log_entry
+        return self.engine.battle_log_entry()
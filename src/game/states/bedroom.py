@@ -7,14 +7,16 @@ import pygame
 from constants import (
     DEFAULT_SCREEN_WIDTH as SCREEN_WIDTH, 
     DEFAULT_SCREEN_HEIGHT as SCREEN_HEIGHT,
-    TILE_SIZE, GAME_WIDTH, GAME_HEIGHT,
-    BORDER_THICKNESS,
-    INTERACTION_RANGE_DEFAULT, INTERACTION_TEXT_AUTO_CLOSE_TIME, INTERACTION_PROMPT_Y_OFFSET
+    TILE_SIZE, GAME_WIDTH, GAME_HEIGHT, MAX_FRAME_DT
 )
 from core.asset_manager import get_asset_manager
 from core.logger import get_logger
 from core.save_manager import get_save_manager
 from core.entities import Player, Camera
+from core.collision import CollisionWorld
+from core.interaction import InteractionIndex
+from core.triggers import TriggerRegistry, save_spawn
+from core.animation import get_animation_clock
 from core.game_debugger import GameDebugger
 from core.pause_menu import PauseMenu
 from core.visual_effects import GlobalEffects
@@ -58,6 +60,7 @@ class BedroomScene:
         self.eye_opening_timer = 0
         self.eye_opening_duration = 3000  # 3 seconds in milliseconds
         
+        get_asset_manager().set_scene('Bedroom')
         # Load assets and setup scene
         self._load_assets()
         self._setup_map()
@@ -67,7 +70,7 @@ class BedroomScene:
         self.camera = Camera(self.player, GAME_WIDTH, GAME_HEIGHT)
         self.debugger = GameDebugger(self.clock)
         self.global_effects = GlobalEffects(SCREEN_WIDTH, SCREEN_HEIGHT)
-        self.frame_smoother = FrameTimeSmoother(max_dt=0.05)
+        self.frame_smoother = FrameTimeSmoother(max_dt=MAX_FRAME_DT)
         
         logger.info("Bedroom scene initialized")
 
@@ -98,32 +101,11 @@ class BedroomScene:
             self.assets['wall'] = self.assets['floor'][0]
             self.assets['rug_teleport'] = asset_manager.load_image('assets/images/rug_tile.png', (TILE_SIZE, TILE_SIZE))
             
-            # Load furniture with safe aspect ratio scaling
-            def scale_with_aspect(path, target_width=None, target_height=None):
-                """Safely scale image maintaining aspect ratio"""
-                img = asset_manager.load_image(path)
-                if img.get_width() == 32 and img.get_height() == 32:
-                    # This is a placeholder, just return it
-                    return img
-                
-                orig_w, orig_h = img.get_size()
-                
-                if target_width and not target_height:
-                    aspect = orig_h / orig_w
-                    new_size = (target_width, int(target_width * aspect))
-                elif target_height and not target_width:
-                    aspect = orig_w / orig_h
-                    new_size = (int(target_height * aspect), target_height)
-                else:
-                    new_size = (target_width or orig_w, target_height or orig_h)
-                
-                return asset_manager.load_image(path, new_size)
-            
-            # Load furniture
-            self.assets['bed'] = scale_with_aspect('assets/images/damaged_bed.png', target_width=50)
-            self.assets['table'] = scale_with_aspect('assets/images/damaged_table.png', target_width=40)
-            self.assets['bookshelf'] = scale_with_aspect('assets/images/damaged_bookshelf.png', target_height=50)
-            self.assets['chest'] = scale_with_aspect('assets/images/wood_chest.png', target_width=35)
+            # Load furniture (aspect-preserving transforms are cached by AssetManager)
+            self.assets['bed'] = asset_manager.load_image('assets/images/damaged_bed.png', transforms=[('fit_width', 50)])
+            self.assets['table'] = asset_manager.load_image('assets/images/damaged_table.png', transforms=[('fit_width', 40)])
+            self.assets['bookshelf'] = asset_manager.load_image('assets/images/damaged_bookshelf.png', transforms=[('fit_height', 50)])
+            self.assets['chest'] = asset_manager.load_image('assets/images/wood_chest.png', transforms=[('fit_width', 35)])
             self.assets['calendar'] = asset_manager.load_image('assets/images/calendar.png', (24, 20))
             
             logger.info("Bedroom assets loaded successfully")
@@ -186,6 +168,18 @@ class BedroomScene:
             TILE_SIZE
         )
         
+        self.interaction_index = InteractionIndex()
+        for obj_name, obj_data in self.interactive_objects.items():
+            # Special case for rug
+            obj_rect = self.rug_teleport_rect if obj_name == 'rug' else obj_data['sprite'].rect
+            self.interaction_index.add(obj_name, obj_rect.center, obj_data['interaction_range'])
+
+        self.triggers = TriggerRegistry()
+        self.triggers.add('rug', self.rug_teleport_rect, on_enter=self._step_on_rug)
+
+        # Static geometry is hashed once; Player.update only tests nearby cells
+        self.collision_world = CollisionWorld(self.collision_rects)
+
         logger.debug(f"Improved bedroom map: {self.map_width}x{self.map_height}")
 
     def _setup_furniture(self):
@@ -365,6 +359,8 @@ class BedroomScene:
                     self._take_screenshot()
                 elif event.key == pygame.K_F3:
                     self._log_game_state()
+                elif event.key == pygame.K_F4 and self.debugger:
+                    self.debugger.dump_asset_metrics()
                 elif event.key == pygame.K_F11:
                     # Toggle fullscreen
                     if self.screen.get_flags() & pygame.FULLSCREEN:
@@ -439,6 +435,8 @@ class BedroomScene:
             if self.pause_menu:
                 self.pause_menu.update(dt)
             return
+
+        get_animation_clock().tick(dt)
             
         if self.eye_opening:
             self.eye_opening_timer += dt * 1000  # Convert to milliseconds
@@ -450,7 +448,7 @@ class BedroomScene:
         # Only allow player movement if not locked in interaction
         if not self.player_locked:
             keys = pygame.key.get_pressed()
-            self.player.update(keys, self.collision_rects, dt)
+            self.player.update(keys, self.collision_world, dt)
         
         # Update camera
         self.camera.update(dt)
@@ -462,60 +460,28 @@ class BedroomScene:
         # Removed: interaction timer auto-close logic
         
         # Check for teleport
-        self._check_teleport()
+        self.triggers.update(self.player.rect)
 
     def _check_interactions(self):
-        """Check if player is near any interactive objects"""
-        self.nearby_object = None
-        self.show_e_prompt = False
-        
-        player_center = self.player.rect.center
-        
-        for obj_name, obj_data in self.interactive_objects.items():
-            # Special case for rug
-            if obj_name == 'rug':
-                obj_rect = self.rug_teleport_rect
-            else:
-                obj_rect = obj_data['sprite'].rect
-            
-            # Calculate distance
-            obj_center = obj_rect.center
-            distance = ((player_center[0] - obj_center[0]) ** 2 + 
-                       (player_center[1] - obj_center[1]) ** 2) ** 0.5
-            
-            # Check if within interaction range
-            if distance <= obj_data['interaction_range']:
-                self.nearby_object = obj_name
-                self.show_e_prompt = True
-                break
-
-    def _check_teleport(self):
-        """Check if player is on the teleport rug"""
-        if self.player.rect.colliderect(self.rug_teleport_rect):
-            logger.info("Player stepped on teleport rug - going outside!")
-
-            # Set spawn position for outside scene (in front of house door)
-            if self.save_data:
-                # Player's house is at tile (8, 3) in outside map
-                # House is 120px wide, positioned at 8 * 16 = 128px
-                house_x = 8 * TILE_SIZE
-                house_y = 3 * TILE_SIZE
-                house_width = 120
-                house_height = 100
-
-                # Spawn player at center of house door, just below it
-                spawn_x = house_x + (house_width // 2)
-                spawn_y = house_y + house_height + 20  # 20 pixels below house
-
-                self.save_data['progress']['outside_position'] = {
-                    'x': spawn_x,
-                    'y': spawn_y
-                }
-                self.save_manager.save_game(self.save_data)
-                logger.info(f"Set outside spawn to: ({spawn_x}, {spawn_y})")
-
-            self.teleport_to_outside = True
-            self.running = False
+        """Check if player is near any interactive objects (cached until the player moves)"""
+        self.nearby_object = self.interaction_index.nearby(self.player.rect.center)
+        self.show_e_prompt = self.nearby_object is not None
+
+    def _step_on_rug(self, trigger):
+        """Rug trigger: spawn outside in front of the house door"""
+        logger.info("Player stepped on teleport rug - going outside!")
+        # Player's house is at tile (8, 3) in outside map
+        house_x = 8 * TILE_SIZE
+        house_y = 3 * TILE_SIZE
+        house_width = 120
+        house_height = 100
+        # Spawn player at center of house door, just below it
+        spawn_x = house_x + (house_width // 2)
+        spawn_y = house_y + house_height + 20  # 20 pixels below house
+        save_spawn(self.save_manager, self.save_data, 'outside_position', spawn_x, spawn_y)
+
+        self.teleport_to_outside = True
+        self.running = False
 
     def draw(self):
         """Render bedroom scene"""
@@ -8,11 +8,19 @@ import os
 from constants import (
     DEFAULT_SCREEN_WIDTH as SCREEN_WIDTH,
     DEFAULT_SCREEN_HEIGHT as SCREEN_HEIGHT,
-    TILE_SIZE, GAME_WIDTH, GAME_HEIGHT
+    TILE_SIZE, GAME_WIDTH, GAME_HEIGHT, MAX_FRAME_DT
 )
 from core.asset_manager import get_asset_manager
 from core.logger import get_logger
 from core.entities import Player, Camera
+from core.collision import CollisionWorld
+from core.tile_grid import TILE_ENCOUNTER, TILE_GRASS
+from core.maps import load_map
+from core.interaction import InteractionIndex
+from core.encounters import create_wild_pokemon, get_encounter_table
+from core.species import create_pokemon_dict
+from core.triggers import TriggerRegistry, save_spawn
+from core.animation import get_animation_clock
 from core.game_debugger import GameDebugger
 from core.pause_menu import PauseMenu
 from core.visual_effects import CaveEffects, GlobalEffects
@@ -52,19 +60,26 @@ class CaveScene:
         self.player_locked = False
         
         # Wild encounter system
+        self.encounter_table = get_encounter_table('cave')
         self.encounter_step_counter = 0
         self.steps_until_encounter = 0
         self.in_battle = False
         self.last_grass_tile = None  # Track last grass tile for step counting
         self._reset_encounter_counter()
 
+        get_asset_manager().set_scene('Cave')
         self.assets = self._load_assets()
         self._setup_map()
         
         # Cave visual effects (use SCREEN size so grain doesn't follow camera)
         self.cave_effects = CaveEffects(SCREEN_WIDTH, SCREEN_HEIGHT)
+        self.cave_effects.setup_lighting(
+            (GAME_WIDTH, GAME_HEIGHT),
+            (self.map_width * TILE_SIZE, self.map_height * TILE_SIZE),
+            static_lights=[(self.exit_rect.center, 70, (70, 80, 100))]  # Daylight from the exit
+        )
         self.global_effects = GlobalEffects(SCREEN_WIDTH, SCREEN_HEIGHT)
-        self.frame_smoother = FrameTimeSmoother(max_dt=0.05)
+        self.frame_smoother = FrameTimeSmoother(max_dt=MAX_FRAME_DT)
 
         if save_data and 'progress' in save_data and 'cave_position' in save_data['progress']:
             pos = save_data['progress']['cave_position']
@@ -90,14 +105,14 @@ class CaveScene:
         asset_manager = get_asset_manager()
 
         # Load cave floor tile
-        cave_floor = asset_manager.load_image('assets/images/cave_tile.png', (TILE_SIZE, TILE_SIZE))
-        assets['floor'] = self._darken_surface(cave_floor, 0.7)  # Darker cave
+        assets['floor'] = asset_manager.load_image('assets/images/cave_tile.png', (TILE_SIZE, TILE_SIZE),
+                                                   transforms=[('darken', 0.7)])  # Darker cave
         
         # Load grass tiles for encounter zones
         for i in range(1, 4):
             grass_path = f'assets/images/grass_tile{i}.png'
-            grass_tile = asset_manager.load_image(grass_path, (TILE_SIZE, TILE_SIZE))
-            dark_grass = self._darken_surface(grass_tile, 0.6)  # Very dark grass in cave
+            dark_grass = asset_manager.load_image(grass_path, (TILE_SIZE, TILE_SIZE),
+                                                  transforms=[('darken', 0.6)])  # Very dark grass in cave
             assets['grass'].append(dark_grass)
 
         try:
@@ -112,61 +127,25 @@ class CaveScene:
 
         return assets
     
-    def _darken_surface(self, surface, factor=0.5):
-        """Darken surface (0.0=black, 1.0=original)"""
-        dark = surface.copy()
-        overlay = pygame.Surface(surface.get_size())
-        overlay.fill((0, 0, 0))
-        overlay.set_alpha(int(255 * (1 - factor)))
-        dark.blit(overlay, (0, 0))
-        return dark
-
     def _setup_map(self):
-        """Create cave with grass encounter zones"""
-        self.map_width = 20
-        self.map_height = 10
-        self.collision_rects = []
+        """Load the compiled cave map (layout lives in assets/data/maps/cave.json)"""
+        map_data = load_map('cave')
+        self.map_width = map_data.width
+        self.map_height = map_data.height
+        self.tile_grid = map_data.tile_grid
+        self.collision_rects = map_data.collision_rects
         self.furniture_sprites = pygame.sprite.Group()
 
-        # Grass patches for encounters (tile coordinates)
-        self.grass_tiles = [
-            # Left side grass patch
-            (5, 3), (6, 3), (7, 3),
-            (5, 4), (6, 4), (7, 4),
-            (5, 5), (6, 5), (7, 5),
-            # Right side grass patch
-            (13, 6), (14, 6), (15, 6),
-            (13, 7), (14, 7), (15, 7),
-            (13, 8), (14, 8), (15, 8),
-            # Center grass patch (near middle)
-            (9, 4), (10, 4), (11, 4),
-            (9, 5), (10, 5), (11, 5),
-        ]
-
-        border_thickness = 8
-        self.collision_rects.extend([
-            pygame.Rect(0, 0, self.map_width * TILE_SIZE, border_thickness),
-            pygame.Rect(0, self.map_height * TILE_SIZE - border_thickness, self.map_width * TILE_SIZE, border_thickness),
-            pygame.Rect(0, 0, border_thickness, self.map_height * TILE_SIZE),
-            pygame.Rect(self.map_width * TILE_SIZE - border_thickness, 0, border_thickness, self.map_height * TILE_SIZE)
-        ])
-
-        self.exit_rect = pygame.Rect((self.map_width // 2 - 1) * TILE_SIZE, (self.map_height - 2) * TILE_SIZE, TILE_SIZE * 2, TILE_SIZE)
+        self.exit_rect = map_data.triggers['exit']
 
         self.pokeball_taken = self.save_data.get('progress', {}).get('old_man_pokeball_taken', False) if self.save_data else False
 
         old_man_sprite = pygame.sprite.Sprite()
         old_man_sprite.image = self.assets['old_man_without_pokeball' if self.pokeball_taken else 'old_man_with_pokeball']
-        old_man_x = border_thickness + 15
-        old_man_y = (2 * TILE_SIZE) + 10
-        old_man_sprite.rect = old_man_sprite.image.get_rect(topleft=(old_man_x, old_man_y))
+        old_man_sprite.rect = old_man_sprite.image.get_rect(topleft=map_data.objects['old_man'].rect.topleft)
         old_man_sprite.draw = lambda surface, camera: surface.blit(old_man_sprite.image, old_man_sprite.rect.topleft - camera.offset)
         self.furniture_sprites.add(old_man_sprite)
         self.old_man_sprite = old_man_sprite
-
-        collision_size = 20
-        old_man_collision = pygame.Rect(old_man_sprite.rect.centerx - collision_size // 2, old_man_sprite.rect.centery - collision_size // 2 - 8, collision_size, collision_size)
-        self.collision_rects.append(old_man_collision)
         
         self.interactive_objects = {
             'old_man': {
@@ -177,18 +156,30 @@ class CaveScene:
             }
         }
 
-        logger.info(f"Cave map created: {self.map_width}x{self.map_height} with {len(self.grass_tiles)} grass encounter tiles")
+        self.interaction_index = InteractionIndex()
+        for obj_name, obj_data in self.interactive_objects.items():
+            self.interaction_index.add(obj_name, obj_data['sprite'].rect.center, obj_data['interaction_range'])
+
+        self.triggers = TriggerRegistry()
+        self.triggers.add('exit', self.exit_rect, on_enter=self._leave_cave)
+
+        # Static geometry is hashed once; Player.update only tests nearby cells
+        self.collision_world = CollisionWorld(self.collision_rects)
+
+        logger.info(f"Cave map created: {self.map_width}x{self.map_height} with {self.tile_grid.count(TILE_ENCOUNTER)} grass encounter tiles")
 
     def _draw_map(self):
         """Draw cave floor with grass patches"""
         cam_offset = self.camera.offset
+        flags = self.tile_grid.flags
         for y in range(self.map_height):
+            row = y * self.map_width
             for x in range(self.map_width):
                 pos_x = x * TILE_SIZE - cam_offset.x
                 pos_y = y * TILE_SIZE - cam_offset.y
                 
                 # Check if this is a grass tile
-                if (x, y) in self.grass_tiles:
+                if flags[row + x] & TILE_GRASS:
                     # Draw grass for encounters
                     grass_tile = self.assets['grass'][(x + y) % len(self.assets['grass'])]
                     self.game_surface.blit(grass_tile, (pos_x, pos_y))
@@ -218,6 +209,8 @@ class CaveScene:
                     self._handle_interaction_key()
                 elif event.key == pygame.K_F1:
                     self.debug_mode = not self.debug_mode
+                elif event.key == pygame.K_F4 and self.debugger:
+                    self.debugger.dump_asset_metrics()
 
             if self.paused and self.pause_menu:
                 result = self.pause_menu.handle_input(event)
@@ -257,17 +250,14 @@ class CaveScene:
         return "A dead old man slumped against the wall. His hand clutches a worn Pokéball. It trembles faintly."
     
     def _reset_encounter_counter(self):
-        """Reset steps until next encounter (random 5-15 steps)"""
-        import random
-        self.steps_until_encounter = random.randint(5, 15)
+        """Reset steps until next encounter (zone's step range)"""
+        self.steps_until_encounter = self.encounter_table.roll_steps()
         self.encounter_step_counter = 0
         logger.debug(f"Next encounter in {self.steps_until_encounter} steps")
     
     def _is_on_grass(self):
-        """Check if player is standing on grass tile"""
-        player_tile_x = self.player.rect.centerx // TILE_SIZE
-        player_tile_y = self.player.rect.centery // TILE_SIZE
-        return (player_tile_x, player_tile_y) in self.grass_tiles
+        """Check if player is standing on an encounter grass tile"""
+        return bool(self.tile_grid.flags_at_pixel(*self.player.rect.center) & TILE_ENCOUNTER)
     
     def _check_wild_encounter(self):
         """Check if wild encounter should trigger"""
@@ -276,9 +266,7 @@ class CaveScene:
             return False
         
         # Get current tile
-        player_tile_x = self.player.rect.centerx // TILE_SIZE
-        player_tile_y = self.player.rect.centery // TILE_SIZE
-        current_tile = (player_tile_x, player_tile_y)
+        current_tile = self.tile_grid.tile_at(*self.player.rect.center)
         
         # Only count as a step if we moved to a NEW grass tile
         if current_tile != self.last_grass_tile:
@@ -296,8 +284,6 @@ class CaveScene:
     
     def _trigger_wild_encounter(self):
         """Trigger a wild Pokemon encounter"""
-        import random
-        
         # Check if player has Pokemon
         if not self.save_data or 'party' not in self.save_data or len(self.save_data['party']) == 0:
             logger.warning("Player has no Pokemon! Can't battle.")
@@ -307,20 +293,13 @@ class CaveScene:
             self._reset_encounter_counter()
             return
         
-        # Cave Pokemon pool (corrupted/ghost types fit dark theme)
-        cave_pokemon = [
-            {'name': 'Zubat', 'level': random.randint(3, 6)},
-            {'name': 'Gastly', 'level': random.randint(4, 7)},
-            {'name': 'Haunter', 'level': random.randint(5, 8)},
-            {'name': 'Misdreavus', 'level': random.randint(4, 7)},
-        ]
-        
-        # Pick random Pokemon
-        wild_pokemon_data = random.choice(cave_pokemon)
-        logger.info(f"Wild {wild_pokemon_data['name']} (Lv.{wild_pokemon_data['level']}) appeared!")
+        # Cave pool (corrupted/ghost types) lives in assets/data/encounters.json
+        encounter = self.encounter_table.roll()
+        veteran_note = " (veteran)" if encounter.veteran else ""
+        logger.info(f"Wild {encounter.species} (Lv.{encounter.level}){veteran_note} appeared!")
         
         # Create wild Pokemon instance
-        wild_pokemon = self._create_wild_pokemon(wild_pokemon_data['name'], wild_pokemon_data['level'])
+        wild_pokemon = create_wild_pokemon(encounter)
         
         # Reset counter for next encounter
         self._reset_encounter_counter()
@@ -328,39 +307,6 @@ class CaveScene:
         # Start battle
         self._start_battle(wild_pokemon)
     
-    def _create_wild_pokemon(self, name, level):
-        """Create a wild Pokemon instance"""
-        # Basic Pokemon stats (would normally come from database)
-        pokemon_stats = {
-            'Zubat': {'hp': 15, 'attack': 8, 'defense': 6, 'speed': 12, 'type': ['Poison', 'Flying']},
-            'Gastly': {'hp': 12, 'attack': 10, 'defense': 5, 'speed': 15, 'type': ['Ghost', 'Poison']},
-            'Haunter': {'hp': 18, 'attack': 13, 'defense': 8, 'speed': 18, 'type': ['Ghost', 'Poison']},
-            'Misdreavus': {'hp': 16, 'attack': 10, 'defense': 10, 'speed': 17, 'type': ['Ghost']},
-        }
-        
-        stats = pokemon_stats.get(name, {'hp': 15, 'attack': 10, 'defense': 8, 'speed': 12, 'type': ['Normal']})
-        
-        # Scale stats with level
-        hp = stats['hp'] + (level * 2)
-        attack = stats['attack'] + level
-        defense = stats['defense'] + level
-        speed = stats['speed'] + level
-        
-        return {
-            'name': name,
-            'level': level,
-            'hp': hp,
-            'max_hp': hp,
-            'attack': attack,
-            'defense': defense,
-            'speed': speed,
-            'type': stats['type'],
-            'moves': [
-                {'name': 'Tackle', 'pp': 35, 'max_pp': 35, 'power': 40, 'type': 'Normal'},
-            ],
-            'status': None
-        }
-    
     def _start_battle(self, wild_pokemon):
         """Start a battle with wild Pokemon"""
         logger.info(f"Starting battle with {wild_pokemon['name']}!")
@@ -408,24 +354,12 @@ class CaveScene:
                 self.save_data['party'] = []
             
             # Create corrupted starter Pokemon
-            starter_pokemon = {
-                'name': 'Charmander',
+            starter_pokemon = create_pokemon_dict('Charmander', 5)  # Species moveset: Scratch, Ember
+            starter_pokemon.update({
                 'nickname': 'Ember',
-                'level': 5,
                 'exp': 0,
-                'hp': 25,
-                'max_hp': 25,
-                'attack': 12,
-                'defense': 10,
-                'speed': 15,
-                'type': ['Fire'],
-                'moves': [
-                    {'name': 'Scratch', 'pp': 35, 'max_pp': 35, 'power': 40, 'type': 'Normal'},
-                    {'name': 'Ember', 'pp': 25, 'max_pp': 25, 'power': 40, 'type': 'Fire'}
-                ],
-                'status': None,
                 'corrupted': True  # Special flag for story purposes
-            }
+            })
             
             self.save_data['party'].append(starter_pokemon)
             logger.info(f"Player received starter Pokemon: {starter_pokemon['name']} (Corrupted)")
@@ -445,28 +379,18 @@ class CaveScene:
             self.save_data['progress']['current_scene'] = 'cave'
             self.save_manager.save_game(self.save_data)
 
-    def _check_exit(self):
-        if self.player.rect.colliderect(self.exit_rect):
-            if self.save_data:
-                cave_x = 35 * TILE_SIZE
-                cave_y = 1 * TILE_SIZE
-                self.save_data['progress']['outside_position'] = {'x': cave_x + 40, 'y': cave_y + 100}
-                self.save_manager.save_game(self.save_data)
-            return True
-        return False
+    def _leave_cave(self, trigger):
+        """Exit trigger: spawn outside in front of the cave entrance"""
+        cave_x = 35 * TILE_SIZE
+        cave_y = 1 * TILE_SIZE
+        save_spawn(self.save_manager, self.save_data, 'outside_position', cave_x + 40, cave_y + 100)
+        self.exit_cave = True
+        self.running = False
 
     def _check_interactions(self):
-        self.nearby_object = None
-        self.show_e_prompt = False
-        player_center = self.player.rect.center
-        
-        for obj_name, obj_data in self.interactive_objects.items():
-            obj_center = obj_data['sprite'].rect.center
-            distance = ((player_center[0] - obj_center[0]) ** 2 + (player_center[1] - obj_center[1]) ** 2) ** 0.5
-            if distance <= obj_data['interaction_range']:
-                self.nearby_object = obj_name
-                self.show_e_prompt = True
-                break
+        # Cached by the index until the player moves
+        self.nearby_object = self.interaction_index.nearby(self.player.rect.center)
+        self.show_e_prompt = self.nearby_object is not None
 
     def update(self, dt):
         if self.paused:
@@ -474,13 +398,15 @@ class CaveScene:
                 self.pause_menu.update(dt)
             return
 
+        get_animation_clock().tick(dt)
+
         if not self.player_locked:
             # Store old position
             old_x = self.player.rect.x
             old_y = self.player.rect.y
             
             keys = pygame.key.get_pressed()
-            self.player.update(keys, self.collision_rects, dt)
+            self.player.update(keys, self.collision_world, dt)
             
             # Check if player moved
             if (old_x != self.player.rect.x or old_y != self.player.rect.y):
@@ -490,9 +416,7 @@ class CaveScene:
         self.camera.update()
         self._check_interactions()
 
-        if self._check_exit():
-            self.exit_cave = True
-            self.running = False
+        self.triggers.update(self.player.rect)
 
     def draw(self):
         self.screen.fill((0, 0, 0))
@@ -504,12 +428,12 @@ class CaveScene:
             sprite._sort_key = getattr(sprite, 'visual_rect', sprite.rect).bottom
         all_sprites.sort(key=lambda x: x[1]._sort_key)
 
-        for sprite_type, sprite in all_sprites:
-            if sprite_type == 'player':
-                player_pos = (sprite.visual_rect.centerx - self.camera.offset.x, sprite.visual_rect.centery - self.camera.offset.y)
-                self.cave_effects.draw_player_glow(self.game_surface, player_pos)
+        for _, sprite in all_sprites:
             sprite.draw(self.game_surface, self.camera)
 
+        # All cave lights in one multiply pass (player glow included)
+        self.cave_effects.apply_lighting(self.game_surface, self.camera.offset, self.player.visual_rect.center)
+
         if self.debug_mode and self.debugger:
             self.debugger.draw_debug_overlay(self.game_surface, self.player.rect, self.camera.offset, self.furniture_sprites.sprites(), self.collision_rects)
 
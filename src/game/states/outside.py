@@ -7,12 +7,17 @@ import pygame
 from constants import (
     DEFAULT_SCREEN_WIDTH as SCREEN_WIDTH, 
     DEFAULT_SCREEN_HEIGHT as SCREEN_HEIGHT,
-    TILE_SIZE, GAME_WIDTH, GAME_HEIGHT,
-    HOUSE_WALL_THICKNESS, HOUSE_COLLISION_INSET, HOUSE_DOORWAY_WIDTH
+    TILE_SIZE, GAME_WIDTH, GAME_HEIGHT, MAX_FRAME_DT
 )
 from core.asset_manager import get_asset_manager
 from core.logger import get_logger
 from core.entities import Player, Camera
+from core.collision import CollisionWorld
+from core.tile_grid import TILE_ROAD
+from core.world_streaming import RegionStreamer
+from core.entity_store import ENTITY_SOLID, ENTITY_VISIBLE, EntityStore
+from core.triggers import TriggerRegistry, save_spawn
+from core.animation import get_animation_clock
 from core.game_debugger import GameDebugger
 from core.pause_menu import PauseMenu
 from core.visual_effects import GlobalEffects
@@ -53,6 +58,7 @@ class OutsideScene:
         self.return_to_menu = False
         self.enter_cave = False
         
+        get_asset_manager().set_scene('Outside')
         # Load assets
         self.assets = self._load_assets()
         
@@ -71,10 +77,11 @@ class OutsideScene:
             self.player = Player(spawn_x, spawn_y)
         
         self.camera = Camera(self.player)
+        self.streamer.update(self.player.rect.center, block=True)
         
         # Visual effects
         self.global_effects = GlobalEffects(SCREEN_WIDTH, SCREEN_HEIGHT)
-        self.frame_smoother = FrameTimeSmoother(max_dt=0.05)
+        self.frame_smoother = FrameTimeSmoother(max_dt=MAX_FRAME_DT)
         
         # Debug mode
         self.debug_mode = False
@@ -122,212 +129,70 @@ class OutsideScene:
         return assets
     
     def _setup_map(self):
-        """Create large village with multiple houses"""
-        # Much bigger map for a village
-        self.map_width = 40
-        self.map_height = 30
+        """Stream the village map by region (layout lives in assets/data/maps/outside.json)"""
+        self.entities = EntityStore()
+        self.collision_world = CollisionWorld()
+        self.triggers = TriggerRegistry()
+        self.trigger_handlers = {'house_door': self._enter_house, 'cave_entrance': self._enter_cave}
+        # Per loaded region: (static collision ids, entity handles, trigger names)
+        self.region_contents = {}
+
+        # Regions arrive from a loader thread; callbacks run on this thread in update()
+        self.streamer = RegionStreamer('outside', on_load=self._on_region_load, on_unload=self._on_region_unload)
+        self.map_width = self.streamer.width
+        self.map_height = self.streamer.height
+
+        logger.info(f"Village map streamed: {self.map_width}x{self.map_height} tiles in "
+                    f"{self.streamer.regions_x}x{self.streamer.regions_y} regions")
+
+    def _on_region_load(self, coord, region):
+        """Add a region's walls, objects (houses and the cave entrance) and triggers"""
+        rect_ids = [self.collision_world.add_static(rect) for rect in region.collision_rects]
+        handles = []
+        for obj in region.objects.values():
+            sprite_id = self.entities.register_sprite(obj.sprite, self.assets[obj.sprite])
+            handles.append(self.entities.spawn(obj.rect.x, obj.rect.y, sprite_id, ENTITY_VISIBLE | ENTITY_SOLID))
+        for name, rect in region.triggers.items():
+            self.triggers.add(name, rect, on_enter=self.trigger_handlers.get(name))
+        self.region_contents[coord] = (rect_ids, handles, list(region.triggers))
+
+    def _on_region_unload(self, coord, region):
+        rect_ids, handles, trigger_names = self.region_contents.pop(coord)
+        for rect_id in rect_ids:
+            self.collision_world.remove_static(rect_id)
+        for handle in handles:
+            self.entities.despawn(handle)
+        for name in trigger_names:
+            self.triggers.remove(name)
 
-        self.collision_rects = []
-        self.furniture_sprites = pygame.sprite.Group()
-        self.houses = []  # Track all houses for collision
-
-        # Tight border collisions
-        border_thickness = 4
-
-        # Map borders
-        self.collision_rects.extend([
-            pygame.Rect(0, 0, self.map_width * TILE_SIZE, border_thickness),  # Top
-            pygame.Rect(0, self.map_height * TILE_SIZE - border_thickness,
-                       self.map_width * TILE_SIZE, border_thickness),  # Bottom
-            pygame.Rect(0, 0, border_thickness, self.map_height * TILE_SIZE),  # Left
-            pygame.Rect(self.map_width * TILE_SIZE - border_thickness, 0,
-                       border_thickness, self.map_height * TILE_SIZE)  # Right
-        ])
-
-        # Create village layout with multiple houses
-        # House positions (tile coordinates): (x, y, has_door)
-        house_positions = [
-            (8, 3, True),   # Player's house (top-left area) - ENTRANCE
-            (25, 3, False),  # House top-right
-            (8, 15, False),  # House mid-left
-            (25, 15, False), # House mid-right
-            (16, 22, False), # House bottom-center
-        ]
-
-        # Create dirt road network
-        self.road_tiles = []
-
-        # Horizontal main road (middle of map)
-        for x in range(5, 35):
-            self.road_tiles.append((x, 12))
-            self.road_tiles.append((x, 13))
-
-        # Vertical roads connecting houses
-        for y in range(3, 13):
-            self.road_tiles.append((12, y))
-            self.road_tiles.append((13, y))
-            self.road_tiles.append((22, y))
-            self.road_tiles.append((23, y))
-
-        # Road to bottom house
-        for y in range(13, 23):
-            self.road_tiles.append((17, y))
-            self.road_tiles.append((18, y))
-
-        # Add houses to map
-        for i, (tile_x, tile_y, has_door) in enumerate(house_positions):
-            house_sprite = pygame.sprite.Sprite()
-            house_sprite.image = self.assets['house']
-            house_x = tile_x * TILE_SIZE
-            house_y = tile_y * TILE_SIZE
-            house_sprite.rect = house_sprite.image.get_rect(topleft=(house_x, house_y))
-            house_sprite.draw = lambda surface, camera, hs=house_sprite: surface.blit(
-                hs.image, hs.rect.topleft - camera.offset
-            )
-            self.furniture_sprites.add(house_sprite)
-
-            # Store first house as player house (with entrance)
-            if has_door:
-                self.house_sprite = house_sprite
-
-            self.houses.append({
-                'sprite': house_sprite,
-                'has_door': has_door
-            })
-
-            # Add collision for this house
-            wall_thickness = 5
-            inset = 12
-
-            # House walls
-            left_wall = pygame.Rect(
-                house_sprite.rect.x + inset,
-                house_sprite.rect.y + inset,
-                wall_thickness,
-                house_sprite.rect.height - inset * 2
-            )
-
-            right_wall = pygame.Rect(
-                house_sprite.rect.right - inset - wall_thickness,
-                house_sprite.rect.y + inset,
-                wall_thickness,
-                house_sprite.rect.height - inset * 2
-            )
-
-            top_wall = pygame.Rect(
-                house_sprite.rect.x + inset,
-                house_sprite.rect.y + inset,
-                house_sprite.rect.width - inset * 2,
-                wall_thickness
-            )
-
-            # Bottom wall - only add doorway for player house
-            if has_door:
-                doorway_width = 20
-                doorway_center = house_sprite.rect.centerx
-
-                bottom_left = pygame.Rect(
-                    house_sprite.rect.x + inset,
-                    house_sprite.rect.bottom - inset - wall_thickness,
-                    (doorway_center - doorway_width // 2) - (house_sprite.rect.x + inset),
-                    wall_thickness
-                )
-
-                bottom_right = pygame.Rect(
-                    doorway_center + doorway_width // 2,
-                    house_sprite.rect.bottom - inset - wall_thickness,
-                    (house_sprite.rect.right - inset) - (doorway_center + doorway_width // 2),
-                    wall_thickness
-                )
-
-                self.collision_rects.extend([left_wall, right_wall, top_wall, bottom_left, bottom_right])
-
-                # Doorway teleport trigger (only for player house)
-                self.house_doorway_rect = pygame.Rect(
-                    doorway_center - 10,
-                    house_sprite.rect.bottom - 8,
-                    20,
-                    12
-                )
-            else:
-                # Solid bottom wall for other houses
-                bottom_wall = pygame.Rect(
-                    house_sprite.rect.x + inset,
-                    house_sprite.rect.bottom - inset - wall_thickness,
-                    house_sprite.rect.width - inset * 2,
-                    wall_thickness
-                )
-                self.collision_rects.extend([left_wall, right_wall, top_wall, bottom_wall])
-
-        # Add cave entrance (outside village, beyond top border)
-        cave_sprite = pygame.sprite.Sprite()
-        cave_sprite.image = self.assets['cave_entrance']
-        cave_x = 35 * TILE_SIZE  # Far right, outside village
-        cave_y = 1 * TILE_SIZE  # Near top edge
-        cave_sprite.rect = cave_sprite.image.get_rect(topleft=(cave_x, cave_y))
-        cave_sprite.draw = lambda surface, camera: surface.blit(
-            cave_sprite.image, cave_sprite.rect.topleft - camera.offset
-        )
-        self.furniture_sprites.add(cave_sprite)
-        self.cave_sprite = cave_sprite
-
-        # Cave collision (walls around entrance)
-        cave_wall_thickness = 5
-        cave_inset = 8
-
-        # Left wall of cave
-        cave_left = pygame.Rect(
-            cave_sprite.rect.x + cave_inset,
-            cave_sprite.rect.y + cave_inset,
-            cave_wall_thickness,
-            cave_sprite.rect.height - cave_inset * 2
-        )
-
-        # Right wall of cave
-        cave_right = pygame.Rect(
-            cave_sprite.rect.right - cave_inset - cave_wall_thickness,
-            cave_sprite.rect.y + cave_inset,
-            cave_wall_thickness,
-            cave_sprite.rect.height - cave_inset * 2
-        )
-
-        # Top wall of cave
-        cave_top = pygame.Rect(
-            cave_sprite.rect.x + cave_inset,
-            cave_sprite.rect.y + cave_inset,
-            cave_sprite.rect.width - cave_inset * 2,
-            cave_wall_thickness
-        )
-
-        self.collision_rects.extend([cave_left, cave_right, cave_top])
-
-        # Cave entrance teleport trigger (in front of cave)
-        self.cave_entrance_rect = pygame.Rect(
-            cave_sprite.rect.centerx - 15,
-            cave_sprite.rect.bottom - 10,
-            30,
-            15
-        )
-
-        logger.info(f"Village map created: {self.map_width}x{self.map_height} with {len(self.houses)} houses and cave entrance")
-    
     def _draw_map(self):
-        """Draw outdoor ground tiles"""
-        cam_offset = self.camera.offset
-
-        # Draw grass tiles
-        for y in range(self.map_height):
-            for x in range(self.map_width):
-                pos_x = x * TILE_SIZE - cam_offset.x
-                pos_y = y * TILE_SIZE - cam_offset.y
-
-                # Check if this is a road tile
-                if (x, y) in self.road_tiles:
-                    self.game_surface.blit(self.assets['dirt'], (pos_x, pos_y))
-                else:
-                    # Use grass variations
-                    grass_tile = self.assets['grass'][(x + y) % len(self.assets['grass'])]
-                    self.game_surface.blit(grass_tile, (pos_x, pos_y))
+        """Draw the on-screen ground tiles of the loaded regions"""
+        cam_x, cam_y = int(self.camera.offset.x), int(self.camera.offset.y)
+        size = self.streamer.region_size
+        grass = self.assets['grass']
+        dirt = self.assets['dirt']
+
+        for (rx, ry), region in self.streamer.regions.items():
+            grid = region.tile_grid
+            flags = grid.flags
+            x0, y0 = rx * size, ry * size
+            first_x = max(0, cam_x // TILE_SIZE - x0)
+            last_x = min(grid.width, (cam_x + GAME_WIDTH) // TILE_SIZE - x0 + 1)
+            first_y = max(0, cam_y // TILE_SIZE - y0)
+            last_y = min(grid.height, (cam_y + GAME_HEIGHT) // TILE_SIZE - y0 + 1)
+
+            for y in range(first_y, last_y):
+                row = y * grid.width
+                world_y = y0 + y
+                pos_y = world_y * TILE_SIZE - cam_y
+                for x in range(first_x, last_x):
+                    world_x = x0 + x
+                    pos_x = world_x * TILE_SIZE - cam_x
+                    if flags[row + x] & TILE_ROAD:
+                        self.game_surface.blit(dirt, (pos_x, pos_y))
+                    else:
+                        # Grass variations keyed by world tile, so region edges don't show
+                        self.game_surface.blit(grass[(world_x + world_y) % len(grass)], (pos_x, pos_y))
     
     def handle_events(self):
         """Handle input events"""
@@ -375,6 +240,8 @@ class OutsideScene:
             if event.type == pygame.KEYDOWN and event.key == pygame.K_F1:
                 self.debug_mode = not self.debug_mode
                 logger.info(f"Debug mode: {'ON' if self.debug_mode else 'OFF'}")
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_F4 and self.debugger:
+                self.debugger.dump_asset_metrics()
     
     
     def _save_game(self):
@@ -389,48 +256,30 @@ class OutsideScene:
             if self.save_manager.save_game(self.save_data):
                 logger.info("Game saved successfully")
     
-    def _check_house_entry(self):
-        """Check if player is entering house"""
-        if self.player.rect.colliderect(self.house_doorway_rect):
-            logger.info("Player entering house door - going to bedroom!")
-            # Set the spawn position for bedroom scene (in front of rug)
-            if self.save_data:
-                # Bedroom map is 14 tiles wide x 12 tiles high
-                bedroom_map_width = 14
-                bedroom_map_height = 12
-
-                # Spawn at horizontal center of bedroom, above the rug
-                spawn_x = (bedroom_map_width * TILE_SIZE) // 2
-                spawn_y = (bedroom_map_height - 2) * TILE_SIZE - 30  # 30 pixels above rug
-
-                self.save_data['progress']['bedroom_position'] = {
-                    'x': spawn_x,
-                    'y': spawn_y
-                }
-                self.save_manager.save_game(self.save_data)
-                logger.info(f"Set bedroom spawn to: ({spawn_x}, {spawn_y})")
-            return True
-        return False
-
-    def _check_cave_entry(self):
-        """Check if player is entering cave"""
-        if self.player.rect.colliderect(self.cave_entrance_rect):
-            logger.info("Player entering cave!")
-            # Set spawn position for cave scene (at entrance/exit)
-            if self.save_data:
-                cave_width = 20
-                cave_height = 10
-                # Spawn at bottom center (near exit)
-                spawn_x = (cave_width // 2) * TILE_SIZE
-                spawn_y = (cave_height - 3) * TILE_SIZE
-                self.save_data['progress']['cave_position'] = {
-                    'x': spawn_x,
-                    'y': spawn_y
-                }
-                self.save_manager.save_game(self.save_data)
-                logger.info(f"Set cave spawn to entrance: ({spawn_x}, {spawn_y})")
-            return True
-        return False
+    def _enter_house(self, trigger):
+        """House door trigger: spawn in the bedroom in front of the rug"""
+        logger.info("Player entering house - teleporting to bedroom")
+        # Bedroom map is 14 tiles wide x 12 tiles high
+        bedroom_map_width = 14
+        bedroom_map_height = 12
+        # Spawn at horizontal center of bedroom, above the rug
+        spawn_x = (bedroom_map_width * TILE_SIZE) // 2
+        spawn_y = (bedroom_map_height - 2) * TILE_SIZE - 30  # 30 pixels above rug
+        save_spawn(self.save_manager, self.save_data, 'bedroom_position', spawn_x, spawn_y)
+        self.return_to_bedroom = True
+        self.running = False
+
+    def _enter_cave(self, trigger):
+        """Cave entrance trigger: spawn at the cave's exit"""
+        logger.info("Player entering cave")
+        cave_width = 20
+        cave_height = 10
+        # Spawn at bottom center (near exit)
+        spawn_x = (cave_width // 2) * TILE_SIZE
+        spawn_y = (cave_height - 3) * TILE_SIZE
+        save_spawn(self.save_manager, self.save_data, 'cave_position', spawn_x, spawn_y)
+        self.enter_cave = True
+        self.running = False
     
     def update(self, dt):
         """Update game state"""
@@ -439,21 +288,16 @@ class OutsideScene:
                 self.pause_menu.update(dt)
             return
 
+        get_animation_clock().tick(dt)
+        self.entities.update(dt)
+
         keys = pygame.key.get_pressed()
-        self.player.update(keys, self.collision_rects, dt)
+        self.player.update(keys, self.collision_world, dt)
         self.camera.update()
+        self.streamer.update(self.player.rect.center)
 
-        # Check for house entry
-        if self._check_house_entry():
-            logger.info("Player entering house - teleporting to bedroom")
-            self.return_to_bedroom = True
-            self.running = False
-
-        # Check for cave entry
-        if self._check_cave_entry():
-            logger.info("Player entering cave")
-            self.enter_cave = True
-            self.running = False
+        # House door and cave entrance warps
+        self.triggers.update(self.player.rect)
     
     
     def draw(self):
@@ -463,26 +307,9 @@ class OutsideScene:
         # Draw map
         self._draw_map()
         
-        # Draw sprites
-        all_sprites = [('player', self.player)]
-        for sprite in self.furniture_sprites.sprites():
-            all_sprites.append(('furniture', sprite))
-        
-        # Sort by depth
-        for sprite_type, sprite in all_sprites:
-            if hasattr(sprite, 'visual_rect'):
-                sprite._sort_key = sprite.visual_rect.bottom
-            else:
-                sprite._sort_key = sprite.rect.bottom
-        
-        all_sprites.sort(key=lambda item: item[1]._sort_key)
-        
-        # Draw all sprites
-        for sprite_type, sprite in all_sprites:
-            if sprite_type == 'player':
-                sprite.draw(self.game_surface, self.camera)
-            else:
-                sprite.draw(self.game_surface, self.camera)
+        # Draw entities and the player, depth-sorted by bottom edge
+        self.entities.draw(self.game_surface, self.camera,
+                           others=[(self.player.visual_rect.bottom, self.player)])
         
         # Debug mode
         if self.debug_mode and self.debugger:
@@ -490,19 +317,21 @@ class OutsideScene:
                 self.game_surface,
                 self.player.rect,
                 self.camera.offset,
-                self.furniture_sprites.sprites(),
-                self.collision_rects
+                self.entities.handles(),
+                self.collision_world.rects
             )
             
-            # Show house doorway teleport zone (in debug mode)
-            cam_offset = self.camera.offset
-            door_screen_rect = pygame.Rect(
-                self.house_doorway_rect.x - cam_offset.x,
-                self.house_doorway_rect.y - cam_offset.y,
-                self.house_doorway_rect.width,
-                self.house_doorway_rect.height
-            )
-            pygame.draw.rect(self.game_surface, (0, 255, 0), door_screen_rect, 3)  # Green door zone
+            # Show house doorway teleport zone (in debug mode, once its region is loaded)
+            door = self.triggers.triggers.get('house_door')
+            if door:
+                cam_offset = self.camera.offset
+                door_screen_rect = pygame.Rect(
+                    door.rect.x - cam_offset.x,
+                    door.rect.y - cam_offset.y,
+                    door.rect.width,
+                    door.rect.height
+                )
+                pygame.draw.rect(self.game_surface, (0, 255, 0), door_screen_rect, 3)  # Green door zone
         
         # Scale to screen
         scaled_surface = pygame.transform.scale(self.game_surface, (SCREEN_WIDTH, SCREEN_HEIGHT))
@@ -546,6 +375,7 @@ class OutsideScene:
     def cleanup(self):
         """Cleanup outside scene resources"""
         logger.debug("Cleaning up outside scene")
+        self.streamer.close()
         # Save current position
         if self.save_data:
             self.save_data['progress']['outside_position'] = {
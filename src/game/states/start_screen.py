@@ -18,12 +18,12 @@ import pygame
 import sys
 import math
 import random
-import opensimplex
 from datetime import datetime
 from constants import DEFAULT_SCREEN_WIDTH, DEFAULT_SCREEN_HEIGHT, FPS, Colors
 from ui.ui_components import Button, GradientBackground, VignetteEffect
-from core.logger import get_logger
-from core.save_manager import get_save_manager
+from core.logger import get_logger, end_startup
+from core.save_manager import save_file_exists
+from core.noise_tables import noise1
 
 logger = get_logger('StartScreen')
 
@@ -46,7 +46,7 @@ class Particle:
         self.life -= dt
         self.y += self.velocity_y * dt * 60  # Scale velocity by dt
         # Use Perlin noise to create a gentle, natural drift
-        self.x = self.start_x + opensimplex.noise2(self.y * 0.01 + self.noise_offset, 0) * 15
+        self.x = self.start_x + noise1(self.y * 0.01 + self.noise_offset) * 15
 
     def draw(self, surface):
         """Draw the particle with fading alpha."""
@@ -114,7 +114,7 @@ class Candle:
         segments = 20
         for i in range(segments + 1):
             y = self.y - (self.height * (i / segments))
-            x_offset = opensimplex.noise2(y * 0.05, 0) * 5
+            x_offset = noise1(y * 0.05) * 5
             x_left = self.x - self.width / 2 + x_offset
             x_right = self.x + self.width / 2 + x_offset
             if i == 0:
@@ -138,7 +138,7 @@ class Candle:
             drip_points.append((start_x, start_y))
             for i in range(1, 20):
                 y = start_y + (length / 20) * i
-                x_offset = opensimplex.noise2(y * 0.1, 0) * (width * 0.5)
+                x_offset = noise1(y * 0.1) * (width * 0.5)
                 drip_points.append((start_x + x_offset, y))
             drips.append(drip_points)
         return drips
@@ -330,9 +330,8 @@ class PokemonStartScreen:
         self.audio = get_audio_manager()
         self.audio.play_music('menu')  # Start the menu theme
         
-        # Check for save file
-        self.save_manager = get_save_manager()
-        self.has_save = self.save_manager.save_exists()
+        # Check for save file (the save manager itself is created on first use)
+        self.has_save = save_file_exists()
         logger.info(f"Save file exists: {self.has_save}")
 
         # Screen settings
@@ -438,7 +437,7 @@ class PokemonStartScreen:
     def _precompute_noise(self):
         """Precompute noise values to reduce per-frame calculations."""
         for i in range(self.noise_cache_size):
-            self.noise_cache.append(opensimplex.noise2(i * 0.1, 0))
+            self.noise_cache.append(noise1(i * 0.1))
     
     def _precompute_candle_elements(self):
         """Pre-render static candle elements for performance."""
@@ -733,11 +732,16 @@ class PokemonStartScreen:
     def run(self):
         """Main application loop."""
         logger.info("Starting Pokémon Faiths start screen...")
+        first_frame = True
         while self.running:
             dt = self.clock.tick(self.FPS) / 1000.0
             self.handle_events()
             self.update(dt)
             self.render()
+            if first_frame:
+                # Startup is over once something is on screen
+                end_startup()
+                first_frame = False
         
         # Return None if user quit, or the menu selection if they chose an option
         result = getattr(self, 'menu_selection', None)
@@ -746,12 +750,12 @@ class PokemonStartScreen:
 
 if __name__ == "__main__":
     try:
-        # The opensimplex library is required for this version.
-        # You can install it with: pip install opensimplex
+        # Noise comes from assets/data/noise_table.bin; opensimplex is only
+        # needed if that table is missing (pip install opensimplex)
         start_screen = PokemonStartScreen()
         start_screen.run()
     except ImportError:
-        print("Error: The 'opensimplex' library is required.")
+        print("Error: noise table missing and the 'opensimplex' library is not installed.")
         print("Please install it by running: pip install opensimplex")
         sys.exit(1)
     except Exception as e:
@@ -8,10 +8,10 @@ import pygame
 import sys
 from constants import DEFAULT_SCREEN_WIDTH, DEFAULT_SCREEN_HEIGHT
 from core.logger import init_logger, get_logger
-from core.save_manager import get_save_manager
 
-# Initialize logging system
-init_logger(log_to_file=True)
+# Initialize logging system in startup mode: the log file is created once
+# the start screen's first frame is up (see core.logger.end_startup)
+init_logger(log_to_file=True, startup=True)
 logger = get_logger('Main')
 
 class GameStateManager:
@@ -20,7 +20,15 @@ class GameStateManager:
     def __init__(self):
         self.screen_width = DEFAULT_SCREEN_WIDTH
         self.screen_height = DEFAULT_SCREEN_HEIGHT
-        self.save_manager = get_save_manager()
+        self._save_manager = None
+    
+    @property
+    def save_manager(self):
+        """Save manager, imported on first use to keep it off the startup path"""
+        if self._save_manager is None:
+            from core.save_manager import get_save_manager
+            self._save_manager = get_save_manager()
+        return self._save_manager
         
     def initialize_pygame(self):
         """Initialize pygame systems with proper error handling"""
@@ -148,14 +156,18 @@ class GameStateManager:
             # Create Pokemon objects (this game uses Veteran System, not levels)
             player_pokemon = Pokemon(
                 species=player_pokemon_data['name'],
-                nickname=player_pokemon_data.get('nickname', player_pokemon_data['name'])
+                nickname=player_pokemon_data.get('nickname', player_pokemon_data['name']),
+                moves=[move['name'] for move in player_pokemon_data.get('moves', [])]
             )
+            # Older saves have no moveset: store the species default
+            player_pokemon_data.setdefault('moves', player_pokemon.moveset_entries())
             # Set HP
             player_pokemon.current_hp_percent = (player_pokemon_data['hp'] / player_pokemon_data['max_hp']) * 100
             
             enemy_pokemon = Pokemon(
                 species=enemy_pokemon_data['name'],
-                nickname=enemy_pokemon_data['name']
+                nickname=enemy_pokemon_data['name'],
+                moves=[move['name'] for move in enemy_pokemon_data.get('moves', [])]
             )
             enemy_pokemon.current_hp_percent = 100
             
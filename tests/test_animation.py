@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Test script for animation clips and the shared playback clock
+Runs headless with the SDL dummy video driver
+"""
+
+import os
+import sys
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import pygame
+from core.animation import AnimationClock, AnimationPlayer, load_clip
+
+WALK_EAST = [f'assets/sprites/animations/walk/east/frame_{i:03d}.png' for i in range(6)]
+
+
+def _init_display():
+    """convert_alpha() needs a display surface"""
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+
+
+def test_frame_timing():
+    """Frames advance by duration and loop"""
+    print("=== Testing Clip Timing ===")
+    _init_display()
+    clip = load_clip('walk_east', WALK_EAST, (48, 48), [0.1, 0.1, 0.1, 0.1, 0.1, 0.5])
+
+    assert clip.frame_index_at(0.0) == 0
+    assert clip.frame_index_at(0.15) == 1
+    assert clip.frame_index_at(0.75) == 5
+    assert clip.frame_index_at(1.0 + 0.05) == 0  # Looped
+
+
+def test_mirrored_clip_is_shared():
+    """Mirrored clips are cached and reuse the source frames"""
+    print("=== Testing Mirrored Clips ===")
+    _init_display()
+    clip = load_clip('walk_east', WALK_EAST, (48, 48), 0.1)
+    west = clip.mirrored('walk_west')
+
+    assert west is clip.mirrored('another_name')
+    assert west.mirrored() is clip
+    source = clip.frames[0]
+    assert west.frames[0].get_at((10, 20)) == source.get_at((source.get_width() - 11, 20))
+
+
+def test_player_shares_clock():
+    """Players read frames from the shared clock instead of accumulating their own"""
+    print("=== Testing Shared Clock ===")
+    _init_display()
+    clock = AnimationClock()
+    clip = load_clip('walk_east', WALK_EAST, (48, 48), 0.1)
+    first = AnimationPlayer(clip, clock)
+    clock.tick(0.25)
+    second = AnimationPlayer(clip, clock)
+
+    assert first.frame_index == 2
+    assert second.frame_index == 0
+    clock.tick(0.12)
+    assert (first.frame_index, second.frame_index) == (3, 1)
+
+
+def test_player_uses_authored_west_art():
+    """West frames come from the west sprites, not a mirror of east"""
+    print("=== Testing Player West Sprites ===")
+    _init_display()
+    from core.entities import Player
+    player = Player(0, 0)
+    west = player.animations['west']['walk']
+    assert not west.mirrored_x
+    assert all('/west/' in path for path in west.frame_paths)
+
+
+def main():
+    """Run all tests"""
+    try:
+        test_frame_timing()
+        test_mirrored_clip_is_shared()
+        test_player_uses_authored_west_art()
+        test_player_shares_clock()
+        print("ALL ANIMATION TESTS PASSED")
+        return 0
+    except AssertionError as e:
+        print(f"!!! TEST FAILED !!! {e}")
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
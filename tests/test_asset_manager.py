@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Test script for the AssetManager transform pipeline
+Runs headless with the SDL dummy video driver
+"""
+
+import json
+import os
+import sys
+import tempfile
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import pygame
+from core.asset_manager import AssetManager, apply_transform, normalize_transforms
+from core.asset_pack import AssetPack, build_asset_pack
+
+GRASS = 'assets/images/grass_tile1.png'
+
+
+def _init_display():
+    """convert_alpha() needs a display surface"""
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+
+
+def test_transform_chain_is_memoized():
+    """Identical chains return the same shared surface"""
+    print("=== Testing Transform Memoization ===")
+    _init_display()
+    manager = AssetManager()
+
+    first = manager.load_image(GRASS, (34, 34), transforms=[('darken', 0.6)])
+    second = manager.load_image(GRASS, (34, 34), transforms=[('darken', 0.6)])
+    other = manager.load_image(GRASS, (34, 34), transforms=[('darken', 0.7)])
+
+    assert first is second
+    assert first is not other
+    # The scaled prefix is shared by both darkened variants
+    assert (GRASS, (('scale', (34, 34)),)) in manager.images
+    # The full-size source is not retained for scaled loads
+    assert (GRASS, ()) not in manager.images
+    print(f"Cached entries: {len(manager.images)}")
+
+
+def test_fit_preserves_aspect():
+    """fit_width / scale with a None side keep the aspect ratio"""
+    print("=== Testing Aspect-Preserving Fit ===")
+    _init_display()
+    manager = AssetManager()
+
+    base = manager.load_image('assets/images/damaged_bed.png')
+    fitted = manager.load_image('assets/images/damaged_bed.png', transforms=[('fit_width', 50)])
+    shorthand = manager.load_image('assets/images/damaged_bed.png', (50, None))
+
+    expected_h = int(50 * base.get_height() / base.get_width())
+    assert fitted.get_size() == (50, expected_h)
+    assert shorthand.get_size() == fitted.get_size()
+
+
+def test_pixel_ops():
+    """darken, tint, flip and palette operate on copies"""
+    print("=== Testing Pixel Operations ===")
+    surface = pygame.Surface((2, 1), pygame.SRCALPHA)
+    surface.set_at((0, 0), (200, 100, 50, 255))
+    surface.set_at((1, 0), (0, 0, 0, 0))
+
+    dark = apply_transform(surface, ('darken', 0.5))
+    assert tuple(dark.get_at((0, 0))) == (100, 50, 25, 255)
+    assert dark.get_at((1, 0)).a == 0  # Transparent pixels stay transparent
+    assert tuple(surface.get_at((0, 0))) == (200, 100, 50, 255)
+
+    flipped = apply_transform(surface, ('flip', (True, False)))
+    assert tuple(flipped.get_at((1, 0))) == (200, 100, 50, 255)
+
+    chain = normalize_transforms(None, [('palette', [((200, 100, 50), (1, 2, 3))])])
+    remapped = apply_transform(surface, chain[0])
+    assert tuple(remapped.get_at((0, 0)))[:3] == (1, 2, 3)
+
+
+def test_asset_pack_round_trip():
+    """Images decoded from the pack match the loose files"""
+    print("=== Testing Asset Pack ===")
+    _init_display()
+    loose = AssetManager()
+    loose.pack = None
+
+    with tempfile.TemporaryDirectory() as tmp:
+        pack_path = os.path.join(tmp, 'assets.pak')
+        count = build_asset_pack(loose.base_path, pack_path)
+        pack = AssetPack(pack_path)
+        packed = AssetManager()
+        packed.pack = pack
+        try:
+            assert count == len(pack) and GRASS in pack
+            with open(os.path.join(loose.base_path, GRASS), 'rb') as f:
+                assert pack.get_view(GRASS).tobytes() == f.read()
+
+            from_pack = packed.load_image(GRASS, (34, 34))
+            from_disk = loose.load_image(GRASS, (34, 34))
+            assert from_pack.get_size() == from_disk.get_size()
+            assert from_pack.get_at((5, 5)) == from_disk.get_at((5, 5))
+            print(f"Packed {count} files")
+        finally:
+            packed.pack = None
+            pack.close()
+
+
+def test_load_metrics():
+    """Hits, misses, bytes and scenes are recorded per asset"""
+    print("=== Testing Load Metrics ===")
+    _init_display()
+    manager = AssetManager()
+    manager.set_scene('Cave')
+    manager.load_image(GRASS, (34, 34))
+    manager.load_image(GRASS, (34, 34))
+    manager.set_scene('Outside')
+    manager.load_image(GRASS, (34, 34))
+
+    record = manager.metrics[GRASS]
+    assert (record['hits'], record['misses']) == (2, 1)
+    assert record['bytes'] == 34 * 34 * 4
+    assert record['decode_ms'] > 0
+    assert record['scenes'] == ['Cave', 'Outside']
+    assert manager.get_cache_info()['hit_rate'] == 2 / 3
+
+    with tempfile.TemporaryDirectory() as tmp:
+        output_path = manager.dump_metrics(os.path.join(tmp, 'metrics.json'))
+        with open(output_path) as f:
+            assert GRASS in json.load(f)['assets']
+
+
+def main():
+    """Run all tests"""
+    try:
+        test_transform_chain_is_memoized()
+        test_fit_preserves_aspect()
+        test_pixel_ops()
+        test_asset_pack_round_trip()
+        test_load_metrics()
+        print("ALL ASSET MANAGER TESTS PASSED")
+        return 0
+    except AssertionError as e:
+        print(f"!!! TEST FAILED !!! {e}")
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Test script for the battle AI search
+"""
+
+import random
+import sys
+import time
+
+from core.battle_ai import BattleAI, BattleSnapshot, MoveSearch, move_outcomes
+from core.battle_engine import ACTION_MOVE, ENEMY, PLAYER, BattleEngine
+from core.moves import get_move_database
+from core.pokemon import Pokemon
+
+
+def _engine(player_moves, enemy_moves, enemy_species="Misdreavus"):
+    move_db = get_move_database()
+    return BattleEngine(Pokemon("Charmander"), Pokemon(enemy_species),
+                        [move_db.get_move(name) for name in player_moves],
+                        [move_db.get_move(name) for name in enemy_moves], rng=random.Random(1))
+
+
+def test_outcomes_cover_accuracy_and_variance():
+    """Each move's chance outcomes sum to 1 and include the miss"""
+    print("=== Testing Move Outcomes ===")
+    engine = _engine(["Tackle", "Scratch"], ["Bite"])
+    tackle, scratch = move_outcomes(engine, PLAYER)
+    assert abs(sum(p for p, _ in tackle) - 1.0) < 1e-9 and abs(sum(p for p, _ in scratch) - 1.0) < 1e-9
+    assert tackle[0] == (1.0 - 0.95, 0.0) and len(tackle) == 4   # Miss + three variance samples
+    assert len(scratch) == 3                                        # Never misses
+    assert all(damage == 0 for _, damage in tackle)                 # Normal can't touch a Ghost
+
+
+def test_greedy_picks_effective_move():
+    """Even one ply avoids moves the defender is immune to"""
+    print("=== Testing Greedy Choice ===")
+    engine = _engine(["Tackle", "Scratch", "Bite", "Ember"], ["Tackle"])
+    ai = BattleAI(max_depth=1)
+    assert ai.choose(engine, PLAYER) == (ACTION_MOVE, 2)  # Bite is super effective on Misdreavus
+
+
+def test_deeper_search_prefers_sure_ko():
+    """Looking ahead, a sure KO over two turns beats a likelier but riskier one now"""
+    print("=== Testing Lookahead ===")
+    engine = _engine(["Scratch"], ["Scratch", "Body Slam"], enemy_species="Rattata")
+    engine.player_pokemon.current_hp_percent = 20
+    snapshot = BattleSnapshot(engine, ENEMY)
+
+    # One ply: Body Slam KOs unless it misses, Scratch only on 2 of 3 rolls
+    assert BattleAI(max_depth=1).search(snapshot) == (1, 1)
+    # Three plies: Scratch never misses and always finishes on the next turn
+    assert BattleAI(max_depth=3, time_budget_ms=500).search(snapshot) == (0, 3)
+
+
+def test_time_budget_and_worker_thread():
+    """Searches stop at the budget and return a move from the thread"""
+    print("=== Testing Search Budget ===")
+    engine = _engine(["Tackle", "Bite", "Ember", "Body Slam"], ["Tackle", "Bite", "Ember", "Body Slam"],
+                     enemy_species="Rattata")
+    ai = BattleAI(max_depth=12, time_budget_ms=30)
+    search = MoveSearch(ai)
+    start = time.perf_counter()
+    search.start(engine, ENEMY)
+    kind, index = search.result()
+    elapsed = time.perf_counter() - start
+    assert kind == ACTION_MOVE and 0 <= index < 4
+    assert 1 <= search.depth < 12
+    assert elapsed < 0.5
+
+    # The engine accepts the AI as its enemy policy
+    engine.enemy_policy = BattleAI(max_depth=1).choose
+    assert engine.run(max_turns=200) in ('win', 'faint', 'killed', None)
+
+
+def main():
+    """Run all tests"""
+    try:
+        test_outcomes_cover_accuracy_and_variance()
+        test_greedy_picks_effective_move()
+        test_deeper_search_prefers_sure_ko()
+        test_time_budget_and_worker_thread()
+        print("ALL BATTLE AI TESTS PASSED")
+        return 0
+    except AssertionError as e:
+        print(f"!!! TEST FAILED !!! {e}")
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Test script for batch damage resolution
+"""
+
+import random
+import sys
+
+from core import battle_batch
+from core.battle_batch import batch_damage, make_rng
+from core.moves import Move, MoveDatabase, get_move_database
+
+N = 20000
+
+
+def _scalar_stats(move, attack, defense, effectiveness, rng):
+    """Hit rate and mean damage from the one-hit-at-a-time path"""
+    hits = 0
+    total = 0.0
+    for _ in range(N):
+        if rng.random() <= move.accuracy:
+            hits += 1
+            total += move.calculate_damage(attack, defense, effectiveness, rng)
+    return hits / N, total / N
+
+
+def _check_batch(resolve, rng):
+    db = get_move_database()
+    move = db.get_move("Body Slam")
+    power, accuracy = db.table.columns([move.id] * N)
+    result = resolve([60] * N, [45] * N, power, accuracy, [2.0] * N, rng)
+    assert len(result.hits) == len(result.damage) == N
+
+    hit_rate, mean_damage = _scalar_stats(move, 60, 45, 2.0, random.Random(7))
+    assert abs(sum(result.hits) / N - hit_rate) < 0.015
+    assert abs(sum(result.damage) / N - mean_damage) / mean_damage < 0.02
+
+    # Damage stays inside the variance band; misses deal nothing
+    full = move.base_power * 60 / 45 * 0.4 * 2.0
+    for hit, damage in zip(result.hits, result.damage):
+        assert (full * 0.85 <= damage <= full) if hit else damage == 0
+
+
+def test_python_batch_matches_scalar():
+    """The fallback resolver has the scalar hit rate and damage distribution"""
+    print("=== Testing Batch Damage (pure Python) ===")
+    _check_batch(battle_batch._batch_damage_python, random.Random(3))
+
+
+def test_numpy_batch_matches_scalar():
+    """The NumPy resolver has the scalar hit rate and damage distribution"""
+    print("=== Testing Batch Damage (NumPy) ===")
+    if not battle_batch.HAVE_NUMPY:
+        print("numpy not installed, skipping")
+        return
+    _check_batch(battle_batch._batch_damage_numpy, make_rng(3))
+
+
+def test_status_moves_deal_no_damage():
+    """Status moves get power 0 in the move table columns"""
+    print("=== Testing Batch Status Moves ===")
+    db = MoveDatabase()
+    growl = Move("Growl", "normal", "status", 10, 1.0)
+    db.add_move(growl)
+    power, accuracy = db.table.columns([growl.id, db.get_move_id("Scratch")])
+    assert list(power) == [0.0, 35.0] and list(accuracy) == [1.0, 1.0]
+    result = batch_damage([50, 50], [50, 50], power, accuracy, [1.0, 1.0], make_rng(1))
+    assert list(result.hits) == [1, 1]
+    assert result.damage[0] == 0 and result.damage[1] > 0
+
+
+def main():
+    """Run all tests"""
+    try:
+        test_python_batch_matches_scalar()
+        test_numpy_batch_matches_scalar()
+        test_status_moves_deal_no_damage()
+        print("ALL BATCH DAMAGE TESTS PASSED")
+        return 0
+    except AssertionError as e:
+        print(f"!!! TEST FAILED !!! {e}")
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
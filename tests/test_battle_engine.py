@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Test script for the headless battle engine
+"""
+
+import random
+import sys
+import time
+
+from core.battle_engine import (
+    ACTION_MOVE, ENEMY, OUTCOME_RETREAT, PLAYER, BattleEngine
+)
+from core.moves import get_move_database
+from core.pokemon import Pokemon
+
+
+def _engine(seed, enemy_species="Rattata"):
+    move_db = get_move_database()
+    moves = [move_db.get_move(name) for name in ("Tackle", "Bite", "Ember", "Body Slam")]
+    return BattleEngine(Pokemon("Charmander", "Blaze"), Pokemon(enemy_species, "Wild"),
+                        moves, moves, rng=random.Random(seed))
+
+
+def test_step_api():
+    """Turns resolve player first, then enemy, until an outcome"""
+    print("=== Testing Battle Step API ===")
+    engine = _engine(1)
+    engine.choose_action(PLAYER, (ACTION_MOVE, 0))
+    entries = engine.resolve_turn()
+    assert entries[0].actor == PLAYER and entries[0].move.name == 'Tackle'
+    assert len(entries) == 2 and entries[1].actor == ENEMY
+    assert engine.turn == 1 and list(engine.log) == entries
+
+    outcome = engine.run(max_turns=200)
+    assert outcome in ('win', 'faint', 'killed')
+    last = engine.log[-1]
+    loser = engine.enemy_pokemon if outcome == 'win' else engine.player_pokemon
+    assert not loser.is_conscious
+    # Nobody acts after the battle is decided
+    assert last.actor == (PLAYER if outcome == 'win' else ENEMY)
+    assert engine.battle_log_entry()['outcome'] == outcome
+
+
+def test_deterministic_with_seed():
+    """The same seed replays the same battle"""
+    print("=== Testing Seeded Battles ===")
+    first, second = _engine(42), _engine(42)
+    first.run()
+    second.run()
+    assert first.log.to_bytes() == second.log.to_bytes()
+
+
+def test_retreat_and_throughput():
+    """Retreat ends the battle; headless battles run fast"""
+    print("=== Testing Retreat and Throughput ===")
+    engine = _engine(3)
+    engine.retreat()
+    assert engine.outcome == OUTCOME_RETREAT and not engine.log
+
+    start = time.perf_counter()
+    for seed in range(200):
+        _engine(seed).run()
+    elapsed = time.perf_counter() - start
+    print(f"200 battles in {elapsed * 1000:.1f}ms")
+    assert elapsed < 5.0
+
+
+def main():
+    """Run all tests"""
+    try:
+        test_step_api()
+        test_deterministic_with_seed()
+        test_retreat_and_throughput()
+        print("ALL BATTLE ENGINE TESTS PASSED")
+        return 0
+    except AssertionError as e:
+        print(f"!!! TEST FAILED !!! {e}")
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Test script for the binary battle event log
+"""
+
+import random
+import sys
+
+from core.battle_engine import ENEMY, PLAYER, BattleEngine
+from core.battle_events import BattleEventLog
+from core.moves import get_move_database, get_type_chart
+from core.pokemon import Pokemon
+
+
+def test_records_round_trip():
+    """Move.execute results pack into 10-byte records and decode back"""
+    print("=== Testing Event Records ===")
+    move_db = get_move_database()
+    ember = move_db.get_move("Ember")
+    attacker, defender = Pokemon("Charmander"), Pokemon("Oddish")
+    rng = random.Random(5)
+
+    log = BattleEventLog()
+    results = []
+    for _ in range(20):
+        defender.current_hp_percent = 100
+        result = ember.execute(attacker, defender, get_type_chart(), rng)
+        results.append(result)
+        log.record(PLAYER, ember, result)
+    assert len(log.to_bytes()) == 20 * 10
+
+    for event, result in zip(BattleEventLog.from_bytes(log.to_bytes()), results):
+        assert event.actor == PLAYER and event.move is ember and event.hit == result['hit']
+        assert abs(event.damage - result['damage']) < 1e-4
+        # Narration rendered from the record matches what execute produced
+        assert log.narrate(event)[0] == result['narrative']
+        if result['hit']:
+            assert event.effectiveness == 2.0
+
+
+def test_injury_and_summary():
+    """Injuries survive encoding; summary totals match a walk over the events"""
+    print("=== Testing Event Summary ===")
+    move_db = get_move_database()
+    moves = [move_db.get_move(name) for name in ("Body Slam", "Flamethrower", "Bite", "Scratch")]
+    engine = BattleEngine(Pokemon("Haunter"), Pokemon("Charmander"), moves, moves, rng=random.Random(11))
+    engine.run(max_turns=200)
+
+    events = list(engine.log)
+    summary = engine.log.summary()
+    assert summary['actions'] == len(events)
+    dealt = sum(e.damage for e in events if e.actor == PLAYER)
+    assert abs(summary['damage_dealt'][PLAYER] - dealt) < 1e-3
+    assert summary['injuries_caused'][ENEMY] == sum(1 for e in events if e.actor == ENEMY and e.injury)
+
+    for event in events:
+        if event.injury:
+            narrative, injury = engine.log.narrate(event)
+            assert injury and 'body' in injury
+
+    entry = engine.battle_log_entry()
+    assert len(entry['moves_used']) == sum(1 for e in events if e.actor == PLAYER)
+    assert entry['status_events'] == ['injury'] * summary['injuries_caused'][ENEMY]
+
+
+def test_rejects_partial_records():
+    """Truncated event data is refused"""
+    print("=== Testing Event Validation ===")
+    try:
+        BattleEventLog(b'\x00' * 7)
+        assert False, "Partial record accepted"
+    except ValueError:
+        pass
+    try:
+        BattleEventLog()[0]
+        assert False, "Empty log indexed"
+    except IndexError:
+        pass
+
+
+def main():
+    """Run all tests"""
+    try:
+        test_records_round_trip()
+        test_injury_and_summary()
+        test_rejects_partial_records()
+        print("ALL BATTLE EVENT TESTS PASSED")
+        return 0
+    except AssertionError as e:
+        print(f"!!! TEST FAILED !!! {e}")
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Test script for the Monte Carlo battle simulator
+"""
+
+import json
+import os
+import sys
+import tempfile
+
+from core.battle_sim import main as sim_main
+from core.battle_sim import run_simulation
+
+MATCHUPS = [('Charmander', 'Rattata'), ('Charmander', 'Zubat')]
+
+
+def test_reproducible_across_workers():
+    """Seeded chunks give identical totals in-process and in a pool"""
+    print("=== Testing Simulator Determinism ===")
+    single = run_simulation(MATCHUPS, 300, seed=5, workers=1, chunk_size=70)
+    pooled = run_simulation(MATCHUPS, 300, seed=5, workers=2, chunk_size=70)
+    assert [s.to_row() for s in single] == [s.to_row() for s in pooled]
+
+    row = single[0].to_row()
+    assert row['battles'] == 300
+    assert abs(row['win_rate'] + row['faint_rate'] + row['death_rate'] + row['timeout_rate'] - 1.0) < 1e-9
+    assert row['avg_turns_to_ko'] >= 1
+
+
+def test_cli_writes_reports():
+    """The CLI writes CSV and JSON reports"""
+    print("=== Testing Simulator CLI ===")
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = os.path.join(tmp, 'sim.csv')
+        json_path = os.path.join(tmp, 'sim.json')
+        assert sim_main(['--enemies', 'Rattata', '--battles', '50', '--workers', '1',
+                         '--player-moves', 'Tackle,Ember', '--csv', csv_path, '--json', json_path]) == 0
+        with open(csv_path, encoding='utf-8') as f:
+            lines = f.read().splitlines()
+        assert lines[0].startswith('player,enemy,battles,win_rate') and len(lines) == 2
+        with open(json_path, encoding='utf-8') as f:
+            report = json.load(f)
+        assert report['matchups'][0]['enemy'] == 'Rattata' and report['run']['battles_per_matchup'] == 50
+
+
+def main():
+    """Run all tests"""
+    try:
+        test_reproducible_across_workers()
+        test_cli_writes_reports()
+        print("ALL BATTLE SIMULATOR TESTS PASSED")
+        return 0
+    except AssertionError as e:
+        print(f"!!! TEST FAILED !!! {e}")
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
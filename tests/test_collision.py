@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Test script for the spatial hash collision world and movement resolver
+"""
+
+import random
+import sys
+
+import pygame
+from core.collision import CollisionWorld, SpatialHash, move_and_slide
+
+
+def test_query_matches_brute_force():
+    """Hashed queries find exactly the rects a full scan would"""
+    print("=== Testing Spatial Hash Queries ===")
+    rng = random.Random(7)
+    rects = [pygame.Rect(rng.randrange(0, 2000), rng.randrange(0, 2000),
+                         rng.randrange(1, 150), rng.randrange(1, 150)) for _ in range(300)]
+    world = CollisionWorld(rects)
+
+    for _ in range(200):
+        probe = pygame.Rect(rng.randrange(-50, 2000), rng.randrange(-50, 2000), 20, 12)
+        expected = probe.collidelist(rects) != -1
+        assert world.collides(probe) == expected
+        hits = [r for r in world.query(probe) if probe.colliderect(r)]
+        assert len(hits) == len(probe.collidelistall(rects))
+
+
+def test_query_is_local():
+    """Far-away rects are never candidates"""
+    print("=== Testing Query Locality ===")
+    grid = SpatialHash(cell_size=64)
+    near = pygame.Rect(10, 10, 30, 30)
+    grid.insert(near)
+    grid.insert(pygame.Rect(5000, 5000, 30, 30))
+    spanning = pygame.Rect(0, 0, 200, 8)
+    grid.insert(spanning)
+
+    candidates = grid.query(pygame.Rect(20, 20, 60, 60))
+    assert len(candidates) == 2 and near in candidates and spanning in candidates
+
+
+def test_dynamic_layer():
+    """Dynamic colliders move between cells and can be removed"""
+    print("=== Testing Dynamic Layer ===")
+    world = CollisionWorld()
+    world.set_dynamic('npc', pygame.Rect(0, 0, 20, 20))
+    assert world.collides(pygame.Rect(5, 5, 4, 4))
+
+    world.set_dynamic('npc', pygame.Rect(500, 500, 20, 20))
+    assert not world.collides(pygame.Rect(5, 5, 4, 4))
+    assert world.collides(pygame.Rect(505, 505, 4, 4))
+    assert len(world) == 1
+
+    world.remove_dynamic('npc')
+    assert len(world) == 0 and not world.dynamic.cells
+
+
+def test_remove_static():
+    """Static geometry added later (a streamed region) can be dropped by id"""
+    print("=== Testing Static Removal ===")
+    world = CollisionWorld([pygame.Rect(0, 0, 10, 10)])
+    wall = world.add_static(pygame.Rect(200, 0, 10, 100))
+    assert world.collides(pygame.Rect(205, 50, 2, 2))
+    world.remove_static(wall)
+    assert not world.collides(pygame.Rect(205, 50, 2, 2)) and len(world) == 1
+
+
+def test_fast_move_stops_flush():
+    """Large displacements sub-step, stop against the wall and don't tunnel"""
+    print("=== Testing Swept Movement ===")
+    world = CollisionWorld([pygame.Rect(100, 0, 4, 200)])  # Thin wall
+
+    mover = pygame.Rect(50, 50, 12, 8)
+    blocked = move_and_slide(mover, 200, 0, world)
+    assert blocked == (True, False)
+    assert mover.right == 100
+
+    mover = pygame.Rect(50, 50, 12, 8)
+    move_and_slide(mover, 30, 0, world)
+    assert mover.x == 80  # Free movement is exact
+
+
+def test_slides_along_wall():
+    """A blocked axis keeps the motion on the other axis"""
+    print("=== Testing Wall Sliding ===")
+    walls = [pygame.Rect(100, 0, 20, 200)]
+    mover = pygame.Rect(80, 50, 12, 8)
+    blocked = move_and_slide(mover, 10, 15, walls)
+    assert blocked == (True, False)
+    assert (mover.right, mover.y) == (100, 65)
+
+
+def test_overlap_does_not_push_back():
+    """Starting inside a collider never snaps the mover backwards"""
+    print("=== Testing Overlapping Start ===")
+    walls = [pygame.Rect(0, 0, 100, 100)]
+    mover = pygame.Rect(50, 50, 12, 8)
+    move_and_slide(mover, 5, 0, walls)
+    assert mover.x == 50
+
+
+def main():
+    """Run all tests"""
+    try:
+        test_query_matches_brute_force()
+        test_query_is_local()
+        test_dynamic_layer()
+        test_remove_static()
+        test_fast_move_stops_flush()
+        test_slides_along_wall()
+        test_overlap_does_not_push_back()
+        print("ALL COLLISION TESTS PASSED")
+        return 0
+    except AssertionError as e:
+        print(f"!!! TEST FAILED !!! {e}")
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
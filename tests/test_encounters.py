@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Test script for alias-table encounter sampling
+"""
+
+import random
+import sys
+
+from core.encounters import (
+    AliasTable, EncounterTable, create_wild_pokemon, get_encounter_table
+)
+from core.species import get_species
+
+
+def test_alias_distribution():
+    """Draw frequencies follow the weights"""
+    print("=== Testing Alias Table ===")
+    weights = [50, 30, 15, 5, 0]
+    table = AliasTable(weights)
+    rng = random.Random(7)
+    draws = 100000
+    counts = [0] * len(weights)
+    for _ in range(draws):
+        counts[table.sample(rng)] += 1
+    for weight, count in zip(weights, counts):
+        assert abs(count / draws - weight / 100) < 0.01, (weights, counts)
+    assert counts[-1] == 0
+
+
+def test_levels_and_veterans():
+    """Levels stay in range; veterans get the bonus"""
+    print("=== Testing Encounter Rolls ===")
+    table = EncounterTable('test', [('Zubat', 1, 3, 6), ('Haunter', 1, 5, 5)],
+                           veteran_chance=0.1, veteran_level_bonus=10)
+    rng = random.Random(1)
+    veterans = 0
+    for _ in range(5000):
+        encounter = table.roll(rng)
+        low, high = (3, 6) if encounter.species == 'Zubat' else (5, 5)
+        if encounter.veteran:
+            veterans += 1
+            low, high = low + 10, high + 10
+        assert low <= encounter.level <= high
+    assert 350 < veterans < 650
+
+    pokemon = create_wild_pokemon(table.roll(random.Random(3)))
+    assert pokemon['hp'] == pokemon['max_hp']
+    assert [move['name'] for move in pokemon['moves']] == list(get_species(pokemon['name']).moves)
+
+
+def test_shipped_cave_table():
+    """The cave zone loads from data"""
+    print("=== Testing Shipped Encounter Data ===")
+    cave = get_encounter_table('cave')
+    assert get_encounter_table('cave') is cave
+    assert set(cave.species) == {'Zubat', 'Gastly', 'Haunter', 'Misdreavus'}
+    assert 5 <= cave.roll_steps() <= 15
+
+    # Same odds as the old random.choice over the four species
+    rng = random.Random(5)
+    counts = {name: 0 for name in cave.species}
+    for _ in range(20000):
+        counts[cave.roll(rng).species] += 1
+    assert all(abs(count / 20000 - 0.25) < 0.015 for count in counts.values()), counts
+
+
+def main():
+    """Run all tests"""
+    try:
+        test_alias_distribution()
+        test_levels_and_veterans()
+        test_shipped_cave_table()
+        print("ALL ENCOUNTER TESTS PASSED")
+        return 0
+    except AssertionError as e:
+        print(f"!!! TEST FAILED !!! {e}")
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
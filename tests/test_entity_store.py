@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Test script for the struct-of-arrays entity store
+"""
+
+import sys
+
+import pygame
+from core.entity_store import ENTITY_ACTIVE, ENTITY_VISIBLE, EntityStore
+
+
+class _Camera:
+    def __init__(self, x=0, y=0):
+        self.offset = pygame.math.Vector2(x, y)
+
+
+def _square(color, size=10):
+    surface = pygame.Surface((size, size))
+    surface.fill(color)
+    return surface
+
+
+def test_spawn_update_despawn():
+    """Batched update moves entities; freed slots are reused safely"""
+    print("=== Testing Entity Lifecycle ===")
+    store = EntityStore()
+    sprite = store.register_sprite('villager', _square((255, 0, 0)))
+    assert store.register_sprite('villager', _square((0, 0, 0))) == sprite
+
+    walker = store.spawn(0, 0, sprite, velocity=(30.0, -10.0))
+    statue = store.spawn(50, 50, sprite)
+    store.update(0.5)
+    assert (walker.x, walker.y) == (15.0, -5.0)
+    assert (statue.x, statue.y) == (50.0, 50.0)
+
+    store.despawn(walker)
+    assert not walker.alive and len(store) == 1
+    reused = store.spawn(1, 2, sprite)
+    assert reused.index == walker.index and not walker.alive
+    store.despawn(walker)  # Stale handle: must not free the new entity
+    assert reused.alive and reused.flags & ENTITY_ACTIVE
+
+
+def test_draw_depth_and_culling():
+    """Entities draw sorted by bottom edge, interleaved with other drawables"""
+    print("=== Testing Batched Draw ===")
+    store = EntityStore()
+    red = store.register_sprite('red', _square((255, 0, 0)))
+    blue = store.register_sprite('blue', _square((0, 0, 255)))
+    store.spawn(5, 5, blue)   # Bottom 15, drawn last
+    store.spawn(0, 0, red)    # Bottom 10
+    store.spawn(500, 500, red)  # Off screen
+    hidden = store.spawn(0, 0, blue, flags=0)
+    assert hidden.flags == ENTITY_ACTIVE
+
+    drawn = []
+
+    class Marker:
+        def draw(self, surface, camera):
+            drawn.append(surface.get_at((7, 7)))
+            surface.fill((0, 255, 0), pygame.Rect(6, 6, 3, 3))
+
+    surface = pygame.Surface((40, 40))
+    store.draw(surface, _Camera(), others=[(12, Marker())])
+
+    assert tuple(drawn[0])[:3] == (255, 0, 0)  # Red already drawn before the marker
+    assert tuple(surface.get_at((7, 7)))[:3] == (0, 0, 255)  # Blue drawn over the marker
+    assert tuple(surface.get_at((2, 2)))[:3] == (255, 0, 0)  # Hidden entity not drawn
+    assert len(store.handles()) == 4 and store.handles()[0].rect == pygame.Rect(5, 5, 10, 10)
+
+
+def main():
+    """Run all tests"""
+    try:
+        test_spawn_update_despawn()
+        test_draw_depth_and_culling()
+        print("ALL ENTITY STORE TESTS PASSED")
+        return 0
+    except AssertionError as e:
+        print(f"!!! TEST FAILED !!! {e}")
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
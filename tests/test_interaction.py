@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Test script for the interactive object proximity index
+"""
+
+import random
+import sys
+
+from core.interaction import InteractionIndex
+
+
+def _brute_force(objects, position):
+    """Reference: first registered object within range"""
+    for name, (x, y, radius) in objects.items():
+        if ((position[0] - x) ** 2 + (position[1] - y) ** 2) ** 0.5 <= radius:
+            return name
+    return None
+
+
+def test_matches_linear_scan():
+    """Bucketed lookups agree with the old per-object distance loop"""
+    print("=== Testing Interaction Lookups ===")
+    rng = random.Random(3)
+    objects = {f'obj{i}': (rng.randrange(0, 800), rng.randrange(0, 600), rng.choice([30, 40, 45]))
+               for i in range(40)}
+    index = InteractionIndex()
+    for name, (x, y, radius) in objects.items():
+        index.add(name, (x, y), radius)
+
+    for _ in range(500):
+        position = (rng.randrange(-20, 820), rng.randrange(-20, 620))
+        assert index.nearby(position) == _brute_force(objects, position)
+
+
+def test_cached_until_moved():
+    """Standing still reuses the previous answer; changes invalidate it"""
+    print("=== Testing Change-Driven Rechecks ===")
+    index = InteractionIndex()
+    index.add('bed', (100, 100), 45)
+    assert index.nearby((110, 110)) == 'bed'
+
+    index.cells.clear()  # A recheck would now find nothing
+    assert index.nearby((110, 110)) == 'bed'
+    assert index.nearby((111, 110)) is None
+
+    index = InteractionIndex()
+    index.add('bed', (100, 100), 45)
+    assert index.nearby((111, 110)) == 'bed'
+    index.remove('bed')
+    assert index.nearby((111, 110)) is None and not index.cells
+    index.add('chest', (120, 100), 30)
+    assert index.nearby((111, 110)) == 'chest'
+
+
+def main():
+    """Run all tests"""
+    try:
+        test_matches_linear_scan()
+        test_cached_until_moved()
+        print("ALL INTERACTION TESTS PASSED")
+        return 0
+    except AssertionError as e:
+        print(f"!!! TEST FAILED !!! {e}")
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Test script for the low-resolution light map
+"""
+
+import sys
+
+import pygame
+from core.lighting import LightMap
+
+
+def _white(size=(64, 64)):
+    surface = pygame.Surface(size)
+    surface.fill((255, 255, 255))
+    return surface
+
+
+def test_ambient_and_point_lights():
+    """Ambient darkens everything; lights brighten around their position"""
+    print("=== Testing Light Accumulation ===")
+    light_map = LightMap((64, 64), (256, 256), ambient=(40, 40, 40))
+    surface = _white()
+    light_map.render(surface, (0, 0))
+    assert abs(surface.get_at((32, 32))[0] - 40) <= 2
+
+    surface = _white()
+    light_map.add_light((32, 32), 24, (200, 200, 200))
+    light_map.render(surface, (0, 0))
+    assert surface.get_at((32, 32))[0] > 150
+    assert abs(surface.get_at((2, 2))[0] - 40) <= 2
+    assert not light_map.dynamic_lights  # Dynamic lights last one frame
+
+
+def test_static_layer_follows_camera():
+    """Static lights are baked once and stay fixed in world space"""
+    print("=== Testing Baked Static Lights ===")
+    light_map = LightMap((64, 64), (256, 256), ambient=(40, 40, 40))
+    light_map.add_static_light((100, 100), 24, (200, 200, 200))
+
+    surface = _white()
+    light_map.render(surface, (68, 68))  # Light at view (32, 32)
+    layer = light_map._static_layer
+    assert surface.get_at((32, 32))[0] > 150
+
+    surface = _white()
+    light_map.render(surface, (0, 0))  # Light off screen
+    assert light_map._static_layer is layer
+    assert abs(surface.get_at((32, 32))[0] - 40) <= 2
+
+    light_map.add_static_light((10, 10), 8)
+    assert light_map._static_layer is None
+
+
+def main():
+    """Run all tests"""
+    try:
+        test_ambient_and_point_lights()
+        test_static_layer_follows_camera()
+        print("ALL LIGHTING TESTS PASSED")
+        return 0
+    except AssertionError as e:
+        print(f"!!! TEST FAILED !!! {e}")
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Test script for the map compiler and binary map loader
+"""
+
+import json
+import os
+import sys
+
+from core.asset_manager import get_asset_manager
+from core.maps import (
+    MAP_DIR, NO_SOURCE_HASH, MapError, compile_map, compile_map_source, load_map, parse_map, source_hash
+)
+from core.tile_grid import TILE_ENCOUNTER, TILE_ROAD, TILE_SOLID
+
+SOURCE = {
+    'name': 'test',
+    'width': 10,
+    'height': 8,
+    'border': 4,
+    'tiles': [{'flags': ['road'], 'regions': [[1, 1, 3, 2]], 'tiles': [[9, 7]]}],
+    'objects': [
+        {'name': 'hut', 'sprite': 'house', 'rect': [100, 100, 120, 100],
+         'walls': {'inset': 12, 'thickness': 5, 'doorway': 20}},
+        {'name': 'statue', 'rect': [20, 200, 34, 34], 'collision': [7, -1, 20, 20]}
+    ],
+    'triggers': [{'name': 'door', 'rect': [150, 192, 20, 12]}]
+}
+
+
+def test_compile_round_trip():
+    """Compiled maps decode back to the same layout"""
+    print("=== Testing Map Compiler ===")
+    data = parse_map('test', compile_map(SOURCE))
+
+    assert (data.width, data.height) == (10, 8)
+    assert len(data.collision_rects) == 4 + 5 + 1  # Border, walls with doorway, statue
+    assert tuple(data.collision_rects[-1]) == (27, 199, 20, 20)
+    assert data.objects['hut'].sprite == 'house' and data.objects['statue'].sprite == 'statue'
+    assert tuple(data.triggers['door']) == (150, 192, 20, 12)
+
+    grid = data.tile_grid
+    assert grid.count(TILE_ROAD) == 7
+    assert grid.has(0, 0, TILE_SOLID)
+    assert grid.trigger_at(4, 5) == 1  # Door trigger tile
+
+
+def test_truncated_map_rejected():
+    """Every cut of a compiled map raises MapError instead of a struct error"""
+    print("=== Testing Truncated Maps ===")
+    data = compile_map(SOURCE)
+    for length in range(len(data)):
+        try:
+            parse_map('test', data[:length])
+        except MapError:
+            continue
+        assert False, f"Map truncated to {length} bytes parsed"
+
+
+def test_source_hash_in_header():
+    """Compiled maps record the hash of the exact source bytes"""
+    print("=== Testing Map Source Hash ===")
+    raw = json.dumps(SOURCE).encode('utf-8')
+    assert parse_map('test', compile_map(SOURCE)).source_hash == NO_SOURCE_HASH
+    digest = parse_map('test', compile_map_source(raw)).source_hash
+    assert digest == source_hash(raw) and digest != source_hash(raw + b' ')
+
+
+def test_shipped_maps_are_current():
+    """The committed .map files match their JSON sources"""
+    print("=== Testing Shipped Maps ===")
+    base_path = get_asset_manager().base_path
+    map_dir = os.path.join(base_path, MAP_DIR)
+    names = [f[:-5] for f in os.listdir(map_dir) if f.endswith('.json')]
+    assert names
+
+    for name in names:
+        with open(os.path.join(map_dir, f'{name}.json'), 'rb') as f:
+            expected = compile_map_source(f.read())
+        with open(os.path.join(map_dir, f'{name}.map'), 'rb') as f:
+            assert f.read() == expected, f"{name}.map is stale, run python -m core.maps"
+
+    cave = load_map('cave')
+    assert cave.tile_grid.count(TILE_ENCOUNTER) == 24
+    assert 'exit' in cave.triggers and 'old_man' in cave.objects
+
+
+def main():
+    """Run all tests"""
+    try:
+        test_compile_round_trip()
+        test_truncated_map_rejected()
+        test_source_hash_in_header()
+        test_shipped_maps_are_current()
+        print("ALL MAP TESTS PASSED")
+        return 0
+    except AssertionError as e:
+        print(f"!!! TEST FAILED !!! {e}")
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
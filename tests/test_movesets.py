@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Test script for learned movesets and the compiled move table
+"""
+
+import sys
+
+from core.moves import get_move_database
+from core.pokemon import Pokemon
+from core.species import create_pokemon_dict, get_species
+
+
+def test_species_default_moveset():
+    """Pokemon without saved moves learn their species' moveset"""
+    print("=== Testing Default Movesets ===")
+    db = get_move_database()
+    charmander = Pokemon('Charmander')
+    assert charmander.moves == [db.get_move_id('Scratch'), db.get_move_id('Ember')]
+    assert [move.name for move in charmander.get_moves()] == list(get_species('Charmander').moves)
+    assert [move.name for move in Pokemon('MissingNo').get_moves()] == ['Tackle']
+
+
+def test_saved_moveset():
+    """Saved move names are restored, deduplicated, unknown names skipped, capped at four"""
+    print("=== Testing Saved Movesets ===")
+    pokemon = Pokemon('Zubat', moves=['bite', 'Bite', 'Splash', 'Tackle', 'Ember', 'Water Gun', 'Body Slam'])
+    assert [move.name for move in pokemon.get_moves()] == ['Bite', 'Tackle', 'Ember', 'Water Gun']
+    assert not pokemon.learn_move('Flamethrower')
+    assert pokemon.moveset_entries()[0] == {'name': 'Bite', 'pp': 25, 'max_pp': 25, 'power': 60, 'type': 'Dark'}
+
+
+def test_unknown_saved_moves_fall_back():
+    """A saved moveset with no known moves falls back to the species moveset"""
+    print("=== Testing Moveset Fallback ===")
+    pokemon = Pokemon('Charmander', moves=['Flamethrower2'])
+    assert pokemon.moves == Pokemon('Charmander').moves and pokemon.moves
+
+
+def test_move_ids_and_table():
+    """Moves resolve by id, and the table holds one column entry per id"""
+    print("=== Testing Move Table ===")
+    db = get_move_database()
+    ember = db.get_move_id('Ember')
+    assert db.get_move_id('ember') == ember and db.get_move_id('Splash') is None
+    assert db.get_move('Ember') is db.moves_by_id[ember]
+    table = db.table
+    assert db.table is table and len(table) == len(db.moves_by_id)
+    assert (table.power[ember], table.accuracy[ember], table.pp[ember]) == (40, 0.95, 25)
+    power, accuracy = table.columns([ember, ember, db.get_move_id('Body Slam')])
+    assert list(power) == [40, 40, 85] and list(accuracy) == [0.95, 0.95, 0.85]
+
+
+def test_party_dict_moveset():
+    """Party dicts carry the species moveset in the save format"""
+    print("=== Testing Party Dict Movesets ===")
+    starter = create_pokemon_dict('Charmander', 5)
+    assert [(move['name'], move['pp'], move['type']) for move in starter['moves']] == \
+        [('Scratch', 35, 'Normal'), ('Ember', 25, 'Fire')]
+    restored = Pokemon('Charmander', moves=[move['name'] for move in starter['moves']])
+    assert restored.moves == Pokemon('Charmander').moves
+
+
+def main():
+    """Run all tests"""
+    try:
+        test_species_default_moveset()
+        test_saved_moveset()
+        test_unknown_saved_moves_fall_back()
+        test_move_ids_and_table()
+        test_party_dict_moveset()
+        print("ALL MOVESET TESTS PASSED")
+        return 0
+    except AssertionError as e:
+        print(f"!!! TEST FAILED !!! {e}")
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
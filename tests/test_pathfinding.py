@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Test script for A* paths and flow fields over the tile grid
+"""
+
+import sys
+
+from core.pathfinding import Pathfinder
+from core.tile_grid import TILE_SOLID, TileGrid
+
+# 10x7 room with a wall down the middle and one gap at the bottom
+WALL = [(5, y) for y in range(0, 6)]
+
+
+def _grid():
+    grid = TileGrid(10, 7)
+    grid.set_flags(WALL, TILE_SOLID)
+    return grid
+
+
+def test_astar_routes_around_walls():
+    """Paths are shortest, walkable and cached"""
+    print("=== Testing A* Paths ===")
+    pathfinder = Pathfinder(_grid())
+
+    path = pathfinder.find_path((2, 1), (8, 1))
+    assert path[0] == (2, 1) and path[-1] == (8, 1)
+    assert (5, 6) in path  # Through the gap
+    assert len(path) - 1 == 16  # 6 across plus 5 down and 5 back up
+    assert all(pathfinder.is_walkable(tile) for tile in path)
+    for (ax, ay), (bx, by) in zip(path, path[1:]):
+        assert abs(ax - bx) + abs(ay - by) == 1
+
+    pathfinder.find_path((2, 1), (8, 1))
+    assert (pathfinder.cache_hits, pathfinder.cache_misses) == (1, 1)
+    assert pathfinder.find_path((2, 1), (5, 3)) is None  # Goal inside the wall
+
+
+def test_flow_field_matches_astar():
+    """Following the shared flow field gives A*-length routes from anywhere"""
+    print("=== Testing Flow Fields ===")
+    pathfinder = Pathfinder(_grid())
+    goal = (8, 1)
+    field = pathfinder.flow_field(goal)
+    assert pathfinder.flow_field(goal) is field
+
+    for start in [(0, 0), (2, 5), (4, 6), (9, 6)]:
+        tile, steps = start, 0
+        while tile != goal:
+            tile = field.next_step(tile)
+            steps += 1
+        assert steps == field.distance_at(start) == len(pathfinder.find_path(start, goal)) - 1
+
+
+def test_grid_change_invalidates():
+    """Closing the gap drops cached paths and fields"""
+    print("=== Testing Cache Invalidation ===")
+    grid = _grid()
+    pathfinder = Pathfinder(grid)
+    field = pathfinder.flow_field((8, 1))
+    assert pathfinder.find_path((2, 1), (8, 1)) is not None
+
+    grid.set_flags([(5, 6)], TILE_SOLID)
+    assert pathfinder.find_path((2, 1), (8, 1)) is None
+    assert pathfinder.flow_field((8, 1)) is not field
+    assert pathfinder.flow_field((8, 1)).distance_at((2, 1)) is None
+
+    grid.clear_flags([(5, 6)], TILE_SOLID)
+    assert pathfinder.find_path((2, 1), (8, 1)) is not None
+
+
+def main():
+    """Run all tests"""
+    try:
+        test_astar_routes_around_walls()
+        test_flow_field_matches_astar()
+        test_grid_change_invalidates()
+        print("ALL PATHFINDING TESTS PASSED")
+        return 0
+    except AssertionError as e:
+        print(f"!!! TEST FAILED !!! {e}")
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
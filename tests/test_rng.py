@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Test script for the named RNG streams
+"""
+
+import json
+import sys
+import tempfile
+
+from core.battle_engine import BattleEngine
+from core.encounters import get_encounter_table
+from core.moves import get_move_database
+from core.pokemon import Pokemon
+from core.rng import (
+    STREAM_BATTLE, STREAM_COSMETIC, STREAM_ENCOUNTER, STREAM_INJURY, RNGService, get_rng, set_rng
+)
+from core.save_manager import SaveManager
+
+
+def _draws(rng, count=5):
+    return [rng.random() for _ in range(count)]
+
+
+def test_streams_are_seeded_and_independent():
+    """Same seed, same streams; drawing from one never shifts another"""
+    print("=== Testing Stream Independence ===")
+    first, second = RNGService(42), RNGService(42)
+    _draws(first.stream(STREAM_COSMETIC), 100)
+    assert _draws(first.stream(STREAM_BATTLE)) == _draws(second.stream(STREAM_BATTLE))
+    assert _draws(first.stream(STREAM_BATTLE)) != _draws(first.stream(STREAM_ENCOUNTER))
+    assert _draws(RNGService(43).stream(STREAM_BATTLE)) != _draws(RNGService(42).stream(STREAM_BATTLE))
+
+
+def test_state_round_trip():
+    """Exported state (through JSON) resumes every stream exactly, in place"""
+    print("=== Testing Stream State ===")
+    service = RNGService(7)
+    battle = service.stream(STREAM_BATTLE)
+    _draws(battle, 10)
+    _draws(service.stream(STREAM_INJURY), 3)
+    state = json.loads(json.dumps(service.get_state()))
+    expected = _draws(battle)
+    injury_expected = _draws(service.stream(STREAM_INJURY))
+
+    service.set_state(state)
+    assert _draws(battle) == expected  # Existing references keep working
+    assert _draws(service.stream(STREAM_INJURY)) == injury_expected
+
+
+def test_workers_get_distinct_streams():
+    """Spawned children are reproducible and differ per index"""
+    print("=== Testing Worker Streams ===")
+    master = RNGService(1)
+    assert master.spawn(3).seed == RNGService(1).spawn(3).seed
+    seeds = {master.spawn(index).stream(STREAM_BATTLE).random() for index in range(50)}
+    assert len(seeds) == 50
+
+
+def test_seeded_session_replays():
+    """A seeded service reproduces encounters and whole battles, injuries included"""
+    print("=== Testing Seeded Replay ===")
+    move_db = get_move_database()
+    moves = [move_db.get_move(name) for name in ("Body Slam", "Flamethrower", "Bite", "Tackle")]
+
+    def session():
+        previous = set_rng(RNGService(2024))
+        try:
+            encounters = [get_encounter_table('cave').roll() for _ in range(20)]
+            engine = BattleEngine(Pokemon("Charmander"), Pokemon("Haunter"), moves, moves)
+            engine.player_pokemon.has_vos = True
+            engine.run(max_turns=200)
+            log = engine.log.to_bytes()
+            return encounters, log, len(engine.player_pokemon.permanent_injuries)
+        finally:
+            set_rng(previous)
+
+    assert session() == session()
+
+
+def test_save_restores_streams():
+    """Saving records the stream state; loading continues the same sequences"""
+    print("=== Testing RNG State in Saves ===")
+    with tempfile.TemporaryDirectory() as save_dir:
+        class TempSaveManager(SaveManager):
+            SAVE_DIR = save_dir
+
+        manager = TempSaveManager()
+        previous = set_rng(RNGService(11))
+        try:
+            _draws(get_rng().stream(STREAM_ENCOUNTER), 7)
+            assert manager.save_game({'player': {'name': 'Ash'}})
+            expected = _draws(get_rng().stream(STREAM_ENCOUNTER))
+
+            set_rng(RNGService(99))
+            save_data = manager.load_game()
+            assert save_data['rng']['seed'] == 11 and get_rng().seed == 11
+            assert _draws(get_rng().stream(STREAM_ENCOUNTER)) == expected
+        finally:
+            set_rng(previous)
+
+
+def main():
+    """Run all tests"""
+    try:
+        test_streams_are_seeded_and_independent()
+        test_state_round_trip()
+        test_workers_get_distinct_streams()
+        test_seeded_session_replays()
+        test_save_restores_streams()
+        print("ALL RNG TESTS PASSED")
+        return 0
+    except AssertionError as e:
+        print(f"!!! TEST FAILED !!! {e}")
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Test script for the species registry
+"""
+
+import sys
+
+from core.moves import type_id
+from core.pokemon import Pokemon
+from core.species import (
+    UNKNOWN_SPECIES, Species, SpeciesError, create_pokemon_dict, get_species, get_species_registry,
+    parse_species
+)
+
+
+def test_registry_ids_and_names():
+    """Species resolve by name and by integer id to the same record"""
+    print("=== Testing Species Registry ===")
+    registry = get_species_registry()
+    assert get_species_registry() is registry
+    zubat = registry.get('Zubat')
+    assert registry[zubat.id] is zubat and registry.ids['Zubat'] == zubat.id
+    assert zubat.type_ids == (type_id('Poison'), type_id('Flying'))
+    assert not hasattr(zubat, '__dict__')  # Slotted record
+    assert registry.get('MissingNo') is None
+    assert get_species('MissingNo') is UNKNOWN_SPECIES
+
+
+def test_pokemon_share_species_record():
+    """Pokemon reference the shared record instead of copying stats"""
+    print("=== Testing Shared Species Records ===")
+    first, second = Pokemon('Gastly'), Pokemon('Gastly', 'Shade')
+    assert first.species_data is second.species_data
+    assert (first.base_attack, first.base_defense, first.base_speed) == (10, 5, 15)
+
+
+def test_party_dict_from_species():
+    """Party dicts scale species stats by level"""
+    print("=== Testing Species Party Dicts ===")
+    starter = create_pokemon_dict('Charmander', 5)
+    assert (starter['hp'], starter['max_hp'], starter['attack'], starter['defense'], starter['speed']) == \
+        (25, 25, 12, 10, 15)
+    assert starter['type'] == ['Fire']
+    assert [(move['name'], move['pp']) for move in starter['moves']] == [('Scratch', 35), ('Ember', 25)]
+
+
+def test_malformed_species_rejected():
+    """Bad species data raises SpeciesError"""
+    print("=== Testing Malformed Species ===")
+    for data in ({}, {'species': [{'name': 'Blob'}]},
+                 {'species': [{'name': 'Blob', 'types': [], 'base': {'hp': 1, 'attack': 1, 'defense': 1, 'speed': 1}}]}):
+        try:
+            parse_species(data)
+            assert False, f"Accepted {data}"
+        except SpeciesError:
+            pass
+    assert Species(0, 'Blob', ['Fairy'], 1, 2, 3, 4).type_ids == (type_id('fairy'),)
+
+
+def main():
+    """Run all tests"""
+    try:
+        test_registry_ids_and_names()
+        test_pokemon_share_species_record()
+        test_party_dict_from_species()
+        test_malformed_species_rejected()
+        print("ALL SPECIES TESTS PASSED")
+        return 0
+    except AssertionError as e:
+        print(f"!!! TEST FAILED !!! {e}")
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
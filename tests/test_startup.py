@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Test script for startup work: nothing touches the disk before the first frame
+Runs headless with the SDL dummy video driver
+"""
+
+import logging
+import os
+import sys
+import tempfile
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+from core.logger import DeferredFileHandler
+
+
+def _record(message):
+    return logging.LogRecord('PokemonFaiths', logging.INFO, __file__, 0, message, None, None)
+
+
+def test_log_file_deferred_until_startup_ends():
+    """A held file handler buffers records and writes them once opened"""
+    print("=== Testing Deferred Log File ===")
+    with tempfile.TemporaryDirectory() as tmp:
+        log_file = os.path.join(tmp, 'logs', 'game.log')
+        handler = DeferredFileHandler(log_file, hold=True)
+        handler.setFormatter(logging.Formatter('%(message)s'))
+        handler.handle(_record('during startup'))
+        assert not os.path.exists(log_file)
+
+        handler.open()
+        handler.handle(_record('after startup'))
+        handler.close()
+        with open(log_file) as f:
+            assert f.read().splitlines() == ['during startup', 'after startup']
+
+
+def test_log_file_created_on_first_record():
+    """Without startup mode the file still only appears once something is logged"""
+    print("=== Testing Lazy Log File ===")
+    with tempfile.TemporaryDirectory() as tmp:
+        log_file = os.path.join(tmp, 'game.log')
+        handler = DeferredFileHandler(log_file)
+        assert not os.path.exists(log_file)
+        handler.handle(_record('first'))
+        handler.close()
+        assert os.path.exists(log_file)
+
+
+def test_save_check_does_not_create_save_manager():
+    """The start screen checks for a save without building the save manager"""
+    print("=== Testing Save Check ===")
+    import core.save_manager as save_manager
+    save_manager._save_manager = None
+    import game.states.start_screen  # noqa: F401  (must not create it at import)
+
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        try:
+            assert not save_manager.save_file_exists()
+            assert not os.path.exists(save_manager.SaveManager.SAVE_DIR)
+        finally:
+            os.chdir(cwd)
+    assert save_manager._save_manager is None
+
+
+def test_noise_table_matches_opensimplex():
+    """Precomputed noise lookups stay close to the runtime generator"""
+    print("=== Testing Noise Table ===")
+    from core.noise_tables import noise1
+    try:
+        import opensimplex
+    except ImportError:
+        print("opensimplex not installed, skipping comparison")
+        return
+
+    for x in (0.0, 0.37, 12.5, 640.123, 1000.0):
+        assert abs(noise1(x) - opensimplex.noise2(x, 0)) < 0.01
+
+
+def main():
+    """Run all tests"""
+    try:
+        test_log_file_deferred_until_startup_ends()
+        test_log_file_created_on_first_record()
+        test_save_check_does_not_create_save_manager()
+        test_noise_table_matches_opensimplex()
+        print("ALL STARTUP TESTS PASSED")
+        return 0
+    except AssertionError as e:
+        print(f"!!! TEST FAILED !!! {e}")
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
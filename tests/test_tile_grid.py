@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Test script for the compiled tile-property grid
+"""
+
+import sys
+
+import pygame
+from constants import TILE_SIZE
+from core.tile_grid import (
+    TILE_ENCOUNTER, TILE_GRASS, TILE_ROAD, TILE_SOLID, TileGrid, compile_tile_grid
+)
+
+
+def test_compile_layers():
+    """Layers, solid rects and triggers land on the right tiles"""
+    print("=== Testing Tile Grid Compilation ===")
+    grass = [(5, 3), (6, 3), (5, 4)]
+    walls = [pygame.Rect(0, 0, 20 * TILE_SIZE, 8)]
+    grid = compile_tile_grid(20, 10, {TILE_GRASS | TILE_ENCOUNTER: grass, TILE_ROAD: [(1, 1)]},
+                             walls, triggers={3: [(9, 8), (10, 8)]})
+
+    assert grid.has(5, 3, TILE_GRASS) and grid.has(5, 3, TILE_ENCOUNTER)
+    assert not grid.has(7, 3, TILE_GRASS)
+    assert grid.flags_at(1, 1) == TILE_ROAD
+    assert grid.count(TILE_ENCOUNTER) == 3
+    assert grid.count(TILE_SOLID) == 20  # Top border row only
+    assert grid.trigger_at(10, 8) == 3 and grid.trigger_at(11, 8) == 0
+
+
+def test_pixel_lookup_and_bounds():
+    """Pixel positions map to tiles and out-of-range reads are empty"""
+    print("=== Testing Pixel Lookups ===")
+    grid = TileGrid(4, 4)
+    grid.set_flags([(2, 1)], TILE_GRASS)
+
+    assert grid.tile_at(2 * TILE_SIZE + 3, TILE_SIZE + 30) == (2, 1)
+    assert grid.flags_at_pixel(2 * TILE_SIZE + 3, TILE_SIZE + 30) == TILE_GRASS
+    assert grid.flags_at(-1, 0) == 0 and grid.flags_at(4, 0) == 0
+    grid.set_flags([(9, 9)], TILE_ROAD)  # Ignored, off the map
+    assert grid.count(TILE_ROAD) == 0
+
+
+def main():
+    """Run all tests"""
+    try:
+        test_compile_layers()
+        test_pixel_lookup_and_bounds()
+        print("ALL TILE GRID TESTS PASSED")
+        return 0
+    except AssertionError as e:
+        print(f"!!! TEST FAILED !!! {e}")
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
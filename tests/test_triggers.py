@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Test script for trigger volumes and their enter/exit/stay events
+"""
+
+import sys
+
+import pygame
+from core.triggers import TriggerRegistry, save_spawn
+
+
+def test_enter_exit_fire_on_change():
+    """Callbacks fire once per occupancy change, stay fires while inside"""
+    print("=== Testing Trigger Events ===")
+    events = []
+    registry = TriggerRegistry()
+    registry.add('door', pygame.Rect(100, 100, 20, 12),
+                 on_enter=lambda t: events.append(('enter', t.name)),
+                 on_exit=lambda t: events.append(('exit', t.name)),
+                 on_stay=lambda t: events.append(('stay', t.name)))
+    registry.add('far_warp', pygame.Rect(5000, 5000, 20, 20),
+                 on_enter=lambda t: events.append(('enter', t.name)))
+
+    player = pygame.Rect(50, 100, 12, 8)
+    registry.update(player)
+    assert events == []
+
+    player.x = 95
+    registry.update(player)
+    registry.update(player)  # Standing still: no second enter
+    assert events == [('enter', 'door'), ('stay', 'door'), ('stay', 'door')]
+
+    events.clear()
+    player.x = 200
+    registry.update(player)
+    assert events == [('exit', 'door')]
+    assert not registry.occupied
+
+
+def test_remove_during_callback():
+    """A callback can remove triggers without breaking the update"""
+    print("=== Testing Trigger Removal ===")
+    registry = TriggerRegistry()
+    fired = []
+
+    def consume(trigger):
+        fired.append(trigger.name)
+        registry.remove('a')
+        registry.remove('b')
+
+    registry.add('a', pygame.Rect(0, 0, 10, 10), on_enter=consume)
+    registry.add('b', pygame.Rect(0, 0, 10, 10), on_enter=consume)
+    registry.update(pygame.Rect(2, 2, 4, 4))
+    assert len(fired) == 1 and len(registry) == 0
+
+
+def test_save_spawn():
+    """Warp helper records the spawn and skips saving without save data"""
+    print("=== Testing Warp Spawn Saving ===")
+
+    class FakeSaveManager:
+        def __init__(self):
+            self.saved = []
+
+        def save_game(self, data):
+            self.saved.append(data)
+            return True
+
+    manager = FakeSaveManager()
+    save_data = {'progress': {}}
+    assert save_spawn(manager, save_data, 'cave_position', 340, 238)
+    assert save_data['progress']['cave_position'] == {'x': 340, 'y': 238}
+    assert not save_spawn(manager, None, 'cave_position', 0, 0)
+    assert len(manager.saved) == 1
+
+
+def main():
+    """Run all tests"""
+    try:
+        test_enter_exit_fire_on_change()
+        test_remove_during_callback()
+        test_save_spawn()
+        print("ALL TRIGGER TESTS PASSED")
+        return 0
+    except AssertionError as e:
+        print(f"!!! TEST FAILED !!! {e}")
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
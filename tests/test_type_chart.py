@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Test script for the dense type chart
+"""
+
+import sys
+
+from core.encounters import get_encounter_table
+from core.moves import TYPE_NAMES, TYPE_NONE, TypeChart, get_move_database, type_id
+from core.species import get_species_registry
+
+
+def test_single_type_matchups():
+    """Matrix cells match the classic chart for single-typed species"""
+    print("=== Testing Single Type Matchups ===")
+    chart = TypeChart()
+    assert chart.get_effectiveness('water', 'Charmander') == 2.0
+    assert chart.get_effectiveness('fire', 'Squirtle') == 0.5
+    assert chart.get_effectiveness('dark', 'Misdreavus') == 2.0
+    assert chart.get_effectiveness('normal', 'Misdreavus') == 0.0
+    assert chart.get_effectiveness('normal', 'Rattata') == 1.0
+    # Unknown species are treated as Normal
+    assert chart.get_effectiveness('fighting', 'MissingNo') == 2.0
+
+
+def test_dual_types_multiply():
+    """Both of a dual-typed species' types apply"""
+    print("=== Testing Dual Types ===")
+    chart = TypeChart()
+    assert chart.get_species_types('Zubat') == (type_id('Poison'), type_id('Flying'))
+    assert chart.get_species_types('Misdreavus')[1] == TYPE_NONE
+    assert chart.get_effectiveness('ground', 'Zubat') == 0.0        # Flying immunity
+    assert chart.get_effectiveness('fire', 'Oddish') == 2.0        # Grass 2x, Poison 1x
+    assert chart.get_effectiveness('grass', 'Bulbasaur') == 0.25   # Grass 0.5x, Poison 0.5x
+    assert chart.get_effectiveness('ice', 'Zubat') == 2.0
+
+    chart.register_species('Geodude', ['Rock', 'Ground'])
+    assert chart.get_effectiveness('water', 'Geodude') == 4.0
+
+
+def test_moves_use_interned_ids():
+    """Moves carry their type id; ids round-trip to names"""
+    print("=== Testing Interned Type IDs ===")
+    ember = get_move_database().get_move('Ember')
+    assert TYPE_NAMES[ember.type_id] == 'fire'
+    try:
+        type_id('sound')
+        assert False, "Unknown type accepted"
+    except ValueError:
+        pass
+
+
+def test_every_species_can_damage_the_cave():
+    """Normal moves can't touch Ghosts: every species needs a move that damages each cave species"""
+    print("=== Testing Cave Coverage ===")
+    chart = TypeChart()
+    db = get_move_database()
+    for species in get_species_registry():
+        moves = [db.get_move(name) for name in species.moves]
+        assert None not in moves, f"{species.name} has an unknown move"
+        for target in get_encounter_table('cave').species:
+            assert any(move.category != 'status' and move.base_power > 0
+                       and chart.get_effectiveness(move.move_type, target) > 0 for move in moves), \
+                f"{species.name} cannot damage {target}"
+
+
+def main():
+    """Run all tests"""
+    try:
+        test_single_type_matchups()
+        test_dual_types_multiply()
+        test_moves_use_interned_ids()
+        test_every_species_can_damage_the_cave()
+        print("ALL TYPE CHART TESTS PASSED")
+        return 0
+    except AssertionError as e:
+        print(f"!!! TEST FAILED !!! {e}")
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
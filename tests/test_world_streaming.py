@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Test script for region splitting and background region streaming
+"""
+
+import json
+import os
+import sys
+
+from constants import TILE_SIZE
+from core.asset_manager import get_asset_manager
+from core.maps import MAP_DIR, compile_map, compile_map_source, load_map, parse_map, source_hash
+from core.tile_grid import TILE_ROAD
+from core.world_streaming import WORLD_DIR, RegionStreamer, load_region, region_path, split_map
+
+SOURCE = {
+    'name': 'test',
+    'width': 10,
+    'height': 6,
+    'border': 4,
+    'tiles': [{'flags': ['road'], 'regions': [[0, 2, 10, 1]]}],
+    'objects': [{'name': 'hut', 'sprite': 'house', 'rect': [130, 10, 60, 40], 'collision': [0, 0, 60, 40]}],
+    'triggers': [{'name': 'door', 'rect': [150, 40, 20, 10]}]
+}
+
+
+def test_split_map():
+    """Regions carry their slice of tiles and world-space rects"""
+    print("=== Testing Region Split ===")
+    regions = {coord: parse_map('r', data) for coord, data in split_map(parse_map('test', compile_map(SOURCE)), 4).items()}
+    assert sorted(regions) == [(0, 0), (0, 1), (1, 0), (1, 1), (2, 0), (2, 1)]
+    assert (regions[(2, 1)].width, regions[(2, 1)].height) == (2, 2)
+
+    assert all(regions[(rx, 0)].tile_grid.has(x, 2, TILE_ROAD) for rx in range(2) for x in range(4))
+    assert not regions[(0, 1)].tile_grid.has(0, 0, TILE_ROAD)
+
+    # The hut straddles regions 0 and 1 horizontally: its collision is clipped into both
+    hut_region = regions[(1, 0)]
+    assert 'hut' in hut_region.objects and 'door' in hut_region.triggers
+    assert tuple(hut_region.triggers['door']) == (150, 40, 20, 10)
+    assert hut_region.tile_grid.trigger_at(150 // TILE_SIZE - 4, 40 // TILE_SIZE) == 1
+    assert (130, 10, 6, 40) in [tuple(r) for r in regions[(0, 0)].collision_rects]
+    assert (136, 10, 54, 40) in [tuple(r) for r in hut_region.collision_rects]
+
+
+def test_streamer_loads_and_evicts():
+    """Nearby regions load in the background; far ones are evicted over budget"""
+    print("=== Testing Region Streamer ===")
+    loaded, unloaded = [], []
+    streamer = RegionStreamer('outside', load_radius=0, memory_budget=1,
+                              on_load=lambda coord, region: loaded.append(coord),
+                              on_unload=lambda coord, region: unloaded.append(coord))
+    try:
+        region_px = streamer.region_size * TILE_SIZE
+        streamer.update((10, 10), block=True)
+        assert list(streamer.regions) == [(0, 0)] and loaded == [(0, 0)]
+
+        streamer.update((region_px + 10, 10), block=True)
+        assert list(streamer.regions) == [(1, 0)] and unloaded == [(0, 0)]
+
+        streamer.memory_budget = 1 << 20
+        streamer.load_radius = 5
+        streamer.update((10, 10), block=True)
+        while len(streamer.regions) < streamer.regions_x * streamer.regions_y:
+            streamer.update((10, 10), block=True)
+
+        # Streamed tiles match the whole map
+        full = load_map('outside').tile_grid
+        for y in range(full.height):
+            for x in range(full.width):
+                assert streamer.flags_at(x, y) == full.flags_at(x, y)
+    finally:
+        streamer.close()
+    assert not streamer.regions
+    assert load_region('outside', (99, 99)) is None
+
+
+def test_streamer_survives_loader_errors():
+    """A loader crash is reported as a failed load, so blocking updates return"""
+    print("=== Testing Region Loader Errors ===")
+
+    def broken_loader(world, coord):
+        raise ValueError("corrupt region")
+
+    streamer = RegionStreamer('outside', load_radius=0, loader=broken_loader)
+    try:
+        streamer.update((10, 10), block=True)
+        assert not streamer.regions and not streamer._pending
+        assert streamer._thread.is_alive()
+    finally:
+        streamer.close()
+
+
+def test_shipped_world_is_current():
+    """The committed outside regions match a fresh split of outside.json"""
+    print("=== Testing Shipped World ===")
+    base_path = get_asset_manager().base_path
+    with open(os.path.join(base_path, MAP_DIR, 'outside.json'), 'rb') as f:
+        source = f.read()
+    with open(os.path.join(base_path, WORLD_DIR, 'outside', 'world.json'), encoding='utf-8') as f:
+        manifest = json.load(f)
+    assert manifest['source_hash'] == source_hash(source).hex(), \
+        "outside world is stale, run python -m core.world_streaming outside"
+
+    for coord, data in split_map(parse_map('outside', compile_map_source(source)), manifest['region_size']).items():
+        with open(os.path.join(base_path, region_path('outside', coord)), 'rb') as f:
+            assert f.read() == data, f"region {coord} is stale"
+
+
+def test_stale_world_split_in_memory():
+    """When the source map changed, regions come from an in-memory split instead of disk"""
+    print("=== Testing Stale World Fallback ===")
+    asset_manager = get_asset_manager()
+    load_bytes = asset_manager.load_bytes
+
+    def edited(path):
+        data = load_bytes(path)
+        return data + b' ' if path.endswith('outside.json') else data
+
+    asset_manager.load_bytes = edited
+    try:
+        streamer = RegionStreamer('outside', load_radius=5)
+    finally:
+        del asset_manager.load_bytes  # Back to the class method
+    try:
+        assert streamer.loader is not load_region
+        streamer.update((10, 10), block=True)
+        assert len(streamer.regions) == streamer.regions_x * streamer.regions_y
+        assert streamer.regions[(0, 0)].source_hash == source_hash(edited(f'{MAP_DIR}/outside.json'))
+    finally:
+        streamer.close()
+
+
+def main():
+    """Run all tests"""
+    try:
+        test_split_map()
+        test_streamer_loads_and_evicts()
+        test_streamer_survives_loader_errors()
+        test_shipped_world_is_current()
+        test_stale_world_split_in_memory()
+        print("ALL WORLD STREAMING TESTS PASSED")
+        return 0
+    except AssertionError as e:
+        print(f"!!! TEST FAILED !!! {e}")
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())